@@ -2,23 +2,29 @@
 API endpoints for earthquake comparison with asteroid impacts
 """
 
+from functools import lru_cache
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
-from typing import List, Dict, Optional
+from fastapi.responses import ORJSONResponse
+from typing import List, Dict, Optional, Sequence
+from typing_extensions import TypedDict
 from app.services.usgs.earthquake_cache import get_earthquake_cache
 
 router = APIRouter()
 
 
-class EarthquakeComparison(BaseModel):
-    """Response model for earthquake comparisons"""
+class EarthquakeComparison(TypedDict):
+    """Response shape for earthquake comparisons (type hints and OpenAPI schema only)"""
     similar_earthquakes: List[Dict]
-    famous_earthquakes: List[Dict]
+    famous_earthquakes: Sequence[Dict]
     magnitude_range_stats: Dict
     interpretation: str
 
 
-@router.get("/compare-to-earthquakes", response_model=EarthquakeComparison)
+@router.get(
+    "/compare-to-earthquakes",
+    response_class=ORJSONResponse,
+    responses={200: {"model": EarthquakeComparison}}
+)
 async def compare_to_earthquakes(
     magnitude: float,
     tolerance: float = 0.5
@@ -51,12 +57,14 @@ async def compare_to_earthquakes(
         # Generate human-readable interpretation
         interpretation = _generate_interpretation(magnitude, similar, famous)
         
-        return EarthquakeComparison(
-            similar_earthquakes=similar,
-            famous_earthquakes=famous,
-            magnitude_range_stats=stats,
-            interpretation=interpretation
-        )
+        # Cache data is trusted, so skip model validation and serialize directly
+        content: EarthquakeComparison = {
+            "similar_earthquakes": similar,
+            "famous_earthquakes": famous,
+            "magnitude_range_stats": stats,
+            "interpretation": interpretation
+        }
+        return ORJSONResponse(content=content)
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -98,43 +106,47 @@ async def get_magnitude_range_stats(min_mag: float, max_mag: float):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@lru_cache(maxsize=200)
+def _base_comparison(bucket: int) -> str:
+    """Opening sentence of the interpretation for a magnitude bucket (magnitude * 10)"""
+    if bucket < 50:
+        return "This impact would be comparable to a minor earthquake, likely not felt by most people."
+    elif bucket < 60:
+        return "This impact would be comparable to a moderate earthquake, potentially causing local damage."
+    elif bucket < 70:
+        return "This impact would be comparable to a strong earthquake, causing significant regional damage."
+    elif bucket < 80:
+        return "This impact would be comparable to a major earthquake, causing widespread severe damage."
+    elif bucket < 90:
+        return "This impact would be comparable to a great earthquake, one of the most destructive events possible."
+    else:
+        return "This impact would exceed the strongest earthquakes ever recorded, causing catastrophic global effects."
+
+
 def _generate_interpretation(
     magnitude: float,
     similar: List[Dict],
-    famous: List[Dict]
+    famous: Sequence[Dict]
 ) -> str:
     """Generate human-readable interpretation of the comparison"""
     
-    if magnitude < 5.0:
-        comparison = "This impact would be comparable to a minor earthquake, likely not felt by most people."
-    elif magnitude < 6.0:
-        comparison = "This impact would be comparable to a moderate earthquake, potentially causing local damage."
-    elif magnitude < 7.0:
-        comparison = "This impact would be comparable to a strong earthquake, causing significant regional damage."
-    elif magnitude < 8.0:
-        comparison = "This impact would be comparable to a major earthquake, causing widespread severe damage."
-    elif magnitude < 9.0:
-        comparison = "This impact would be comparable to a great earthquake, one of the most destructive events possible."
-    else:
-        comparison = "This impact would exceed the strongest earthquakes ever recorded, causing catastrophic global effects."
+    parts = [_base_comparison(min(max(int(magnitude * 10), 0), 90))]
     
     # Add specific comparison if we found similar earthquakes
     if similar:
         top_eq = similar[0]
-        comparison += f"\n\nSimilar to the {top_eq['location']} earthquake ({top_eq['year']})"
+        parts.append(f"\n\nSimilar to the {top_eq['location']} earthquake ({top_eq['year']})")
         if top_eq.get('historical_context'):
-            comparison += f": {top_eq['historical_context']}"
+            parts.append(f": {top_eq['historical_context']}")
         
         if top_eq.get('tsunami'):
-            comparison += "\n⚠️ WARNING: This magnitude could trigger tsunamis in coastal impacts."
+            parts.append("\n⚠️ WARNING: This magnitude could trigger tsunamis in coastal impacts.")
     
     # Reference famous earthquakes for context
     if magnitude >= 8.0:
         relevant_famous = [eq for eq in famous if abs(eq['magnitude'] - magnitude) < 1.0]
         if relevant_famous:
-            comparison += f"\n\nThis is comparable in magnitude to devastating events like:"
-            for eq in relevant_famous[:3]:
-                comparison += f"\n  • {eq['context']}"
+            parts.append("\n\nThis is comparable in magnitude to devastating events like:")
+            parts.extend(f"\n  • {eq['context']}" for eq in relevant_famous[:3])
     
-    return comparison
-
+    return "".join(parts)
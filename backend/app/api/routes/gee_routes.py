@@ -4,25 +4,45 @@ FastAPI endpoints for GEE data access
 NASA Space Apps Challenge 2025 - Meteor Madness
 """
 
-from fastapi import APIRouter, HTTPException, Depends
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional
 import logging
 
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    import json
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
 from app.services.gee_service import GoogleEarthEngineService
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/gee", tags=["Google Earth Engine"])
 
-# Initialize GEE service
-gee_service = GoogleEarthEngineService()
+
+def get_gee_service(request: Request) -> GoogleEarthEngineService:
+    """Dependency returning the GEE service created in the app lifespan"""
+    return request.app.state.gee_service
 
 
 # Request/Response Models
 
+# Request bodies are parsed once and never mutated: freeze them and skip
+# whitespace stripping / extra-field storage (inherited by all subclasses)
+_REQUEST_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True, str_strip_whitespace=False)
+
+
 class LocationRequest(BaseModel):
     """Base location request model"""
+    model_config = _REQUEST_MODEL_CONFIG
+    
     latitude: float = Field(..., ge=-90, le=90, description="Latitude in degrees")
     longitude: float = Field(..., ge=-180, le=180, description="Longitude in degrees")
     radius_km: float = Field(5.0, gt=0, le=100, description="Radius in kilometers")
@@ -55,15 +75,109 @@ class WaterRequest(LocationRequest):
 
 class AffectedPopulationRequest(BaseModel):
     """Request model for affected population calculation"""
+    model_config = _REQUEST_MODEL_CONFIG
+    
     latitude: float = Field(..., ge=-90, le=90)
     longitude: float = Field(..., ge=-180, le=180)
     damage_radii_km: List[float] = Field(..., description="List of damage radii in km")
 
 
+# Static dataset catalogue, serialized once at import since it never changes
+_DATASETS = {
+    "elevation": [
+        {
+            "id": "USGS/SRTMGL1_003",
+            "name": "SRTM Digital Elevation Data 30m",
+            "resolution": "30m",
+            "description": "Global 30m digital elevation model"
+        },
+        {
+            "id": "ASTER/ASTGTM",
+            "name": "ASTER Global DEM",
+            "resolution": "30m",
+            "description": "Alternative global DEM"
+        },
+        {
+            "id": "USGS/GMTED2010",
+            "name": "Global Multi-resolution Terrain Elevation Data",
+            "resolution": "variable",
+            "description": "Global elevation data for QA"
+        }
+    ],
+    "land_cover": [
+        {
+            "id": "ESRI_Global_LULC_10m",
+            "name": "ESRI 10m Annual Land Cover",
+            "resolution": "10m",
+            "description": "Annual global land cover maps (2017-2024)"
+        },
+        {
+            "id": "MODIS/006/MCD12Q1",
+            "name": "MODIS Land Cover",
+            "resolution": "500m",
+            "description": "Global land cover classification"
+        },
+        {
+            "id": "GLC_FCS30D",
+            "name": "Global 30m Land Cover",
+            "resolution": "30m",
+            "description": "Annual land cover 1985-2022"
+        }
+    ],
+    "population": [
+        {
+            "id": "WorldPop/GP/100m/pop",
+            "name": "WorldPop",
+            "resolution": "100m",
+            "description": "Global gridded population data"
+        },
+        {
+            "id": "CIESIN/GPWv411/GPW_Population_Density",
+            "name": "NASA SEDAC GPW",
+            "resolution": "1km",
+            "description": "Gridded Population of the World"
+        }
+    ],
+    "water": [
+        {
+            "id": "JRC/GSW1_4/GlobalSurfaceWater",
+            "name": "JRC Global Surface Water",
+            "resolution": "30m",
+            "description": "Global surface water mapping"
+        },
+        {
+            "id": "GLOBAL_FLOOD_DB/MODIS",
+            "name": "Global Flood Database",
+            "resolution": "250m",
+            "description": "Flood extent data"
+        }
+    ],
+    "urban": [
+        {
+            "id": "JRC/GHSL/P2023A/GHS_BUILT",
+            "name": "Global Human Settlement Layer",
+            "resolution": "100m",
+            "description": "Urban footprint and population"
+        },
+        {
+            "id": "DLR/GUF_v1/GlobalUrbanFootprint",
+            "name": "Global Urban Footprint",
+            "resolution": "12m",
+            "description": "Urban settlement extent"
+        }
+    ]
+}
+
+_DATASETS_JSON = _json_dumps({"success": True, "datasets": _DATASETS})
+
+
 # Routes
 
 @router.post("/elevation")
-async def get_elevation_data(request: ElevationRequest):
+async def get_elevation_data(
+    request: ElevationRequest,
+    gee_service: GoogleEarthEngineService = Depends(get_gee_service)
+):
     """
     Get SRTM elevation data for a region
     
@@ -93,7 +207,10 @@ async def get_elevation_data(request: ElevationRequest):
 
 
 @router.post("/population")
-async def get_population_data(request: PopulationRequest):
+async def get_population_data(
+    request: PopulationRequest,
+    gee_service: GoogleEarthEngineService = Depends(get_gee_service)
+):
     """
     Get population density data from WorldPop
     
@@ -123,7 +240,10 @@ async def get_population_data(request: PopulationRequest):
 
 
 @router.post("/landcover")
-async def get_landcover_data(request: LandCoverRequest):
+async def get_landcover_data(
+    request: LandCoverRequest,
+    gee_service: GoogleEarthEngineService = Depends(get_gee_service)
+):
     """
     Get land cover data from ESRI 10m dataset
     
@@ -153,7 +273,10 @@ async def get_landcover_data(request: LandCoverRequest):
 
 
 @router.post("/urban")
-async def get_urban_data(request: UrbanRequest):
+async def get_urban_data(
+    request: UrbanRequest,
+    gee_service: GoogleEarthEngineService = Depends(get_gee_service)
+):
     """
     Get urban built-up areas from GHSL dataset
     
@@ -183,7 +306,10 @@ async def get_urban_data(request: UrbanRequest):
 
 
 @router.post("/water")
-async def get_water_data(request: WaterRequest):
+async def get_water_data(
+    request: WaterRequest,
+    gee_service: GoogleEarthEngineService = Depends(get_gee_service)
+):
     """
     Get surface water data from JRC Global Surface Water
     
@@ -213,7 +339,10 @@ async def get_water_data(request: WaterRequest):
 
 
 @router.post("/affected-population")
-async def calculate_affected_population(request: AffectedPopulationRequest):
+async def calculate_affected_population(
+    request: AffectedPopulationRequest,
+    gee_service: GoogleEarthEngineService = Depends(get_gee_service)
+):
     """
     Calculate affected population in multiple damage zones
     
@@ -248,99 +377,13 @@ async def list_available_datasets():
     
     Returns a list of supported datasets with descriptions.
     """
-    datasets = {
-        "elevation": [
-            {
-                "id": "USGS/SRTMGL1_003",
-                "name": "SRTM Digital Elevation Data 30m",
-                "resolution": "30m",
-                "description": "Global 30m digital elevation model"
-            },
-            {
-                "id": "ASTER/ASTGTM",
-                "name": "ASTER Global DEM",
-                "resolution": "30m",
-                "description": "Alternative global DEM"
-            },
-            {
-                "id": "USGS/GMTED2010",
-                "name": "Global Multi-resolution Terrain Elevation Data",
-                "resolution": "variable",
-                "description": "Global elevation data for QA"
-            }
-        ],
-        "land_cover": [
-            {
-                "id": "ESRI_Global_LULC_10m",
-                "name": "ESRI 10m Annual Land Cover",
-                "resolution": "10m",
-                "description": "Annual global land cover maps (2017-2024)"
-            },
-            {
-                "id": "MODIS/006/MCD12Q1",
-                "name": "MODIS Land Cover",
-                "resolution": "500m",
-                "description": "Global land cover classification"
-            },
-            {
-                "id": "GLC_FCS30D",
-                "name": "Global 30m Land Cover",
-                "resolution": "30m",
-                "description": "Annual land cover 1985-2022"
-            }
-        ],
-        "population": [
-            {
-                "id": "WorldPop/GP/100m/pop",
-                "name": "WorldPop",
-                "resolution": "100m",
-                "description": "Global gridded population data"
-            },
-            {
-                "id": "CIESIN/GPWv411/GPW_Population_Density",
-                "name": "NASA SEDAC GPW",
-                "resolution": "1km",
-                "description": "Gridded Population of the World"
-            }
-        ],
-        "water": [
-            {
-                "id": "JRC/GSW1_4/GlobalSurfaceWater",
-                "name": "JRC Global Surface Water",
-                "resolution": "30m",
-                "description": "Global surface water mapping"
-            },
-            {
-                "id": "GLOBAL_FLOOD_DB/MODIS",
-                "name": "Global Flood Database",
-                "resolution": "250m",
-                "description": "Flood extent data"
-            }
-        ],
-        "urban": [
-            {
-                "id": "JRC/GHSL/P2023A/GHS_BUILT",
-                "name": "Global Human Settlement Layer",
-                "resolution": "100m",
-                "description": "Urban footprint and population"
-            },
-            {
-                "id": "DLR/GUF_v1/GlobalUrbanFootprint",
-                "name": "Global Urban Footprint",
-                "resolution": "12m",
-                "description": "Urban settlement extent"
-            }
-        ]
-    }
-    
-    return {
-        "success": True,
-        "datasets": datasets
-    }
+    return Response(content=_DATASETS_JSON, media_type="application/json")
 
 
 @router.get("/health")
-async def gee_health_check():
+async def gee_health_check(
+    gee_service: GoogleEarthEngineService = Depends(get_gee_service)
+):
     """
     Check GEE service health and authentication status
     
@@ -3,17 +3,29 @@ NASA data API routes for asteroid information
 """
 
 from fastapi import APIRouter, HTTPException, Query
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+import asyncio
 import logging
+import time
+
+import aiohttp
+import orjson
 from datetime import datetime, timedelta
 
 from app.services.nasa.official_apis import OfficialNASAAPIService
+from app.services.nasa.http_session import get_nasa_session
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/nasa", tags=["nasa-data"])
 
+# NEO stats change rarely; keep the last payload for a few minutes
+NEO_STATS_TTL_SECONDS = 300
+NEO_STATS_TIMEOUT = aiohttp.ClientTimeout(total=10)
+_neo_stats_cache: Optional[Tuple[Dict, float]] = None  # (payload, expiry)
+_neo_stats_lock = asyncio.Lock()
+
 
 @router.get("/neo/recent")
 async def get_recent_neos(days: int = Query(default=3, ge=1, le=7)) -> Dict:
@@ -53,15 +65,27 @@ async def get_neo_stats() -> Dict:
     """
     Get overall NEO statistics from NASA
     """
+    global _neo_stats_cache
+    
     try:
-        # Use urllib directly for simple GET
-        import urllib.request as request
-        import json
-        
-        url = f"https://api.nasa.gov/neo/rest/v1/stats?api_key={settings.nasa_api_key}"
+        cached = _neo_stats_cache
+        if cached is None or cached[1] <= time.monotonic():
+            async with _neo_stats_lock:
+                # Re-check: another request may have refreshed while we waited
+                cached = _neo_stats_cache
+                if cached is None or cached[1] <= time.monotonic():
+                    session = await get_nasa_session()
+                    async with session.get(
+                        f"{settings.nasa_neo_api_url.rstrip('/')}/stats",
+                        params={"api_key": settings.nasa_api_key},
+                        timeout=NEO_STATS_TIMEOUT
+                    ) as response:
+                        response.raise_for_status()
+                        payload = await response.json(loads=orjson.loads)
+                    cached = (payload, time.monotonic() + NEO_STATS_TTL_SECONDS)
+                    _neo_stats_cache = cached
         
-        with request.urlopen(url, timeout=10) as response:
-            data = json.loads(response.read().decode())
+        data = cached[0]
         
         return {
             "status": "success",
@@ -4,11 +4,17 @@ Implements requirements from NASA Space Apps Challenge 2025
 """
 
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 import aiohttp
+import numpy as np
+import orjson
 import os
+import sys
 from typing import List, Dict, Optional
 import logging
 
+from app.services.nasa.http_session import get_nasa_session
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/nasa", tags=["nasa-real-data"])
@@ -28,6 +34,25 @@ ASTEROID_MAP = {
     "didymos": "65803"
 }
 
+# Interned, casefolded alias keys for name lookups
+_ASTEROID_ALIASES = {sys.intern(k.casefold()): v for k, v in ASTEROID_MAP.items()}
+
+# SBDB orbital element names and the output keys they map to, in cast order
+_SBDB_ELEMENT_KEYS = ("a", "e", "i", "om", "w", "ma", "per", "q", "ad")
+_ORBITAL_ELEMENT_FIELDS = (
+    "semi_major_axis_au",
+    "eccentricity",
+    "inclination_deg",
+    "longitude_ascending_node_deg",
+    "argument_periapsis_deg",
+    "mean_anomaly_deg",
+    "orbital_period_days",
+    "perihelion_distance_au",
+    "aphelion_distance_au"
+)
+
+AU_TO_KM = 149597870.7
+
 
 @router.get("/asteroid/{name}")
 async def get_real_asteroid_data(name: str) -> Dict:
@@ -41,26 +66,7 @@ async def get_real_asteroid_data(name: str) -> Dict:
         Complete orbital elements and physical parameters from NASA
     """
     try:
-        # Convert name to designation if needed
-        designation = ASTEROID_MAP.get(name.lower(), name)
-        
-        params = {
-            "sstr": designation,
-            "full-prec": "true",  # Full precision orbital elements
-            "phys-par": "true",   # Physical parameters
-            "cov": "mat"          # Request covariance matrix in full form
-        }
-        
-        async with aiohttp.ClientSession() as session:
-            async with session.get(NASA_SBDB_URL, params=params, timeout=10) as response:
-                if response.status != 200:
-                    logger.error(f"NASA SBDB API returned {response.status}")
-                    raise HTTPException(
-                        status_code=500, 
-                        detail=f"NASA SBDB API error: {response.status}"
-                    )
-                
-                data = await response.json()
+        data = await _sbdb_fetch(name, full=True)
         
         # Process and structure the data
         result = _process_sbdb_response(data)
@@ -76,7 +82,7 @@ async def get_real_asteroid_data(name: str) -> Dict:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/potentially-hazardous")
+@router.get("/potentially-hazardous", response_class=ORJSONResponse)
 async def get_potentially_hazardous_asteroids(
     limit: int = Query(default=50, ge=1, le=100)
 ) -> Dict:
@@ -95,72 +101,32 @@ async def get_potentially_hazardous_asteroids(
             "api_key": NASA_API_KEY
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{NASA_NEO_URL}/neo/browse",
-                params=params,
-                timeout=15
-            ) as response:
-                if response.status != 200:
-                    logger.error(f"NASA NEO API returned {response.status}")
-                    raise HTTPException(
-                        status_code=500,
-                        detail=f"NASA NEO API error: {response.status}"
-                    )
-                
-                data = await response.json()
+        session = await get_nasa_session()
+        async with session.get(
+            f"{NASA_NEO_URL}/neo/browse",
+            params=params,
+            timeout=15
+        ) as response:
+            if response.status != 200:
+                logger.error(f"NASA NEO API returned {response.status}")
+                raise HTTPException(
+                    status_code=500,
+                    detail=f"NASA NEO API error: {response.status}"
+                )
+            
+            data = orjson.loads(await response.read())
         
         # Process PHA data
-        phas = []
-        for neo in data.get("near_earth_objects", [])[:limit]:
-            pha_data = {
-                "id": neo.get("id"),
-                "name": neo.get("name", "Unknown"),
-                "nasa_jpl_url": neo.get("nasa_jpl_url"),
-                "absolute_magnitude_h": float(neo.get("absolute_magnitude_h", 0)),
-                "diameter_min_m": float(
-                    neo.get("estimated_diameter", {})
-                    .get("meters", {})
-                    .get("estimated_diameter_min", 0)
-                ),
-                "diameter_max_m": float(
-                    neo.get("estimated_diameter", {})
-                    .get("meters", {})
-                    .get("estimated_diameter_max", 0)
-                ),
-                "is_potentially_hazardous": True,
-                "close_approaches": [],
-                "data_source": "NASA_NEO_API_Official"
-            }
-            
-            # Extract close approach data
-            for approach in neo.get("close_approach_data", [])[:3]:  # Last 3 approaches
-                pha_data["close_approaches"].append({
-                    "date": approach.get("close_approach_date_full"),
-                    "velocity_km_s": float(
-                        approach.get("relative_velocity", {})
-                        .get("kilometers_per_second", 0)
-                    ),
-                    "miss_distance_km": float(
-                        approach.get("miss_distance", {})
-                        .get("kilometers", 0)
-                    ),
-                    "miss_distance_lunar": float(
-                        approach.get("miss_distance", {})
-                        .get("lunar", 0)
-                    )
-                })
-            
-            phas.append(pha_data)
+        phas = [_shape_pha(neo) for neo in data.get("near_earth_objects", [])[:limit]]
         
         logger.info(f"Retrieved {len(phas)} potentially hazardous asteroids")
         
-        return {
+        return ORJSONResponse(content={
             "count": len(phas),
             "phas": phas,
             "data_source": "NASA_NEO_API_Official",
             "api_credit": "NASA/JPL Near-Earth Object Program"
-        }
+        })
         
     except aiohttp.ClientError as e:
         logger.error(f"Network error fetching PHAs: {e}")
@@ -181,13 +147,58 @@ async def get_orbital_elements(name: str) -> Dict:
     Returns:
         Keplerian orbital elements for trajectory calculation
     """
-    full_data = await get_real_asteroid_data(name)
+    try:
+        # Only the orbit block is needed: skip physical parameters and the
+        # covariance matrix both on the wire and in processing
+        data = await _sbdb_fetch(name, full=False)
+        
+        return {
+            "name": data.get("object", {}).get("fullname", "Unknown"),
+            "orbital_elements": _extract_orbital_elements(data.get("orbit", {})),
+            "data_source": "NASA_SBDB_Official"
+        }
+        
+    except aiohttp.ClientError as e:
+        logger.error(f"Network error fetching orbital elements: {e}")
+        raise HTTPException(status_code=503, detail="NASA API unavailable")
+    except Exception as e:
+        logger.error(f"Error processing orbital elements: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+async def _sbdb_fetch(name: str, full: bool = True) -> Dict:
+    """
+    Fetch the raw SBDB record for an asteroid
     
-    return {
-        "name": full_data["name"],
-        "orbital_elements": full_data["orbital_elements"],
-        "data_source": "NASA_SBDB_Official"
+    Args:
+        name: Asteroid name or designation
+        full: Also request physical parameters and the covariance matrix
+    
+    Returns:
+        Decoded SBDB JSON response
+    """
+    # Convert name to designation if needed
+    key = name if name.islower() else name.casefold()
+    designation = _ASTEROID_ALIASES.get(key, name)
+    
+    params = {
+        "sstr": designation,
+        "full-prec": "true"   # Full precision orbital elements
     }
+    if full:
+        params["phys-par"] = "true"  # Physical parameters
+        params["cov"] = "mat"        # Request covariance matrix in full form
+    
+    session = await get_nasa_session()
+    async with session.get(NASA_SBDB_URL, params=params, timeout=10) as response:
+        if response.status != 200:
+            logger.error(f"NASA SBDB API returned {response.status}")
+            raise HTTPException(
+                status_code=500, 
+                detail=f"NASA SBDB API error: {response.status}"
+            )
+        
+        return orjson.loads(await response.read())
 
 
 def _process_sbdb_response(data: Dict) -> Dict:
@@ -205,20 +216,7 @@ def _process_sbdb_response(data: Dict) -> Dict:
     
     # Extract orbital elements
     orbit = data.get("orbit", {})
-    elements_raw = {elem["name"]: elem["value"] 
-                   for elem in orbit.get("elements", [])}
-    
-    orbital_elements = {
-        "semi_major_axis_au": float(elements_raw.get("a", 0)),
-        "eccentricity": float(elements_raw.get("e", 0)),
-        "inclination_deg": float(elements_raw.get("i", 0)),
-        "longitude_ascending_node_deg": float(elements_raw.get("om", 0)),
-        "argument_periapsis_deg": float(elements_raw.get("w", 0)),
-        "mean_anomaly_deg": float(elements_raw.get("ma", 0)),
-        "orbital_period_days": float(elements_raw.get("per", 0)),
-        "perihelion_distance_au": float(elements_raw.get("q", 0)),
-        "aphelion_distance_au": float(elements_raw.get("ad", 0))
-    }
+    orbital_elements = _extract_orbital_elements(orbit)
     
     # Extract physical parameters
     phys_params = {param["name"]: param.get("value", 0) 
@@ -232,14 +230,24 @@ def _process_sbdb_response(data: Dict) -> Dict:
     }
     
     # Extract close approach data
-    close_approaches = []
-    for ca in data.get("close_approach_data", [])[:5]:  # Last 5 approaches
-        close_approaches.append({
+    ca_data = data.get("close_approach_data", [])[:5]  # Last 5 approaches
+    distances_au = np.array([ca.get("dist", 0) for ca in ca_data], dtype=np.float64)
+    velocities = np.array([ca.get("v_rel", 0) for ca in ca_data], dtype=np.float64)
+    distances_km = distances_au * AU_TO_KM
+    close_approaches = [
+        {
             "date": ca.get("cd", ""),
-            "distance_au": float(ca.get("dist", 0)),
-            "distance_km": float(ca.get("dist", 0)) * 149597870.7,  # AU to km
-            "velocity_km_s": float(ca.get("v_rel", 0))
-        })
+            "distance_au": dist_au,
+            "distance_km": dist_km,
+            "velocity_km_s": v_rel
+        }
+        for ca, dist_au, dist_km, v_rel in zip(
+            ca_data,
+            distances_au.tolist(),
+            distances_km.tolist(),
+            velocities.tolist()
+        )
+    ]
     
     covariance = _extract_covariance(orbit)
 
@@ -258,6 +266,54 @@ def _process_sbdb_response(data: Dict) -> Dict:
     }
 
 
+def _extract_orbital_elements(orbit: Dict) -> Dict:
+    """Extract Keplerian elements from the SBDB orbit section"""
+    elements_raw = {elem["name"]: elem["value"] 
+                   for elem in orbit.get("elements", [])}
+    
+    # Cast all elements (SBDB sends them as strings) in one pass
+    element_values = np.fromiter(
+        (elements_raw.get(k, 0) for k in _SBDB_ELEMENT_KEYS),
+        dtype=np.float64,
+        count=len(_SBDB_ELEMENT_KEYS)
+    )
+    return dict(zip(_ORBITAL_ELEMENT_FIELDS, element_values.tolist()))
+
+
+def _shape_pha(neo: Dict) -> Dict:
+    """Flatten one NEO browse entry into the PHA response shape"""
+    meters = neo.get("estimated_diameter", {}).get("meters", {})
+    
+    return {
+        "id": neo.get("id"),
+        "name": neo.get("name", "Unknown"),
+        "nasa_jpl_url": neo.get("nasa_jpl_url"),
+        "absolute_magnitude_h": float(neo.get("absolute_magnitude_h", 0)),
+        "diameter_min_m": float(meters.get("estimated_diameter_min", 0)),
+        "diameter_max_m": float(meters.get("estimated_diameter_max", 0)),
+        "is_potentially_hazardous": True,
+        "close_approaches": [
+            _shape_close_approach(approach)
+            for approach in neo.get("close_approach_data", [])[:3]  # Last 3 approaches
+        ],
+        "data_source": "NASA_NEO_API_Official"
+    }
+
+
+def _shape_close_approach(approach: Dict) -> Dict:
+    """Extract date, velocity and miss distance from a NEO close approach"""
+    miss_distance = approach.get("miss_distance", {})
+    
+    return {
+        "date": approach.get("close_approach_date_full"),
+        "velocity_km_s": float(
+            approach.get("relative_velocity", {}).get("kilometers_per_second", 0)
+        ),
+        "miss_distance_km": float(miss_distance.get("kilometers", 0)),
+        "miss_distance_lunar": float(miss_distance.get("lunar", 0))
+    }
+
+
 def _extract_covariance(orbit: Dict) -> Optional[Dict]:
     """Extract covariance matrix information from SBDB orbit section."""
     cov = orbit.get("covariance")
@@ -2,14 +2,21 @@
 Simulation API routes for asteroid impact calculations
 """
 
-from fastapi import APIRouter, HTTPException
-from typing import Dict, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse
+from typing import Dict, List, Optional, Tuple
 # EDITING: Cascade at 05:33 UTC - Integrating orbital intercept in simulation API
+import asyncio
 import logging
+import multiprocessing
+import os
 import time
 import math
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 
+import numpy as np
+
 from app.models.asteroid import (
     SimulationRequest, 
     SimulationResponse, 
@@ -18,8 +25,23 @@ from app.models.asteroid import (
     MonteCarloImpactRequest
 )
 from app.physics.impact_physics import EnhancedPhysicsEngine
-from app.physics.orbital_mechanics import calculate_impact_scenario, OrbitalMechanics
+from app.physics.orbital_mechanics import (
+    calculate_impact_scenario,
+    calculate_atmospheric_only,
+    OrbitalMechanics,
+    ORBITAL_TRAJECTORY_COLUMNS
+)
 from app.physics.danger_assessment import DangerAssessment
+from app.physics.deflection_strategies import DeflectionStrategies
+from app.physics.tsunami_model import TsunamiModel
+from app.physics.gpu_accelerated import (
+    GPUAcceleratedSimulator,
+    get_gpu_simulator,
+    sbdb_covariance_factor,
+    MAX_SAMPLES
+)
+from app.services.nasa.neo_live_service import NASANEOLiveService
+from app.services.nasa.official_apis import OfficialNASAAPIService
 from app.services.usgs.earthquake_service import USGSEarthquakeService
 from app.core.config import settings
 
@@ -27,13 +49,209 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/simulation", tags=["simulation"])
 
-# Initialize physics engine and danger assessor (singletons)
+# Initialize physics engines and models (singletons)
 physics_engine = EnhancedPhysicsEngine()
 danger_assessor = DangerAssessment()
+deflection_strategies = DeflectionStrategies()
+tsunami_model = TsunamiModel()
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+# NASA's 7-day close-approach feed changes at most daily; serve repeat polls
+# from memory for an hour
+LIVE_THREATS_TTL_SECONDS = 3600
+_live_threats_cache: Optional[Tuple[str, Dict, float]] = None  # (start_date, payload, expiry)
+_live_threats_lock = asyncio.Lock()
+
+# SBDB orbit solutions (with covariance) only change when JPL publishes a new
+# fit; keep them for a day per asteroid
+SBDB_CACHE_TTL_SECONDS = 86400
+SBDB_CACHE_SIZE = 128
+_sbdb_cache: Dict[str, Tuple[Dict, float]] = {}  # asteroid_id -> (sbdb_data, expiry)
+
+# Cholesky factors of SBDB covariances, keyed by (asteroid_id, covariance_epoch_jd);
+# an orbit solution with the same epoch has the same covariance
+COVARIANCE_FACTOR_CACHE_SIZE = 128
+_covariance_factors: Dict[Tuple[str, float], np.ndarray] = {}
+
+# Upper bound on requests per /monte-carlo-impact-map/batch call
+MONTE_CARLO_BATCH_MAX = 32
+
+
+def start_process_pool() -> None:
+    """Create the worker pool for CPU-bound simulation work (app startup)"""
+    global _process_pool
+    if _process_pool is None:
+        # spawn rather than fork: the server process already runs an event
+        # loop and Numba worker threads
+        _process_pool = ProcessPoolExecutor(
+            max_workers=max(1, min(settings.simulation_workers, os.cpu_count() or 1)),
+            mp_context=multiprocessing.get_context("spawn")
+        )
+
+
+async def _get_sbdb_with_covariance(asteroid_id: str) -> Dict:
+    """SBDB details with covariance, served from memory for repeat asteroids"""
+    cached = _sbdb_cache.get(asteroid_id)
+    if cached is not None and cached[1] > time.monotonic():
+        return cached[0]
+    
+    async with OfficialNASAAPIService(
+        settings.nasa_api_key,
+        settings.nasa_neo_api_url,
+        settings.nasa_sbdb_api_url
+    ) as nasa_service:
+        sbdb_data = await nasa_service.get_sbdb_asteroid_details(
+            asteroid_id,
+            include_covariance=True
+        )
+    
+    # Failed lookups come back empty; only keep usable solutions
+    if sbdb_data and sbdb_data.get("covariance"):
+        _sbdb_cache.pop(asteroid_id, None)
+        if len(_sbdb_cache) >= SBDB_CACHE_SIZE:
+            _sbdb_cache.pop(next(iter(_sbdb_cache)))
+        _sbdb_cache[asteroid_id] = (sbdb_data, time.monotonic() + SBDB_CACHE_TTL_SECONDS)
+    return sbdb_data
+
+
+def _covariance_factor(asteroid_id: str, covariance: Dict) -> np.ndarray:
+    """SBDB covariance factor, reused across requests for the same orbit solution"""
+    epoch_jd = covariance.get("epoch_jd")
+    if epoch_jd is None:
+        return sbdb_covariance_factor(covariance)
+
+    key = (asteroid_id, epoch_jd)
+    factor = _covariance_factors.get(key)
+    if factor is None:
+        factor = sbdb_covariance_factor(covariance)
+        if len(_covariance_factors) >= COVARIANCE_FACTOR_CACHE_SIZE:
+            _covariance_factors.pop(next(iter(_covariance_factors)))
+        _covariance_factors[key] = factor
+    return factor
 
 
-@router.post("/impact", response_model=SimulationResponse)
-async def simulate_impact(request: SimulationRequest) -> SimulationResponse:
+def _impact_energy(diameter_m: float, velocity_km_s: float, density_kg_m3: float) -> float:
+    """Kinetic energy (J) of a spherical impactor"""
+    radius = diameter_m * 0.5
+    mass = (4.0 / 3.0) * math.pi * radius * radius * radius * density_kg_m3
+    velocity_m_s = velocity_km_s * 1000.0
+    return 0.5 * mass * velocity_m_s * velocity_m_s
+
+
+def _quantize_heatmap(heatmap: List[Dict]) -> Dict:
+    """
+    Columnar heatmap with probabilities as uint16 relative to the largest bin
+    
+    Dequantize with probability_u16 / 65535 * probability_scale.
+    """
+    probabilities = np.array([cell["probability"] for cell in heatmap], dtype=np.float64)
+    scale = float(probabilities.max()) if probabilities.size else 0.0
+    if scale > 0:
+        quantized = np.round(probabilities / scale * 65535).astype(np.uint16)
+    else:
+        quantized = np.zeros(probabilities.size, dtype=np.uint16)
+    
+    return {
+        "encoding": "u16",
+        "lat_center_deg": [cell["lat_center_deg"] for cell in heatmap],
+        "lon_center_deg": [cell["lon_center_deg"] for cell in heatmap],
+        "count": [cell["count"] for cell in heatmap],
+        "probability_u16": quantized.tolist(),
+        "probability_scale": scale
+    }
+
+
+def shutdown_process_pool() -> None:
+    """Stop the simulation worker processes"""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+
+def _run_simulation(
+    params_dict: Dict,
+    orbital_elements_dict: Optional[Dict],
+    requested_location: Optional[Dict],
+    include_trajectory: bool
+) -> Tuple[Optional[Dict], Dict, Dict]:
+    """
+    CPU portion of /impact, run in a worker process
+    
+    Returns the impact scenario (if one was needed), the effective entry
+    parameters and the impact effects.
+    """
+    scenario: Optional[Dict] = None
+
+    # Compute the scenario at most once: it is needed for the orbital
+    # intercept and/or the trajectory. calculate_impact_scenario does not
+    # mutate its params, so no defensive copy is needed.
+    if orbital_elements_dict or include_trajectory:
+        try:
+            if orbital_elements_dict:
+                scenario = calculate_impact_scenario(
+                    params_dict,
+                    orbital_elements=orbital_elements_dict,
+                    target_location=requested_location
+                )
+            else:
+                scenario = calculate_atmospheric_only(params_dict, target_location=requested_location)
+        except Exception as e:
+            if orbital_elements_dict:
+                raise
+            logger.warning(f"Trajectory calculation failed: {e}")
+
+    if scenario and orbital_elements_dict:
+        effective_params = scenario.get('effective_parameters', {})
+        if effective_params:
+            params_dict['velocity'] = effective_params.get('entry_velocity_km_s', params_dict['velocity'])
+            params_dict['angle'] = effective_params.get('entry_angle_deg', params_dict['angle'])
+
+    # Compute basic impact effects using effective entry parameters
+    impact_data = physics_engine.compute_impact_effects(params_dict)
+
+    return scenario, params_dict, impact_data
+
+
+def _finalize_location(
+    scenario: Optional[Dict],
+    requested_location: Optional[Dict],
+    intercept_data: Optional[Dict],
+    angle: float
+) -> Optional[Dict]:
+    """
+    Impact location for the response
+    
+    Prefers the computed scenario, then the requested target, then the
+    orbital intercept.
+    """
+    if scenario:
+        # calculate_impact_scenario already sets impact_angle_deg and azimuth_deg
+        return scenario['impact_location']
+
+    if requested_location:
+        latitude = requested_location['latitude']
+        longitude = requested_location['longitude']
+    elif intercept_data:
+        latitude = intercept_data.get('latitude')
+        longitude = intercept_data.get('longitude')
+    else:
+        return None
+
+    location = {
+        "latitude": latitude,
+        "longitude": longitude,
+        "impact_point": [longitude, latitude],
+        "impact_angle_deg": angle
+    }
+    if intercept_data:
+        location["azimuth_deg"] = intercept_data.get('azimuth_deg')
+    return location
+
+
+@router.post("/impact", responses={200: {"model": SimulationResponse}})
+async def simulate_impact(request: SimulationRequest, http_request: Request) -> ORJSONResponse:
     """
     Simulate asteroid impact and calculate effects
     
@@ -43,7 +261,7 @@ async def simulate_impact(request: SimulationRequest) -> SimulationResponse:
     - Thermal radiation effects
     - Environmental damage
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
     try:
         requested_location = (
@@ -63,99 +281,40 @@ async def simulate_impact(request: SimulationRequest) -> SimulationResponse:
         }
 
         intercept_data: Optional[Dict] = None
-        scenario: Optional[Dict] = None
-        orbital_elements_dict = request.orbital_elements.dict() if request.orbital_elements else None
-
-        if orbital_elements_dict:
-            scenario = calculate_impact_scenario(
-                params_dict.copy(),
-                orbital_elements=orbital_elements_dict,
-                target_location=requested_location
-            )
-            if scenario:
-                intercept_data = scenario.get('orbital_intercept')
-                effective_params = scenario.get('effective_parameters', {})
-                if effective_params:
-                    params_dict['velocity'] = effective_params.get('entry_velocity_km_s', params_dict['velocity'])
-                    params_dict['angle'] = effective_params.get('entry_angle_deg', params_dict['angle'])
-
-        # Compute basic impact effects using effective entry parameters
-        impact_data = physics_engine.compute_impact_effects(params_dict)
+        orbital_elements_dict = request.orbital_elements.model_dump() if request.orbital_elements else None
 
-        # DEPRECATED: USGS correlation (kept for backward compatibility, but likely fails for large impacts)
-        usgs_damage_scale = None
-        similar_earthquakes = None
+        # The CPU-bound physics runs in a worker process so it does not hold
+        # the GIL on the event loop thread (the default thread pool if the
+        # app was started without its lifespan)
+        loop = asyncio.get_running_loop()
+        scenario, params_dict, impact_data = await loop.run_in_executor(
+            _process_pool,
+            _run_simulation,
+            params_dict,
+            orbital_elements_dict,
+            requested_location,
+            request.include_trajectory
+        )
 
-        if request.include_usgs_correlation and impact_data['energy_mt_tnt'] < 100:
-            try:
-                async with USGSEarthquakeService(settings.usgs_earthquake_api_url) as usgs:
-                    usgs_damage_scale = usgs.get_earthquake_damage_description(
-                        impact_data['seismic_magnitude']
-                    )
-                    similar_earthquakes = await usgs.find_similar_magnitude_earthquakes(
-                        impact_data['seismic_magnitude'],
-                        tolerance=0.5
-                    )
-            except Exception as e:
-                logger.debug(f"USGS correlation skipped (impact too large or API unavailable): {e}")
+        if scenario and orbital_elements_dict:
+            intercept_data = scenario.get('orbital_intercept')
 
         # Determine impact location and atmospheric trajectory
-        trajectory_data = None
-        location = None
-
-        if scenario:
-            trajectory_data = scenario['atmospheric_entry']['trajectory']
-            location = scenario['impact_location']
-
-        if request.include_trajectory:
-            try:
-                if scenario is None:
-                    scenario = calculate_impact_scenario(
-                        params_dict.copy(),
-                        orbital_elements=orbital_elements_dict,
-                        target_location=requested_location
-                    )
-                    if scenario:
-                        intercept_data = intercept_data or scenario.get('orbital_intercept')
-                if scenario:
-                    trajectory_data = scenario['atmospheric_entry']['trajectory']
-                    location = scenario['impact_location']
-            except Exception as e:
-                logger.warning(f"Trajectory calculation failed: {e}")
-
-        if location is None and requested_location:
-            location = {
-                "latitude": requested_location['latitude'],
-                "longitude": requested_location['longitude'],
-                "impact_point": [requested_location['longitude'], requested_location['latitude']],
-                "impact_angle_deg": request.asteroid_params.angle
-            }
-
-        if location is None and intercept_data:
-            location = {
-                "latitude": intercept_data.get('latitude'),
-                "longitude": intercept_data.get('longitude'),
-                "impact_point": [intercept_data.get('longitude'), intercept_data.get('latitude')],
-                "impact_angle_deg": params_dict['angle'],
-                "azimuth_deg": intercept_data.get('azimuth_deg')
-            }
+        trajectory_data = scenario['atmospheric_entry']['trajectory'] if scenario else None
+        location = _finalize_location(scenario, requested_location, intercept_data, params_dict['angle'])
 
-        if location and 'impact_angle_deg' not in location:
-            location['impact_angle_deg'] = params_dict['angle']
-        if location and 'azimuth_deg' not in location and intercept_data:
-            location['azimuth_deg'] = intercept_data.get('azimuth_deg')
-
-        # Calculate comprehensive danger assessment using final location estimate
-        danger_assessment = None
-        try:
-            danger_lat = location['latitude'] if location else (
-                intercept_data['latitude'] if intercept_data else (request.location_lat or 0.0)
-            )
-            danger_lon = location['longitude'] if location else (
-                intercept_data['longitude'] if intercept_data else (request.location_lon or 0.0)
-            )
+        # Danger assessment is CPU work and the USGS correlation is HTTP, so run
+        # the assessment in a worker thread while the USGS request is in flight
+        danger_lat = location['latitude'] if location else (
+            intercept_data['latitude'] if intercept_data else (request.location_lat or 0.0)
+        )
+        danger_lon = location['longitude'] if location else (
+            intercept_data['longitude'] if intercept_data else (request.location_lon or 0.0)
+        )
 
-            danger_assessment = danger_assessor.assess_impact(
+        tasks = [
+            asyncio.to_thread(
+                danger_assessor.assess_impact,
                 energy_mt_tnt=impact_data['energy_mt_tnt'],
                 crater_diameter_m=impact_data['crater_diameter'],
                 crater_depth_m=impact_data['crater_depth'],
@@ -165,10 +324,35 @@ async def simulate_impact(request: SimulationRequest) -> SimulationResponse:
                 asteroid_diameter_m=request.asteroid_params.diameter,
                 velocity_km_s=params_dict['velocity']
             )
-        except Exception as e:
-            logger.warning(f"Danger assessment failed: {e}")
+        ]
+        # DEPRECATED: USGS correlation (kept for backward compatibility, but likely fails for large impacts)
+        usgs_damage_scale = None
+        similar_earthquakes = None
+        if request.include_usgs_correlation and impact_data['energy_mt_tnt'] < 100:
+            # Damage scale is a local Mercalli lookup; only the similar-quake search hits USGS
+            usgs_damage_scale = USGSEarthquakeService.get_earthquake_damage_description(
+                impact_data['seismic_magnitude']
+            )
+            tasks.append(http_request.app.state.usgs.find_similar_magnitude_earthquakes(
+                impact_data['seismic_magnitude'],
+                tolerance=0.5
+            ))
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        danger_assessment = None
+        if isinstance(results[0], Exception):
+            logger.warning(f"Danger assessment failed: {results[0]}")
+        else:
+            danger_assessment = results[0]
+
+        if len(results) > 1:
+            if isinstance(results[1], Exception):
+                logger.debug(f"USGS correlation skipped (impact too large or API unavailable): {results[1]}")
+            else:
+                similar_earthquakes = results[1]
 
-        effective_parameters_model = request.asteroid_params.copy(update={
+        effective_parameters_model = request.asteroid_params.model_copy(update={
             "velocity": params_dict['velocity'],
             "angle": params_dict['angle']
         })
@@ -190,15 +374,22 @@ async def simulate_impact(request: SimulationRequest) -> SimulationResponse:
             calculation_method=impact_data['calculation_method']
         )
 
-        computation_time = (time.time() - start_time) * 1000  # ms
+        computation_time = (time.perf_counter_ns() - start_ns) / 1e6  # ms
 
-        return SimulationResponse(
+        # Validated once here; returning the Response directly skips FastAPI's
+        # second response_model validation pass
+        response = SimulationResponse(
             impact_results=impact_results,
             trajectory_data=trajectory_data,
             location=location,
             orbital_intercept=intercept_data,
             computation_time_ms=computation_time
         )
+        # The danger assessment is plain JSON types (str enums, floats, ints),
+        # so hand it to orjson as-is rather than through pydantic's JSON walk
+        content = response.model_dump(mode="json", exclude={"impact_results": {"danger_assessment"}})
+        content["impact_results"]["danger_assessment"] = danger_assessment
+        return ORJSONResponse(content=content)
         
     except Exception as e:
         logger.error(f"Simulation failed: {e}", exc_info=True)
@@ -211,7 +402,7 @@ async def simulate_batch_impacts(asteroid_params_list: List[AsteroidParameters])
     Simulate multiple asteroid impacts in batch
     More efficient for comparing multiple scenarios
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
     try:
         # Convert to dicts
@@ -230,9 +421,9 @@ async def simulate_batch_impacts(asteroid_params_list: List[AsteroidParameters])
         
         # Add input parameters to results
         for i, result in enumerate(results):
-            result['input_parameters'] = asteroid_params_list[i].dict()
+            result['input_parameters'] = asteroid_params_list[i].model_dump()
         
-        computation_time = (time.time() - start_time) * 1000
+        computation_time = (time.perf_counter_ns() - start_ns) / 1e6
         
         return results
         
@@ -325,11 +516,7 @@ async def calculate_trajectory(
         if latitude is not None and longitude is not None:
             target_loc = {'latitude': latitude, 'longitude': longitude}
         
-        scenario = calculate_impact_scenario(
-            params_dict,
-            orbital_elements=None,
-            target_location=target_loc
-        )
+        scenario = calculate_atmospheric_only(params_dict, target_location=target_loc)
         
         return {
             "status": "success",
@@ -345,13 +532,13 @@ async def calculate_trajectory(
         raise HTTPException(status_code=500, detail=f"Trajectory calculation failed: {str(e)}")
 
 
-@router.post("/orbital-trajectory")
+@router.post("/orbital-trajectory", response_class=ORJSONResponse)
 async def calculate_orbital_trajectory(
     orbital_elements: Dict, 
     num_points: int = 360,
     check_collision: bool = True,
     full_orbit: bool = True
-) -> Dict:
+):
     """
     Calculate orbital trajectory for 3D space visualization
     
@@ -368,134 +555,120 @@ async def calculate_orbital_trajectory(
     """
     try:
         om = OrbitalMechanics()
-        trajectory = om.generate_trajectory_visualization(
+        trajectory, metadata = om.generate_trajectory_array(
             orbital_elements, 
             num_points,
             check_collision,
             full_orbit
         )
         
-        # Extract metadata from first point if available
-        metadata = trajectory[0].get("trajectory_metadata", {}) if trajectory else {}
-        
-        return {
+        # Points go out as rows of ORBITAL_TRAJECTORY_COLUMNS; orjson writes
+        # the array directly
+        return ORJSONResponse(content={
             "status": "success",
             "trajectory": trajectory,
+            "trajectory_columns": ORBITAL_TRAJECTORY_COLUMNS,
             "orbital_elements": orbital_elements,
             "num_points": len(trajectory),
             "metadata": {
-                "collision_detected": metadata.get("collision_detected", False),
-                "collision_point_index": metadata.get("collision_point_index"),
-                "orbital_period_years": metadata.get("orbital_period_years", 0),
-                "full_orbit_calculated": metadata.get("full_orbit_calculated", True),
+                "collision_detected": metadata["collision_detected"],
+                "collision_point_index": metadata["collision_point_index"],
+                "orbital_period_years": metadata["orbital_period_years"],
+                "full_orbit_calculated": metadata["full_orbit_calculated"],
                 "points_calculated": len(trajectory)
             }
-        }
+        })
         
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid orbital elements: {str(e)}")
     except Exception as e:
         logger.error(f"Orbital trajectory calculation failed: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Orbital calculation failed: {str(e)}")
 
 
-@router.get("/scenario/{scenario_name}")
-async def get_preset_scenario(scenario_name: str) -> Dict:
-    """
-    Get preset impact scenarios with real orbital data
-    
-    Available scenarios:
-    - tunguska: 1908 Tunguska event
-    - chelyabinsk: 2013 Chelyabinsk event
-    - apophis: 99942 Apophis close approach
-    - chicxulub: Dinosaur extinction event
-    """
-    scenarios = {
-        "tunguska": {
-            "name": "Tunguska 1908",
-            "asteroid_params": {
-                "diameter": 50.0,
-                "velocity": 27.0,
-                "density": 2000.0,
-                "angle": 45.0
-            },
-            "location": {"latitude": 60.886, "longitude": 101.894},
-            "orbital_elements": {
-                "semi_major_axis_au": 1.2,
-                "eccentricity": 0.35,
-                "inclination_deg": 8.0,
-                "longitude_ascending_node_deg": 180.0,
-                "argument_periapsis_deg": 90.0,
-                "mean_anomaly_deg": 0.0
-            },
-            "description": "Airburst over Siberia that flattened 2000 km² of forest"
+# Preset scenarios are fixed, so their effects are computed once at import
+_PRESET_SCENARIOS = {
+    "tunguska": {
+        "name": "Tunguska 1908",
+        "asteroid_params": {
+            "diameter": 50.0,
+            "velocity": 27.0,
+            "density": 2000.0,
+            "angle": 45.0
         },
-        "chelyabinsk": {
-            "name": "Chelyabinsk 2013",
-            "asteroid_params": {
-                "diameter": 20.0,
-                "velocity": 19.0,
-                "density": 3300.0,
-                "angle": 20.0
-            },
-            "location": {"latitude": 54.8, "longitude": 61.1},
-            "orbital_elements": {
-                "semi_major_axis_au": 1.65,
-                "eccentricity": 0.51,
-                "inclination_deg": 2.7,
-                "longitude_ascending_node_deg": 326.0,
-                "argument_periapsis_deg": 277.0,
-                "mean_anomaly_deg": 0.0
-            },
-            "description": "Airburst over Russia causing ~1500 injuries"
+        "location": {"latitude": 60.886, "longitude": 101.894},
+        "orbital_elements": {
+            "semi_major_axis_au": 1.2,
+            "eccentricity": 0.35,
+            "inclination_deg": 8.0,
+            "longitude_ascending_node_deg": 180.0,
+            "argument_periapsis_deg": 90.0,
+            "mean_anomaly_deg": 0.0
         },
-        "apophis": {
-            "name": "99942 Apophis",
-            "asteroid_params": {
-                "diameter": 370.0,
-                "velocity": 7.4,
-                "density": 3200.0,
-                "angle": 45.0
-            },
-            "location": {"latitude": 0.0, "longitude": 0.0},
-            "orbital_elements": {
-                "semi_major_axis_au": 0.922,
-                "eccentricity": 0.191,
-                "inclination_deg": 3.331,
-                "longitude_ascending_node_deg": 204.4,
-                "argument_periapsis_deg": 126.4,
-                "mean_anomaly_deg": 0.0
-            },
-            "description": "Near-Earth asteroid with close approaches"
+        "description": "Airburst over Siberia that flattened 2000 km² of forest"
+    },
+    "chelyabinsk": {
+        "name": "Chelyabinsk 2013",
+        "asteroid_params": {
+            "diameter": 20.0,
+            "velocity": 19.0,
+            "density": 3300.0,
+            "angle": 20.0
         },
-        "chicxulub": {
-            "name": "Chicxulub Impact",
-            "asteroid_params": {
-                "diameter": 10000.0,
-                "velocity": 20.0,
-                "density": 2500.0,
-                "angle": 60.0
-            },
-            "location": {"latitude": 21.4, "longitude": -89.5},
-            "orbital_elements": {
-                "semi_major_axis_au": 2.5,
-                "eccentricity": 0.6,
-                "inclination_deg": 15.0,
-                "longitude_ascending_node_deg": 45.0,
-                "argument_periapsis_deg": 120.0,
-                "mean_anomaly_deg": 0.0
-            },
-            "description": "Dinosaur extinction event 66 million years ago"
-        }
+        "location": {"latitude": 54.8, "longitude": 61.1},
+        "orbital_elements": {
+            "semi_major_axis_au": 1.65,
+            "eccentricity": 0.51,
+            "inclination_deg": 2.7,
+            "longitude_ascending_node_deg": 326.0,
+            "argument_periapsis_deg": 277.0,
+            "mean_anomaly_deg": 0.0
+        },
+        "description": "Airburst over Russia causing ~1500 injuries"
+    },
+    "apophis": {
+        "name": "99942 Apophis",
+        "asteroid_params": {
+            "diameter": 370.0,
+            "velocity": 7.4,
+            "density": 3200.0,
+            "angle": 45.0
+        },
+        "location": {"latitude": 0.0, "longitude": 0.0},
+        "orbital_elements": {
+            "semi_major_axis_au": 0.922,
+            "eccentricity": 0.191,
+            "inclination_deg": 3.331,
+            "longitude_ascending_node_deg": 204.4,
+            "argument_periapsis_deg": 126.4,
+            "mean_anomaly_deg": 0.0
+        },
+        "description": "Near-Earth asteroid with close approaches"
+    },
+    "chicxulub": {
+        "name": "Chicxulub Impact",
+        "asteroid_params": {
+            "diameter": 10000.0,
+            "velocity": 20.0,
+            "density": 2500.0,
+            "angle": 60.0
+        },
+        "location": {"latitude": 21.4, "longitude": -89.5},
+        "orbital_elements": {
+            "semi_major_axis_au": 2.5,
+            "eccentricity": 0.6,
+            "inclination_deg": 15.0,
+            "longitude_ascending_node_deg": 45.0,
+            "argument_periapsis_deg": 120.0,
+            "mean_anomaly_deg": 0.0
+        },
+        "description": "Dinosaur extinction event 66 million years ago"
     }
-    
-    if scenario_name.lower() not in scenarios:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Scenario '{scenario_name}' not found. Available: {list(scenarios.keys())}"
-        )
-    
-    scenario = scenarios[scenario_name.lower()]
-    
-    # Calculate impact effects for this scenario
+}
+
+
+def _compute_preset_scenario(scenario: Dict) -> Dict:
+    """Calculate impact effects and a trajectory preview for a preset scenario"""
     try:
         params_dict = scenario['asteroid_params']
         impact_data = physics_engine.compute_impact_effects(params_dict)
@@ -506,9 +679,10 @@ async def get_preset_scenario(scenario_name: str) -> Dict:
             full_scenario = calculate_impact_scenario(
                 params_dict,
                 orbital_elements=scenario.get('orbital_elements'),
-                target_location=scenario['location']
+                target_location=scenario['location'],
+                max_trajectory_points=20
             )
-            trajectory_data = full_scenario['atmospheric_entry']['trajectory'][:20]  # Limit points
+            trajectory_data = full_scenario['atmospheric_entry']['trajectory']
         
         return {
             "status": "success",
@@ -526,33 +700,73 @@ async def get_preset_scenario(scenario_name: str) -> Dict:
         }
 
 
+_PRESET_COMPUTED: Dict[str, Dict] = {
+    name: _compute_preset_scenario(scenario)
+    for name, scenario in _PRESET_SCENARIOS.items()
+}
+
+
+@router.get("/scenario/{scenario_name}")
+async def get_preset_scenario(scenario_name: str) -> Dict:
+    """
+    Get preset impact scenarios with real orbital data
+    
+    Available scenarios:
+    - tunguska: 1908 Tunguska event
+    - chelyabinsk: 2013 Chelyabinsk event
+    - apophis: 99942 Apophis close approach
+    - chicxulub: Dinosaur extinction event
+    """
+    preset = _PRESET_COMPUTED.get(scenario_name.lower())
+    if preset is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Scenario '{scenario_name}' not found. Available: {list(_PRESET_SCENARIOS.keys())}"
+        )
+    
+    return preset
+
+
 @router.get("/neo/live-threats")
 async def get_live_neo_threats():
     """
     Get live Near-Earth Object data from NASA API
     Returns asteroids making close approaches in the next 7 days
     """
+    global _live_threats_cache
+    
     try:
-        from app.services.nasa.neo_live_service import NASANEOLiveService
+        start_date = datetime.now().strftime('%Y-%m-%d')
+        cached = _live_threats_cache
+        if cached is None or cached[0] != start_date or cached[2] <= time.monotonic():
+            async with _live_threats_lock:
+                # Re-check: another request may have refreshed while we waited
+                cached = _live_threats_cache
+                if cached is None or cached[0] != start_date or cached[2] <= time.monotonic():
+                    end_date = (datetime.now() + timedelta(days=7)).strftime('%Y-%m-%d')
+                    async with NASANEOLiveService(settings.nasa_api_key) as neo_service:
+                        # One feed request covers both lists; PHAs are a filter of it
+                        all_approaches = await neo_service.get_close_approaches(start_date, end_date)
+                    hazardous = [
+                        ast for ast in all_approaches
+                        if ast.get('is_potentially_hazardous_asteroid', False)
+                    ]
+                    
+                    payload = {
+                        "status": "success",
+                        "data_source": "NASA_NEO_API_Live",
+                        "query_date": datetime.now().isoformat(),
+                        "potentially_hazardous": hazardous,
+                        "all_close_approaches": all_approaches[:20],  # Limit to 20
+                        "total_count": len(all_approaches),
+                        "hazardous_count": len(hazardous)
+                    }
+                    if not all_approaches:
+                        return payload
+                    cached = (start_date, payload, time.monotonic() + LIVE_THREATS_TTL_SECONDS)
+                    _live_threats_cache = cached
         
-        async with NASANEOLiveService(settings.nasa_api_key) as neo_service:
-            # Get potentially hazardous asteroids
-            hazardous = await neo_service.get_potentially_hazardous()
-            
-            # Get all close approaches for next 7 days
-            start_date = datetime.now().strftime('%Y-%m-%d')
-            end_date = (datetime.now() + timedelta(days=7)).strftime('%Y-%m-%d')
-            all_approaches = await neo_service.get_close_approaches(start_date, end_date)
-            
-            return {
-                "status": "success",
-                "data_source": "NASA_NEO_API_Live",
-                "query_date": datetime.now().isoformat(),
-                "potentially_hazardous": hazardous,
-                "all_close_approaches": all_approaches[:20],  # Limit to 20
-                "total_count": len(all_approaches),
-                "hazardous_count": len(hazardous)
-            }
+        return cached[1]
     except Exception as e:
         logger.error(f"Failed to fetch live NEO data: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to fetch NASA NEO data: {str(e)}")
@@ -564,8 +778,6 @@ async def get_neo_details(asteroid_id: str):
     Get detailed information about a specific asteroid from NASA
     """
     try:
-        from app.services.nasa.neo_live_service import NASANEOLiveService
-        
         async with NASANEOLiveService(settings.nasa_api_key) as neo_service:
             asteroid_data = await neo_service.get_asteroid_by_id(asteroid_id)
             
@@ -601,10 +813,7 @@ async def analyze_deflection_strategies(
         Comparison of all deflection strategies with recommendations
     """
     try:
-        from app.physics.deflection_strategies import DeflectionStrategies
-        
-        ds = DeflectionStrategies()
-        result = ds.compare_all_strategies(
+        result = deflection_strategies.compare_all_strategies(
             asteroid_diameter_m=asteroid_diameter,
             asteroid_density_kg_m3=asteroid_density,
             years_before_impact=years_warning
@@ -632,10 +841,7 @@ async def calculate_kinetic_impactor(
     Calculate deflection from kinetic impactor mission (DART-style)
     """
     try:
-        from app.physics.deflection_strategies import DeflectionStrategies
-        
-        ds = DeflectionStrategies()
-        result = ds.kinetic_impactor(
+        result = deflection_strategies.kinetic_impactor(
             asteroid_mass_kg=asteroid_mass_kg,
             asteroid_velocity_km_s=asteroid_velocity_km_s,
             impactor_mass_kg=impactor_mass_kg,
@@ -679,12 +885,8 @@ async def analyze_tsunami_impact(
         Tsunami generation parameters and coastal impact assessment
     """
     try:
-        from app.physics.tsunami_model import TsunamiModel
-        
-        tm = TsunamiModel()
-        
         # Calculate tsunami generation
-        tsunami_result = tm.calculate_ocean_impact_tsunami(
+        tsunami_result = tsunami_model.calculate_ocean_impact_tsunami(
             asteroid_diameter_m=asteroid_diameter,
             asteroid_velocity_km_s=asteroid_velocity,
             asteroid_density_kg_m3=asteroid_density,
@@ -693,7 +895,7 @@ async def analyze_tsunami_impact(
         )
         
         # Calculate coastal impact (assuming moderate coastal population)
-        coastal_result = tm.calculate_coastal_impact(
+        coastal_result = tsunami_model.calculate_coastal_impact(
             tsunami_wave_height_m=tsunami_result['coastal_wave_height_m'],
             coastal_population_density=500,  # people/km²
             coastal_elevation_m=10.0  # meters
@@ -701,7 +903,7 @@ async def analyze_tsunami_impact(
         
         return {
             "status": "success",
-            "is_ocean_impact": tm.is_ocean_impact(latitude, longitude),
+            "is_ocean_impact": tsunami_model.is_ocean_impact(latitude, longitude),
             "tsunami_generation": tsunami_result,
             "coastal_impact": coastal_result,
             "warning": "Immediate evacuation required for coastal areas" if tsunami_result['risk_level'] in ['HIGH', 'CATASTROPHIC'] else None
@@ -712,15 +914,14 @@ async def analyze_tsunami_impact(
 
 
 @router.get("/gpu/info")
-async def get_gpu_info():
+async def get_gpu_info(
+    gpu_simulator: GPUAcceleratedSimulator = Depends(get_gpu_simulator)
+):
     """
     Get GPU hardware information and capabilities
     """
     try:
-        from app.physics.gpu_accelerated import GPUAcceleratedSimulator
-        
-        gpu_sim = GPUAcceleratedSimulator()
-        info = gpu_sim.get_gpu_info()
+        info = gpu_simulator.get_gpu_info()
         
         return {
             "status": "success",
@@ -731,12 +932,13 @@ async def get_gpu_info():
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/gpu/high-res-trajectory")
+@router.post("/gpu/high-res-trajectory", response_class=ORJSONResponse)
 async def gpu_high_resolution_trajectory(
     altitude_km: float = 100.0,
     velocity_km_s: float = 20.0,
     angle_deg: float = 45.0,
-    time_steps: int = 10000
+    time_steps: int = 10000,
+    gpu_simulator: GPUAcceleratedSimulator = Depends(get_gpu_simulator)
 ):
     """
     GPU-accelerated high-resolution trajectory calculation
@@ -752,32 +954,19 @@ async def gpu_high_resolution_trajectory(
         High-resolution trajectory with positions, velocities, altitudes
     """
     try:
-        from app.physics.gpu_accelerated import GPUAcceleratedSimulator
-        import numpy as np
-        
-        gpu_sim = GPUAcceleratedSimulator()
-        
         # Convert to SI units
         EARTH_RADIUS = 6371000  # meters
         altitude_m = altitude_km * 1000
         velocity_m_s = velocity_km_s * 1000
         angle_rad = math.radians(angle_deg)
+        cos_a, sin_a = math.cos(angle_rad), math.sin(angle_rad)
         
-        # Initial conditions
-        initial_position = np.array([
-            0.0,
-            0.0,
-            EARTH_RADIUS + altitude_m
-        ])
-        
-        initial_velocity = np.array([
-            velocity_m_s * math.cos(angle_rad),
-            0.0,
-            -velocity_m_s * math.sin(angle_rad)
-        ])
+        # Initial conditions; the simulator converts them to arrays itself
+        initial_position = (0.0, 0.0, EARTH_RADIUS + altitude_m)
+        initial_velocity = (velocity_m_s * cos_a, 0.0, -velocity_m_s * sin_a)
         
         # Run simulation
-        result = gpu_sim.high_resolution_trajectory(
+        result = gpu_simulator.high_resolution_trajectory(
             initial_position,
             initial_velocity,
             asteroid_mass=1e6,  # 1 ton asteroid
@@ -785,21 +974,24 @@ async def gpu_high_resolution_trajectory(
             dt=0.1
         )
         
-        # Sample points for return (full dataset too large)
+        # Sample points for return (full dataset too large). orjson serializes
+        # the arrays directly but needs them C-contiguous, hence the copies.
         sample_rate = max(1, time_steps // 1000)
+        altitudes = np.ascontiguousarray(result['altitudes'][::sample_rate])
+        speeds_km_s = result['speeds'][::sample_rate] / 1000
         
-        return {
+        return ORJSONResponse(content={
             "status": "success",
             "trajectory": {
-                "altitudes_km": result['altitudes'][::sample_rate].tolist(),
-                "speeds_km_s": (result['speeds'][::sample_rate] / 1000).tolist(),
+                "altitudes_km": altitudes,
+                "speeds_km_s": speeds_km_s,
                 "time_steps_calculated": time_steps,
-                "time_steps_returned": len(result['altitudes'][::sample_rate]),
+                "time_steps_returned": len(altitudes),
                 "calculation_time_ms": result['calculation_time_ms'],
                 "calculation_method": result['calculation_method'],
                 "performance_points_per_second": result['points_per_second']
             }
-        }
+        })
     except Exception as e:
         logger.error(f"GPU trajectory failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -809,8 +1001,10 @@ async def gpu_high_resolution_trajectory(
 async def gpu_monte_carlo_probability(
     semi_major_axis_au: float,
     eccentricity: float,
-    num_simulations: int = 10000,
-    uncertainty_percent: float = 1.0
+    num_simulations: int = Query(default=10000, ge=1, le=MAX_SAMPLES),
+    uncertainty_percent: float = 1.0,
+    random_seed: Optional[int] = None,
+    gpu_simulator: GPUAcceleratedSimulator = Depends(get_gpu_simulator)
 ):
     """
     GPU-accelerated Monte Carlo simulation for impact probability
@@ -821,24 +1015,22 @@ async def gpu_monte_carlo_probability(
         eccentricity: Orbital eccentricity
         num_simulations: Number of Monte Carlo runs (1,000-100,000)
         uncertainty_percent: Uncertainty in orbital elements (%)
+        random_seed: Optional seed for reproducible runs
     
     Returns:
         Impact probability with detailed statistics
     """
     try:
-        from app.physics.gpu_accelerated import GPUAcceleratedSimulator
-        
-        gpu_sim = GPUAcceleratedSimulator()
-        
         orbital_elements = {
             'semi_major_axis_au': semi_major_axis_au,
             'eccentricity': eccentricity
         }
         
-        result = gpu_sim.monte_carlo_impact_probability(
+        result = gpu_simulator.monte_carlo_impact_probability(
             orbital_elements,
             num_simulations=num_simulations,
-            uncertainty_sigma=uncertainty_percent / 100
+            uncertainty_sigma=uncertainty_percent / 100,
+            seed=random_seed
         )
         
         return {
@@ -857,11 +1049,12 @@ async def gpu_crater_morphology(
     asteroid_density: float = 3000.0,
     impact_angle: float = 45.0,
     target_density: float = 2500.0,
-    grid_resolution: int = 1000
+    grid_resolution: int = 1000,
+    gpu_simulator: GPUAcceleratedSimulator = Depends(get_gpu_simulator)
 ):
     """
-    GPU-accelerated detailed crater morphology calculation
-    Computes crater shape on high-resolution grid
+    Detailed crater morphology calculation
+    Returns the crater's analytic radial profile for client-side rendering
     
     Args:
         asteroid_diameter: Diameter in meters
@@ -869,25 +1062,14 @@ async def gpu_crater_morphology(
         asteroid_density: Density in kg/m³
         impact_angle: Impact angle from horizontal
         target_density: Target material density
-        grid_resolution: Grid size (100-2000, higher = more detail)
+        grid_resolution: Render hint for clients rasterizing the profile
     
     Returns:
-        Detailed crater morphology with 3D shape data
+        Crater dimensions, radial elevation profile and ejecta parameters
     """
     try:
-        from app.physics.gpu_accelerated import GPUAcceleratedSimulator
-        
-        gpu_sim = GPUAcceleratedSimulator()
-        
-        # Calculate impact energy
-        radius = asteroid_diameter / 2
-        volume = (4/3) * math.pi * (radius**3)
-        mass = volume * asteroid_density
-        velocity_m_s = asteroid_velocity * 1000
-        impact_energy = 0.5 * mass * (velocity_m_s**2)
-        
-        result = gpu_sim.parallel_crater_formation(
-            impact_energy_joules=impact_energy,
+        result = gpu_simulator.parallel_crater_formation(
+            impact_energy_joules=_impact_energy(asteroid_diameter, asteroid_velocity, asteroid_density),
             asteroid_diameter_m=asteroid_diameter,
             impact_angle_deg=impact_angle,
             target_density_kg_m3=target_density,
@@ -904,7 +1086,10 @@ async def gpu_crater_morphology(
 
 
 @router.post("/monte-carlo-impact-map")
-async def monte_carlo_impact_map(request: MonteCarloImpactRequest) -> Dict:
+async def monte_carlo_impact_map(
+    request: MonteCarloImpactRequest,
+    gpu_simulator: GPUAcceleratedSimulator = Depends(get_gpu_simulator)
+) -> Dict:
     """
     Generate Monte Carlo impact probability heatmap using SBDB covariance data.
     
@@ -918,85 +1103,218 @@ async def monte_carlo_impact_map(request: MonteCarloImpactRequest) -> Dict:
         request: Contains asteroid_id, asteroid_params, samples count, bin_size_deg
     
     Returns:
-        Heatmap data with impact probability distribution across Earth's surface
+        Heatmap data with impact probability distribution across Earth's surface.
+        With precision="u16" the heatmap is columnar and probabilities are
+        quantized: probability = probability_u16 / 65535 * probability_scale
     """
     try:
-        from app.physics.gpu_accelerated import GPUAcceleratedSimulator
-        from app.services.nasa.official_apis import OfficialNASAAPIService
-        
         start_time = time.time()
         
         # Fetch SBDB data with covariance
-        async with OfficialNASAAPIService(
-            settings.nasa_api_key,
-            settings.nasa_neo_api_url,
-            settings.nasa_sbdb_api_url
-        ) as nasa_service:
-            sbdb_data = await nasa_service.get_sbdb_asteroid_details(
-                request.asteroid_id,
-                include_covariance=True
-            )
+        sbdb_data = await _get_sbdb_with_covariance(request.asteroid_id)
+        return _run_impact_map(request, sbdb_data, gpu_simulator, start_time)
         
-        if not sbdb_data:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Asteroid '{request.asteroid_id}' not found in NASA SBDB"
-            )
-        
-        keplerian_elements = sbdb_data.get("keplerian_elements")
-        covariance = sbdb_data.get("covariance")
-        
-        if not keplerian_elements:
-            raise HTTPException(
-                status_code=400,
-                detail="Orbital elements not available for this asteroid"
-            )
-        
-        if not covariance:
-            raise HTTPException(
-                status_code=400,
-                detail="Covariance data not available for this asteroid. "
-                       "Monte Carlo analysis requires orbital uncertainty information."
-            )
-        
-        # Prepare asteroid parameters
-        params_dict = {
-            'diameter': request.asteroid_params.diameter,
-            'velocity': request.asteroid_params.velocity,
-            'density': request.asteroid_params.density,
-            'angle': request.asteroid_params.angle
-        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Monte Carlo impact map failed: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/monte-carlo-impact-map/batch")
+async def monte_carlo_impact_map_batch(
+    requests: List[MonteCarloImpactRequest],
+    gpu_simulator: GPUAcceleratedSimulator = Depends(get_gpu_simulator)
+) -> Dict:
+    """
+    Monte Carlo impact heatmaps for a list of requests (parameter sweeps).
+    
+    Each distinct asteroid is fetched from SBDB once, concurrently, and its
+    covariance is factorized once for every request that names it. Results
+    come back in request order; a request that fails (unknown asteroid, no
+    covariance) gets an error entry instead of failing the whole batch.
+    """
+    if not requests:
+        raise HTTPException(status_code=400, detail="Batch must contain at least one request")
+    if len(requests) > MONTE_CARLO_BATCH_MAX:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Batch is limited to {MONTE_CARLO_BATCH_MAX} requests"
+        )
+    
+    try:
+        start_time = time.time()
         
-        # Run Monte Carlo simulation
-        gpu_sim = GPUAcceleratedSimulator()
-        mc_result = gpu_sim.monte_carlo_impact_map(
-            nominal_elements=keplerian_elements,
-            covariance=covariance,
-            asteroid_params=params_dict,
-            samples=request.samples,
-            bin_size_deg=request.bin_size_deg,
-            seed=request.random_seed
+        asteroid_ids = list(dict.fromkeys(r.asteroid_id for r in requests))
+        fetched = await asyncio.gather(
+            *(_get_sbdb_with_covariance(asteroid_id) for asteroid_id in asteroid_ids),
+            return_exceptions=True
         )
+        sbdb_by_id = dict(zip(asteroid_ids, fetched))
         
-        total_time = time.time() - start_time
+        # The sweeps are CPU-bound; keep them off the event loop
+        results = await asyncio.to_thread(
+            _run_impact_map_batch, requests, sbdb_by_id, gpu_simulator
+        )
         
         return {
             "status": "success",
-            "asteroid_id": request.asteroid_id,
-            "asteroid_name": sbdb_data.get("object_name", "Unknown"),
-            "orbital_elements": keplerian_elements,
-            "monte_carlo_results": mc_result,
+            "results": results,
             "metadata": {
-                "total_computation_time_ms": total_time * 1000,
-                "data_source": "NASA_SBDB_Official",
-                "covariance_epoch_jd": covariance.get("epoch_jd"),
-                "disclaimer": "This is a statistical estimate based on orbital uncertainties. "
-                             "Actual impact probability and location depend on many factors."
+                "requests": len(requests),
+                "unique_asteroids": len(asteroid_ids),
+                "total_computation_time_ms": (time.time() - start_time) * 1000
             }
         }
         
-    except HTTPException:
-        raise
     except Exception as e:
-        logger.error(f"Monte Carlo impact map failed: {e}", exc_info=True)
+        logger.error(f"Monte Carlo impact map batch failed: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
+
+
+def _run_impact_map_batch(
+    requests: List[MonteCarloImpactRequest],
+    sbdb_by_id: Dict[str, object],
+    gpu_simulator: GPUAcceleratedSimulator
+) -> List[Dict]:
+    """
+    /monte-carlo-impact-map responses for a batch, in request order
+    
+    Requests naming the same asteroid share one stacked sample draw and
+    covariance matmul; a group that fails gets an error entry per request.
+    """
+    groups: Dict[str, List[int]] = {}
+    for index, request in enumerate(requests):
+        groups.setdefault(request.asteroid_id, []).append(index)
+    
+    results: List[Optional[Dict]] = [None] * len(requests)
+    for asteroid_id, indices in groups.items():
+        group = [requests[index] for index in indices]
+        sbdb_data = sbdb_by_id[asteroid_id]
+        try:
+            if isinstance(sbdb_data, Exception):
+                raise sbdb_data
+            group_results = _run_impact_map_group(group, sbdb_data, gpu_simulator)
+        except HTTPException as e:
+            group_results = [
+                {"status": "error", "asteroid_id": asteroid_id, "detail": e.detail}
+                for _ in group
+            ]
+        except Exception as e:
+            logger.warning(f"Monte Carlo impact map failed for {asteroid_id}: {e}")
+            group_results = [
+                {"status": "error", "asteroid_id": asteroid_id, "detail": str(e)}
+                for _ in group
+            ]
+        for index, result in zip(indices, group_results):
+            results[index] = result
+    return results
+
+
+def _run_impact_map_group(
+    requests: List[MonteCarloImpactRequest],
+    sbdb_data: Dict,
+    gpu_simulator: GPUAcceleratedSimulator
+) -> List[Dict]:
+    """_run_impact_map for requests that all name the same asteroid"""
+    start_time = time.time()
+    keplerian_elements, covariance = _impact_map_inputs(requests[0], sbdb_data)
+    
+    mc_results = gpu_simulator.monte_carlo_impact_maps(
+        nominal_elements=keplerian_elements,
+        covariance=covariance,
+        runs=[(r.samples, r.random_seed, r.bin_size_deg, r.binning) for r in requests],
+        covariance_factor=_covariance_factor(requests[0].asteroid_id, covariance)
+    )
+    return [
+        _impact_map_response(request, sbdb_data, mc_result, start_time)
+        for request, mc_result in zip(requests, mc_results)
+    ]
+
+
+def _run_impact_map(
+    request: MonteCarloImpactRequest,
+    sbdb_data: Dict,
+    gpu_simulator: GPUAcceleratedSimulator,
+    start_time: float
+) -> Dict:
+    """Validate an SBDB record and build the /monte-carlo-impact-map response for it"""
+    keplerian_elements, covariance = _impact_map_inputs(request, sbdb_data)
+    
+    # Prepare asteroid parameters
+    params_dict = {
+        'diameter': request.asteroid_params.diameter,
+        'velocity': request.asteroid_params.velocity,
+        'density': request.asteroid_params.density,
+        'angle': request.asteroid_params.angle
+    }
+    
+    # Run Monte Carlo simulation
+    mc_result = gpu_simulator.monte_carlo_impact_map(
+        nominal_elements=keplerian_elements,
+        covariance=covariance,
+        asteroid_params=params_dict,
+        samples=request.samples,
+        bin_size_deg=request.bin_size_deg,
+        seed=request.random_seed,
+        covariance_factor=_covariance_factor(request.asteroid_id, covariance),
+        binning=request.binning
+    )
+    return _impact_map_response(request, sbdb_data, mc_result, start_time)
+
+
+def _impact_map_inputs(request: MonteCarloImpactRequest, sbdb_data: Dict) -> Tuple[Dict, Dict]:
+    """Keplerian elements and covariance of an SBDB record, or the HTTP error for it"""
+    if not sbdb_data:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Asteroid '{request.asteroid_id}' not found in NASA SBDB"
+        )
+    
+    keplerian_elements = sbdb_data.get("keplerian_elements")
+    covariance = sbdb_data.get("covariance")
+    
+    if not keplerian_elements:
+        raise HTTPException(
+            status_code=400,
+            detail="Orbital elements not available for this asteroid"
+        )
+    
+    if not covariance:
+        raise HTTPException(
+            status_code=400,
+            detail="Covariance data not available for this asteroid. "
+                   "Monte Carlo analysis requires orbital uncertainty information."
+        )
+    return keplerian_elements, covariance
+
+
+def _impact_map_response(
+    request: MonteCarloImpactRequest,
+    sbdb_data: Dict,
+    mc_result: Dict,
+    start_time: float
+) -> Dict:
+    """/monte-carlo-impact-map response around a Monte Carlo result"""
+    keplerian_elements = sbdb_data["keplerian_elements"]
+    covariance = sbdb_data["covariance"]
+    if request.precision == "u16":
+        mc_result["heatmap"] = _quantize_heatmap(mc_result["heatmap"])
+    
+    total_time = time.time() - start_time
+    
+    return {
+        "status": "success",
+        "asteroid_id": request.asteroid_id,
+        "asteroid_name": sbdb_data.get("object_name", "Unknown"),
+        "orbital_elements": keplerian_elements,
+        "monte_carlo_results": mc_result,
+        "metadata": {
+            "total_computation_time_ms": total_time * 1000,
+            "data_source": "NASA_SBDB_Official",
+            "covariance_epoch_jd": covariance.get("epoch_jd"),
+            "disclaimer": "This is a statistical estimate based on orbital uncertainties. "
+                         "Actual impact probability and location depend on many factors."
+        }
+    }
+
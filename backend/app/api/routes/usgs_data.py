@@ -2,22 +2,27 @@
 USGS data API routes for earthquake correlation
 """
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from typing import List, Dict
 import logging
 
 from app.services.usgs.earthquake_service import USGSEarthquakeService
-from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/usgs", tags=["usgs-data"])
 
 
+def get_usgs_service(request: Request) -> USGSEarthquakeService:
+    """Dependency returning the USGS client (and its keep-alive session) from the app lifespan"""
+    return request.app.state.usgs
+
+
 @router.get("/earthquakes/recent")
 async def get_recent_earthquakes(
     min_magnitude: float = Query(default=6.0, ge=0, le=10),
-    limit: int = Query(default=20, ge=1, le=100)
+    limit: int = Query(default=20, ge=1, le=100),
+    usgs: USGSEarthquakeService = Depends(get_usgs_service)
 ) -> Dict:
     """
     Get recent major earthquakes from USGS
@@ -27,12 +32,11 @@ async def get_recent_earthquakes(
         limit: Maximum number of results
     """
     try:
-        async with USGSEarthquakeService(settings.usgs_earthquake_api_url) as usgs:
-            earthquakes = await usgs.get_reference_earthquakes(
-                min_magnitude=min_magnitude,
-                max_magnitude=9.5,
-                limit=limit
-            )
+        earthquakes = await usgs.get_reference_earthquakes(
+            min_magnitude=min_magnitude,
+            max_magnitude=9.5,
+            limit=limit
+        )
         
         return {
             "status": "success",
@@ -54,10 +58,9 @@ async def convert_energy_to_magnitude(energy_joules: float) -> Dict:
         energy_joules: Impact energy in joules
     """
     try:
-        usgs = USGSEarthquakeService(settings.usgs_earthquake_api_url)
-        
-        magnitude_data = usgs.impact_energy_to_seismic_magnitude(energy_joules)
-        damage_scale = usgs.get_earthquake_damage_description(
+        # Pure scaling-law lookups, no USGS client needed
+        magnitude_data = USGSEarthquakeService.impact_energy_to_seismic_magnitude(energy_joules)
+        damage_scale = USGSEarthquakeService.get_earthquake_damage_description(
             magnitude_data['equivalent_magnitude']
         )
         
@@ -76,7 +79,8 @@ async def convert_energy_to_magnitude(energy_joules: float) -> Dict:
 @router.get("/seismic/similar/{magnitude}")
 async def find_similar_earthquakes(
     magnitude: float,
-    tolerance: float = Query(default=0.5, ge=0.1, le=2.0)
+    tolerance: float = Query(default=0.5, ge=0.1, le=2.0),
+    usgs: USGSEarthquakeService = Depends(get_usgs_service)
 ) -> Dict:
     """
     Find historical earthquakes with similar magnitude
@@ -86,8 +90,7 @@ async def find_similar_earthquakes(
         tolerance: Magnitude tolerance for matching
     """
     try:
-        async with USGSEarthquakeService(settings.usgs_earthquake_api_url) as usgs:
-            similar = await usgs.find_similar_magnitude_earthquakes(magnitude, tolerance)
+        similar = await usgs.find_similar_magnitude_earthquakes(magnitude, tolerance)
         
         return {
             "status": "success",
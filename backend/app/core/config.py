@@ -3,7 +3,7 @@ Application configuration using Pydantic settings
 Loads from environment variables with validation
 """
 
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from functools import lru_cache
 from typing import Optional
 
@@ -36,9 +36,15 @@ class Settings(BaseSettings):
     api_host: str = "0.0.0.0"
     api_port: int = 8000
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+    # Ocean/land lookups kept per ~30 arc-second cell (BATHYMETRY_CACHE_SIZE)
+    bathymetry_cache_size: int = 65536
+    
+    # /impact worker processes (SIMULATION_WORKERS), capped at the CPU count;
+    # each one imports numpy, numba and the physics modules
+    simulation_workers: int = 2
+    
+    # Read once at import; frozen so the shared instance can't drift at runtime
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=False, frozen=True)
 
 
 @lru_cache()
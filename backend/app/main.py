@@ -3,12 +3,20 @@ Main FastAPI application for Meteor Madness Simulator
 NASA Space Apps Challenge 2025
 """
 
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 import logging
 
 from app.core.config import settings
 from app.api.routes import simulation, nasa_data, usgs_data, real_asteroids, gee_routes, earthquake_comparison
+from app.physics.gpu_accelerated import get_gpu_simulator
+from app.services.gee_service import GoogleEarthEngineService
+from app.services.nasa.http_session import close_nasa_session
+from app.services.usgs.earthquake_service import USGSEarthquakeService
 
 # Configure logging
 logging.basicConfig(
@@ -18,13 +26,52 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup and shutdown"""
+    logger.info("=" * 60)
+    logger.info("Meteor Madness Simulator API Starting")
+    logger.info("=" * 60)
+    logger.info(f"Debug mode: {settings.debug}")
+    logger.info(f"NASA API configured: {bool(settings.nasa_api_key)}")
+    logger.info(f"USGS API configured: {bool(settings.usgs_earthquake_api_url)}")
+    
+    # Earth Engine auth runs off the event loop, once per worker
+    app.state.gee_service = GoogleEarthEngineService()
+    await app.state.gee_service.initialize_async()
+    
+    # Check CUDA availability on the shared engine, and create the shared GPU
+    # simulator now so CUDA context setup and kernel builds happen before the
+    # first request instead of during it
+    if simulation.physics_engine.device_available:
+        logger.info("✅ CUDA GPU available for physics calculations")
+    else:
+        logger.info("ℹ️ Using CPU for physics calculations")
+    await asyncio.to_thread(get_gpu_simulator().warm_up)
+    simulation.start_process_pool()
+    
+    logger.info("=" * 60)
+    
+    # One USGS client (and HTTP session) for the lifetime of the app
+    async with USGSEarthquakeService(settings.usgs_earthquake_api_url) as usgs:
+        app.state.usgs = usgs
+        yield
+    
+    logger.info("Meteor Madness Simulator API shutting down")
+    await close_nasa_session()
+    simulation.shutdown_process_pool()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Meteor Madness Simulator API",
     description="Interactive asteroid impact visualization and simulation tool using NASA and USGS data",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Configure CORS for frontend
@@ -36,6 +83,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Heatmaps, trajectories and earthquake lists compress well; skip tiny bodies
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Include routers
 app.include_router(simulation.router, prefix="/api")
 app.include_router(nasa_data.router, prefix="/api")
@@ -77,36 +127,6 @@ async def health_check():
     }
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Application startup"""
-    logger.info("=" * 60)
-    logger.info("Meteor Madness Simulator API Starting")
-    logger.info("=" * 60)
-    logger.info(f"Debug mode: {settings.debug}")
-    logger.info(f"NASA API configured: {bool(settings.nasa_api_key)}")
-    logger.info(f"USGS API configured: {bool(settings.usgs_earthquake_api_url)}")
-    
-    # Check CUDA availability
-    try:
-        from app.physics.impact_physics import EnhancedPhysicsEngine
-        engine = EnhancedPhysicsEngine()
-        if engine.device_available:
-            logger.info("✅ CUDA GPU available for physics calculations")
-        else:
-            logger.info("ℹ️ Using CPU for physics calculations")
-    except Exception as e:
-        logger.warning(f"Physics engine check failed: {e}")
-    
-    logger.info("=" * 60)
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Application shutdown"""
-    logger.info("Meteor Madness Simulator API shutting down")
-
-
 if __name__ == "__main__":
     import uvicorn
     
@@ -115,5 +135,6 @@ if __name__ == "__main__":
         host=settings.api_host,
         port=settings.api_port,
         reload=settings.debug,
+        loop="auto",  # uvloop when installed (not available on Windows)
         log_level="info" if settings.debug else "warning"
     )
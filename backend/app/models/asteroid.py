@@ -3,13 +3,15 @@
 Pydantic models for asteroid and impact data
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional, List, Dict
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, List, Dict, Literal
 from datetime import datetime
 
 
 class AsteroidParameters(BaseModel):
     """Input parameters for asteroid impact simulation"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     diameter: float = Field(..., description="Asteroid diameter in meters", gt=0)
     velocity: float = Field(..., description="Impact velocity in km/s", gt=0, le=100)
     density: float = Field(2500.0, description="Asteroid density in kg/m³", gt=0)
@@ -19,6 +21,8 @@ class AsteroidParameters(BaseModel):
 
 class OrbitalElements(BaseModel):
     """Keplerian orbital elements"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     eccentricity: float = Field(..., description="Orbital eccentricity")
     semi_major_axis_au: float = Field(..., description="Semi-major axis in AU")
     inclination_deg: float = Field(..., description="Orbital inclination in degrees")
@@ -29,6 +33,8 @@ class OrbitalElements(BaseModel):
 
 class OrbitalIntercept(BaseModel):
     """Derived Earth-intercept parameters from orbital elements"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     entry_velocity_km_s: float = Field(..., description="Relative entry velocity at Earth in km/s")
     entry_angle_deg: float = Field(..., description="Entry angle relative to horizontal plane")
     latitude: float = Field(..., description="Estimated impact latitude in degrees", ge=-90, le=90)
@@ -40,6 +46,8 @@ class OrbitalIntercept(BaseModel):
 
 class ImpactResults(BaseModel):
     """Results from impact physics simulation"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     crater_diameter: float = Field(..., description="Crater diameter in meters")
     crater_depth: float = Field(..., description="Crater depth in meters")
     kinetic_energy_joules: float = Field(..., description="Impact kinetic energy in joules")
@@ -79,6 +87,8 @@ class NASAAsteroidData(BaseModel):
 
 class SimulationRequest(BaseModel):
     """Request for impact simulation"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     asteroid_params: AsteroidParameters
     location_lat: Optional[float] = Field(None, description="Impact latitude", ge=-90, le=90)
     location_lon: Optional[float] = Field(None, description="Impact longitude", ge=-180, le=180)
@@ -89,6 +99,8 @@ class SimulationRequest(BaseModel):
 
 class SimulationResponse(BaseModel):
     """Response from impact simulation"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     impact_results: ImpactResults
     trajectory_data: Optional[List[Dict]] = None
     location: Optional[Dict] = None
@@ -98,8 +110,16 @@ class SimulationResponse(BaseModel):
 
 class MonteCarloImpactRequest(BaseModel):
     """Request payload for Monte Carlo impact probability heatmap"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     asteroid_id: str = Field(..., description="NASA SBDB asteroid identifier or designation")
     asteroid_params: AsteroidParameters
     samples: int = Field(500, description="Number of Monte Carlo orbital samples", ge=100, le=10000)
     bin_size_deg: float = Field(5.0, description="Heatmap bin size in degrees", ge=0.5, le=30.0)
+    binning: Literal["square", "hex"] = Field("hex", description="Heatmap cells: equal-area hexagons or lat/lon squares")
+    precision: Literal["f32", "u16"] = Field(
+        "f32",
+        description="Heatmap encoding: 'f32' returns one object per cell with float probabilities; "
+                    "'u16' returns columnar arrays with probability = probability_u16 / 65535 * probability_scale"
+    )
     random_seed: Optional[int] = Field(None, description="Optional random seed for reproducibility")
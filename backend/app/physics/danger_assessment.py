@@ -10,11 +10,139 @@ Replaces USGS earthquake comparison with actual impact effects:
 
 import math
 import logging
-from typing import Dict, Optional, List
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, Final, Optional, List, Tuple
 from enum import Enum
 
+import numpy as np
+from numba import njit, prange
+
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
+# Glasstone & Dolan (1977) overpressure zone radii, km per MT^(1/3)
+OVERPRESSURE_ZONES = (
+    "total_destruction_km",  # >20 psi: everything destroyed, 100% fatalities
+    "severe_damage_km",  # 5-20 psi: buildings collapse, ~50% fatalities
+    "moderate_damage_km",  # 1-5 psi: windows shatter, some building damage, ~5% fatalities
+    "light_damage_km",  # 0.5-1 psi: windows break, minor injuries
+)
+_DAMAGE_COEFFS_TUPLE = (0.5, 1.5, 3.0, 5.0)
+_DAMAGE_COEFFS = np.array(_DAMAGE_COEFFS_TUPLE)
+
+# Thermal burns radius is 1.2 * (0.3 * E)^0.4 km = _THERMAL_COEFF * E^0.4
+_THERMAL_COEFF = 1.2 * 0.3 ** 0.4
+
+# Fraction killed in the fireball, total destruction, severe, moderate and
+# light damage zones
+_ZONE_FATALITY_RATES = (1.0, 1.0, 0.5, 0.05, 0.001)
+
+_PI_OVER_3 = math.pi / 3  # cone volume factor
+
+# Stratospheric dust fraction by energy band (< 100 MT, < 10,000 MT, above)
+_FRAC_BOUNDS = np.array([100.0, 10000.0])
+_FRAC_TABLE = np.array([0.001, 0.01, 0.1])
+
+# Impact winter duration by temperature drop (< 1 °C, < 10 °C, above)
+_DURATION_BOUNDS = (1.0, 10.0)
+_DURATION_VALUES = ("days to weeks", "months to years", "years to decades")
+
+# Distances for fallback tsunami wave heights and arrival times
+_TSUNAMI_DISTANCES_KM = np.array([10, 50, 100, 500, 1000, 5000], dtype=np.float64)
+_TSUNAMI_ARRIVAL_KM = np.array([100, 500, 1000], dtype=np.float64)
+
+
+@njit(cache=True, fastmath=True)
+def _casualties_from_radii(radii: np.ndarray, density: float):
+    """
+    Deaths, injured and affected population for uniform density
+    
+    radii holds the fireball, total destruction, severe, moderate and light
+    damage radii (km); zones are annuli of the circles, with light damage
+    counted as neither deaths nor injuries.
+    """
+    fireball_area = math.pi * radii[0] * radii[0]
+    total_dest_area = math.pi * radii[1] * radii[1] - fireball_area
+    severe_area = math.pi * radii[2] * radii[2] - total_dest_area - fireball_area
+    moderate_area = math.pi * radii[3] * radii[3] - severe_area - total_dest_area - fireball_area
+    
+    immediate_deaths = (
+        fireball_area * density * 1.0 +
+        total_dest_area * density * 1.0 +
+        severe_area * density * 0.5 +
+        moderate_area * density * 0.05
+    )
+    injured = (
+        severe_area * density * 0.4 +
+        moderate_area * density * 0.3
+    )
+    total_affected = (fireball_area + total_dest_area + severe_area + moderate_area) * density
+    return immediate_deaths, injured, total_affected
+
+
+@njit(cache=True, fastmath=True)
+def _atmo_kernel(energy_mt: float, diameter_m: float, is_ocean: bool, earth_surface_m2: float):
+    """
+    Stratospheric dust (kg), global dust loading (kg/m²), temperature drop
+    (°C) and fire soot (kg) for one impact; Toon et al. (1997) scaling
+    """
+    # Dust injected into stratosphere (kg)
+    # Scales with crater volume and ejecta velocity
+    crater_volume_m3 = _PI_OVER_3 * ((diameter_m * 10) ** 2) * (diameter_m * 10 * 0.1)
+    ejecta_mass_kg = crater_volume_m3 * 2500  # crustal density
+    
+    # Fraction that reaches stratosphere (> 20km altitude)
+    stratospheric_fraction = _FRAC_TABLE[np.searchsorted(_FRAC_BOUNDS, energy_mt, side='right')]
+    stratospheric_dust_kg = ejecta_mass_kg * stratospheric_fraction
+    
+    # Global dust loading (kg/m² of Earth surface)
+    dust_loading = stratospheric_dust_kg / earth_surface_m2
+    
+    # Temperature drop (rough estimate)
+    # From impact winter studies: ~0.01°C per 1 mg/m² of stratospheric dust
+    temp_drop_c = dust_loading * 1000 * 0.01  # Convert kg to mg
+    
+    # Soot from fires (land impacts)
+    soot_mass_kg = 0.0
+    if not is_ocean and energy_mt > 1:
+        # Wildfires ignited by thermal radiation
+        fire_area_km2 = math.pi * (1.2 * (energy_mt ** 0.4)) ** 2
+        soot_mass_kg = fire_area_km2 * 1e6 * 0.01  # ~0.01 kg/m² soot
+    
+    return stratospheric_dust_kg, dust_loading, temp_drop_c, soot_mass_kg
+
+
+@njit(parallel=True, cache=True)
+def _atmo_batch_kernel(energies_mt: np.ndarray, diameters_m: np.ndarray,
+                       is_ocean: np.ndarray, earth_surface_m2: float) -> np.ndarray:
+    """
+    _atmo_kernel over N impacts, parallel across impacts
+    
+    Returns a (4, N) float32 array: dust (kg), loading (kg/m²), temperature
+    drop (°C) and soot (kg), one contiguous row each.
+    """
+    n = energies_mt.shape[0]
+    output = np.empty((4, n), dtype=np.float32)
+    for i in prange(n):
+        dust, loading, temp_drop, soot = _atmo_kernel(
+            energies_mt[i], diameters_m[i], is_ocean[i], earth_surface_m2
+        )
+        output[0, i] = dust
+        output[1, i] = loading
+        output[2, i] = temp_drop
+        output[3, i] = soot
+    return output
+
+
+# Compile (or load from the on-disk cache) at import
+_casualties_from_radii(np.ones(5), 60.0)
+_atmo_kernel(1.0, 100.0, False, 5.1e14)
+_atmo_batch_kernel(np.ones(1), np.full(1, 100.0), np.zeros(1, dtype=np.bool_), 5.1e14)
+
 # Import population service
 try:
     from app.services.population_service import get_population_service
@@ -40,6 +168,25 @@ except ImportError:
     TSUNAMI_MODEL_AVAILABLE = False
 
 
+# Ocean/land lookups are cached per 1/120° cell (30 arc-seconds, ~0.9 km)
+OCEAN_LOOKUP_CELLS_PER_DEG = 120
+
+
+@lru_cache(maxsize=settings.bathymetry_cache_size)
+def _is_ocean_cached(lat_q: int, lon_q: int) -> bool:
+    """Bathymetry ocean check at the centre of a quantized lat/lon cell"""
+    bathymetry_service = get_bathymetry_service()
+    is_ocean = bathymetry_service.is_ocean(
+        lat_q / OCEAN_LOOKUP_CELLS_PER_DEG,
+        lon_q / OCEAN_LOOKUP_CELLS_PER_DEG
+    )
+    logger.info(
+        f"Bathymetry check: ({lat_q / OCEAN_LOOKUP_CELLS_PER_DEG:.2f}, "
+        f"{lon_q / OCEAN_LOOKUP_CELLS_PER_DEG:.2f}) -> {'ocean' if is_ocean else 'land'}"
+    )
+    return is_ocean
+
+
 class ImpactSeverity(str, Enum):
     """Impact severity classification based on energy"""
     NEGLIGIBLE = "negligible"  # < 1 KT (burns up in atmosphere)
@@ -49,17 +196,136 @@ class ImpactSeverity(str, Enum):
     GLOBAL = "global"  # > 10,000 MT (mass extinction potential)
 
 
+# Severity class upper bounds (MT TNT) and the class for each interval
+_SEVERITY_THRESHOLDS = (0.001, 1.0, 100.0, 10000.0)
+_SEVERITY_VALUES = (
+    ImpactSeverity.NEGLIGIBLE,
+    ImpactSeverity.LOCAL,
+    ImpactSeverity.REGIONAL,
+    ImpactSeverity.CONTINENTAL,
+    ImpactSeverity.GLOBAL,
+)
+_SEVERITY_NAMES = np.array([severity.value for severity in _SEVERITY_VALUES])
+
+# Human-scale comparisons by energy (MT TNT); each entry covers energies
+# below its threshold, the last entry everything above. Most are constant
+# strings; the two that quote the energy are formatted on demand.
+_COMPARISON_THRESHOLDS = (0.001, 0.015, 1, 15, 100, 1000, 100000)
+_COMPARISONS = (
+    "Large firework",
+    "Small tactical nuclear weapon (Hiroshima was ~0.015 MT)",
+    lambda energy_mt: f"{int(energy_mt * 1000)} Kilotons - Large nuclear weapon",
+    "Tunguska event (1908) - Leveled 2,000 km² of forest",
+    lambda energy_mt: f"~{int(energy_mt)} times Hiroshima - Major city destroyer",
+    "Tsar Bomba scale - Largest nuclear weapon ever tested (50 MT)",
+    "Continental devastation - Multi-state destruction",
+    "Chicxulub scale - Mass extinction event (killed the dinosaurs)",
+)
+
+
+# Canned result for NEGLIGIBLE impacts (< 1 KT): the body burns up in the
+# atmosphere, so zones, casualties, tsunami, ejecta and dust are all zero
+# and none of the population/bathymetry lookups are needed. Read-only at the
+# top level; the section dicts are shared by every result and stay plain
+# dicts so orjson can serialize them, so treat them as read-only too.
+_NEGLIGIBLE_RESULT_TEMPLATE = MappingProxyType({
+    "severity": ImpactSeverity.NEGLIGIBLE,
+    "impact_type": "land",  # filled in per call
+    "damage_zones": {
+        **{name: 0.0 for name in OVERPRESSURE_ZONES},
+        "thermal_burns_km": 0.0,
+        "fireball_km": 0.0,
+    },
+    "casualties": {
+        "immediate_deaths_estimate": 0,
+        "injured_estimate": 0,
+        "affected_population": 0,
+        "data_source": "NEGLIGIBLE_IMPACT",
+        "note": "Object burns up in the atmosphere - no ground casualties expected"
+    },
+    "tsunami": None,
+    "atmospheric_effects": {
+        "stratospheric_dust_kg": 0.0,
+        "global_dust_loading_mg_m2": 0.0,
+        "temperature_drop_celsius": 0.0,
+        "effect_duration": _DURATION_VALUES[0],
+        "soot_from_fires_kg": None,
+        "sunlight_reduction_percent": 0.0,
+        "note": "Large impacts cause 'impact winter' - global cooling from stratospheric dust"
+    },
+    "ejecta": {
+        "ejecta_blanket_radius_km": 0.0,
+        "ballistic_range_km": 0.0,
+        "ejecta_thickness_at_crater_m": 0.0,
+        "global_fires_from_reentry": False,
+        "note": "No crater or ejecta - object burns up in the atmosphere"
+    },
+    "global_effects": {
+        "is_global_catastrophe": False,
+        "mass_extinction_risk": False,
+        "crop_failure_risk": False,
+        "global_famine_risk": False,
+        "civilization_threat": False,
+        "description": "No ground effects - object burns up in the atmosphere"
+    },
+    "comparable_to": _COMPARISONS[0],
+})
+
+
+# Global effects only change where energy (MT) or temperature drop (°C)
+# passes one of these bounds; bisect_left gives the number of bounds the
+# value strictly exceeds, matching the > tests below
+_GLOBAL_ENERGY_BOUNDS = (100, 10000, 50000, 100000)
+_GLOBAL_TEMP_BOUNDS = (2, 5)
+_GLOBAL_EFFECT_FIELDS = (
+    "is_global_catastrophe",
+    "mass_extinction_risk",
+    "crop_failure_risk",
+    "global_famine_risk",
+    "civilization_threat",
+    "description",
+)
+
+
+@lru_cache(maxsize=None)
+def _global_effects_cached(energy_band: int, temp_band: int) -> Tuple[bool, bool, bool, bool, bool, str]:
+    """Global effect flags and description for an energy/temperature band"""
+    is_global = energy_band >= 2  # > 10,000 MT = global effects
+    
+    if is_global:
+        description = "Global catastrophe - worldwide climate disruption and mass casualties"
+    elif energy_band >= 1:
+        description = "Continental disaster - regional devastation with global economic impact"
+    else:
+        description = "Regional disaster - localized destruction"
+    
+    return (
+        is_global,
+        energy_band >= 4,  # > 100,000 MT (Chicxulub was ~100 million MT)
+        temp_band >= 1,  # crop failure above 2 °C
+        temp_band >= 2,  # famine above 5 °C
+        energy_band >= 3,  # civilization threat above 50,000 MT
+        description,
+    )
+
+
 class DangerAssessment:
     """
     Calculate comprehensive impact dangers using established scientific models
     """
     
+    # Stateless: all state is class-level constants or module caches
+    __slots__ = ()
+    
     # Constants
-    EARTH_RADIUS_KM = 6371.0
-    OCEAN_COVERAGE = 0.71  # 71% of Earth is water
+    EARTH_RADIUS_KM: Final = 6371.0
+    EARTH_SURFACE_M2: Final = 4 * math.pi * (EARTH_RADIUS_KM * 1000) ** 2
+    OCEAN_COVERAGE: Final = 0.71  # 71% of Earth is water
     
-    def __init__(self):
-        pass
+    @classmethod
+    def clear_caches(cls) -> None:
+        """Drop cached ocean/land lookups (e.g. after swapping the GEBCO file)"""
+        _is_ocean_cached.cache_clear()
     
     def assess_impact(
         self,
@@ -93,12 +359,20 @@ class DangerAssessment:
         
         # Check if ocean or land impact
         is_ocean_impact = self._is_ocean_impact(latitude, longitude)
+        impact_type = "ocean" if is_ocean_impact else "land"
+        
+        # Sub-kiloton bodies burn up in the atmosphere; skip the lookups
+        if severity == ImpactSeverity.NEGLIGIBLE:
+            return _NEGLIGIBLE_RESULT_TEMPLATE | {"impact_type": impact_type}
         
         # Calculate damage zones
         damage_zones = self._calculate_damage_zones(energy_mt_tnt, crater_diameter_m)
         
         # Calculate casualties (rough estimate)
-        casualties = self._estimate_casualties(damage_zones, latitude, longitude)
+        casualties = self._estimate_casualties(
+            damage_zones, latitude, longitude,
+            expand_buffer=severity == ImpactSeverity.LOCAL
+        )
         
         # Calculate tsunami if ocean impact
         tsunami_data = None
@@ -128,7 +402,7 @@ class DangerAssessment:
         
         return {
             "severity": severity,
-            "impact_type": "ocean" if is_ocean_impact else "land",
+            "impact_type": impact_type,
             "damage_zones": damage_zones,
             "casualties": casualties,
             "tsunami": tsunami_data,
@@ -138,18 +412,72 @@ class DangerAssessment:
             "comparable_to": self._get_comparison(energy_mt_tnt)
         }
     
+    def assess_impact_batch(
+        self,
+        energies_mt: np.ndarray,
+        crater_diameters_m: np.ndarray,
+        latitudes: np.ndarray,
+        longitudes: np.ndarray,
+        asteroid_diameters_m: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """
+        Scalar danger metrics for N impact scenarios as arrays
+        
+        Severity, damage zones and atmospheric effects are computed on whole
+        arrays; only the ocean check and casualty estimate, which query the
+        bathymetry and population services, run per scenario. Tsunami,
+        ejecta and report text stay with assess_impact.
+        
+        Returns:
+            Dict of length-N arrays: severity, is_ocean, the damage_zones
+            radii (km), deaths/injured/affected estimates and the
+            atmospheric dust, loading, temperature drop and soot figures.
+            Physical quantities are float32, which is far finer than the
+            scaling laws; counts are int64 since global-scale affected
+            populations overflow int32.
+        """
+        energies_mt = np.asarray(energies_mt, dtype=float)
+        asteroid_diameters_m = np.asarray(asteroid_diameters_m, dtype=float)
+        latitudes = np.asarray(latitudes, dtype=float)
+        longitudes = np.asarray(longitudes, dtype=float)
+        
+        severity = _SEVERITY_NAMES[np.searchsorted(_SEVERITY_THRESHOLDS, energies_mt, side='right')]
+        is_ocean = np.fromiter(
+            map(self._is_ocean_impact, latitudes.tolist(), longitudes.tolist()),
+            dtype=np.bool_,
+            count=energies_mt.size
+        )
+        zones = self.calculate_damage_zones_batch(energies_mt)
+        
+        casualties = list(map(
+            self._estimate_casualties,
+            [{name: radii[i] for name, radii in zones.items()} for i in range(energies_mt.size)],
+            latitudes.tolist(),
+            longitudes.tolist()
+        ))
+        
+        atmospheric = _atmo_batch_kernel(
+            energies_mt, asteroid_diameters_m, is_ocean, self.EARTH_SURFACE_M2
+        )
+        
+        return {
+            "severity": severity,
+            "is_ocean": is_ocean,
+            **{name: radii.astype(np.float32) for name, radii in zones.items()},
+            "immediate_deaths_estimate": np.array(
+                [c["immediate_deaths_estimate"] for c in casualties], dtype=np.int64
+            ),
+            "injured_estimate": np.array([c["injured_estimate"] for c in casualties], dtype=np.int64),
+            "affected_population": np.array([c["affected_population"] for c in casualties], dtype=np.int64),
+            "stratospheric_dust_kg": atmospheric[0],
+            "global_dust_loading_kg_m2": atmospheric[1],
+            "temperature_drop_celsius": atmospheric[2],
+            "soot_from_fires_kg": atmospheric[3],
+        }
+    
     def _classify_severity(self, energy_mt: float) -> str:
         """Classify impact severity based on energy"""
-        if energy_mt < 0.001:
-            return ImpactSeverity.NEGLIGIBLE
-        elif energy_mt < 1.0:
-            return ImpactSeverity.LOCAL
-        elif energy_mt < 100.0:
-            return ImpactSeverity.REGIONAL
-        elif energy_mt < 10000.0:
-            return ImpactSeverity.CONTINENTAL
-        else:
-            return ImpactSeverity.GLOBAL
+        return _SEVERITY_VALUES[bisect_right(_SEVERITY_THRESHOLDS, energy_mt)]
     
     def _is_ocean_impact(self, lat: float, lon: float) -> bool:
         """
@@ -158,10 +486,10 @@ class DangerAssessment:
         """
         # Use real bathymetry data - NO FALLBACK
         if BATHYMETRY_AVAILABLE:
-            bathymetry_service = get_bathymetry_service()
-            is_ocean = bathymetry_service.is_ocean(lat, lon)
-            logger.info(f"Bathymetry check: ({lat:.2f}, {lon:.2f}) -> {'ocean' if is_ocean else 'land'}")
-            return is_ocean
+            return _is_ocean_cached(
+                int(round(lat * OCEAN_LOOKUP_CELLS_PER_DEG)),
+                int(round(lon * OCEAN_LOOKUP_CELLS_PER_DEG))
+            )
         
         raise ImportError("Bathymetry service not available - check h5py installation")
     
@@ -170,38 +498,56 @@ class DangerAssessment:
         Calculate concentric damage zones based on overpressure
         Uses Glasstone & Dolan (1977) nuclear weapons effects scaling
         """
-        # Zone radii in km
-        zones = {}
-        
-        # Total destruction (>20 psi overpressure)
-        # Everything destroyed, 100% fatalities
-        zones["total_destruction_km"] = 0.5 * (energy_mt ** (1/3))
-        
-        # Severe damage (5-20 psi)
-        # Buildings collapse, ~50% fatalities
-        zones["severe_damage_km"] = 1.5 * (energy_mt ** (1/3))
+        # Scalar twin of calculate_damage_zones_batch: one cube root and one
+        # 0.4 power, hoisted, without the numpy round trip
+        cbrt = math.cbrt(energy_mt)
+        p04 = energy_mt ** 0.4
+        
+        zones = {name: coeff * cbrt for name, coeff in zip(OVERPRESSURE_ZONES, _DAMAGE_COEFFS_TUPLE)}
+        zones["thermal_burns_km"] = _THERMAL_COEFF * p04
+        zones["fireball_km"] = 0.09 * p04
+        return zones
+    
+    def calculate_damage_zones_batch(self, energies_mt: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Damage zone radii (km) for an array of impact energies (MT)
         
-        # Moderate damage (1-5 psi)
-        # Windows shatter, some building damage, ~5% fatalities
-        zones["moderate_damage_km"] = 3.0 * (energy_mt ** (1/3))
+        Returns the same keys as a single assessment's damage_zones, each
+        holding an array shaped like energies_mt. One cube root and one 0.4
+        power per energy cover all six zones.
+        """
+        energies_mt = np.asarray(energies_mt, dtype=float)
+        cbrt = np.cbrt(energies_mt)
+        p04 = energies_mt ** 0.4
         
-        # Light damage (0.5-1 psi)
-        # Windows break, minor injuries
-        zones["light_damage_km"] = 5.0 * (energy_mt ** (1/3))
+        overpressure_radii = cbrt[..., None] * _DAMAGE_COEFFS
+        zones = {name: overpressure_radii[..., i] for i, name in enumerate(OVERPRESSURE_ZONES)}
         
-        # Thermal burns (3rd degree)
-        thermal_energy = 0.3 * energy_mt  # 30% thermal radiation
-        zones["thermal_burns_km"] = 1.2 * (thermal_energy ** 0.4)
+        # Thermal burns (3rd degree) from 30% of the energy as thermal
+        # radiation: 1.2 * (0.3 * E)^0.4
+        zones["thermal_burns_km"] = _THERMAL_COEFF * p04
         
         # Fireball radius (vaporization zone)
-        zones["fireball_km"] = 0.09 * (energy_mt ** 0.4)
+        zones["fireball_km"] = 0.09 * p04
         
         return zones
     
-    def _estimate_casualties(self, damage_zones: Dict, lat: float, lon: float) -> Dict:
+    def _estimate_casualties(
+        self,
+        damage_zones: Dict,
+        lat: float,
+        lon: float,
+        expand_buffer: bool = False
+    ) -> Dict:
         """
         Calculate accurate casualties using WorldPop 2020 real population data
         Queries all damage zones and applies appropriate fatality/injury rates
+        
+        With expand_buffer, the zones out to severe damage are queried first,
+        and the moderate and light zones only if the severe annulus added at
+        least 0.1% to the fatality total; otherwise they are left uncounted.
+        Used for LOCAL impacts, where the light damage window is ~90% of the
+        raster read.
         """
         if not POPULATION_DATA_AVAILABLE:
             return self._estimate_casualties_fallback(damage_zones, lat, lon)
@@ -209,24 +555,54 @@ class DangerAssessment:
         try:
             pop_service = get_population_service()
             
-            # Define zone radii to query (sorted smallest to largest)
+            # Blast zones (smallest to largest) plus the thermal burns radius
             zone_radii = [
                 damage_zones["fireball_km"],
                 damage_zones["total_destruction_km"],
                 damage_zones["severe_damage_km"],
                 damage_zones["moderate_damage_km"],
-                damage_zones["light_damage_km"]
+                damage_zones["light_damage_km"],
+                damage_zones["thermal_burns_km"]
             ]
             
-            # Get real population data for all zones
-            pop_data = pop_service.get_population_in_zones(
-                latitude=lat,
-                longitude=lon,
-                zone_radii_km=zone_radii
-            )
+            # Last blast zone of each query. Without the expanding buffer (or
+            # if thermal burns reach past the severe zone) every zone is
+            # queried together, so the population raster is walked once
+            stages = (2, 4) if expand_buffer and zone_radii[5] <= zone_radii[2] else (4,)
             
-            # Extract populations per zone
-            zones = pop_data['zones']
+            pop_data = None
+            for stage in stages:
+                # Zones up to this blast zone, plus thermal
+                radii = zone_radii[:stage + 1] + zone_radii[5:]
+                stage_data = pop_service.get_population_in_zones(
+                    latitude=lat,
+                    longitude=lon,
+                    zone_radii_km=radii,
+                    country_code=pop_data['country_code'] if pop_data else None
+                )
+                if pop_data and 'location_info' in pop_data:
+                    stage_data['location_info'] = pop_data['location_info']
+                pop_data = stage_data
+                
+                # Zones come back sorted by radius; map them to the order
+                # above. The thermal radius can fall anywhere among the blast
+                # radii, so blast annuli are rebuilt from cumulative
+                # populations.
+                order = sorted(range(len(radii)), key=radii.__getitem__)
+                cumulative = [0] * len(radii)
+                for zone, index in zip(pop_data['zones'], order):
+                    cumulative[index] = zone['cumulative_population']
+                
+                # Zones past this stage stay uncounted (empty annuli)
+                cumulative[stage + 1:stage + 1] = [cumulative[stage]] * (4 - stage)
+                
+                deaths = [
+                    (cumulative[i] - (cumulative[i - 1] if i else 0)) * rate
+                    for i, rate in enumerate(_ZONE_FATALITY_RATES[:stage + 1])
+                ]
+                if deaths[-1] < 0.001 * sum(deaths):
+                    break
+            computed_zones = stage + 1
             
             # Fatality rates per zone based on overpressure
             # Fireball: 100% (vaporized)
@@ -235,11 +611,11 @@ class DangerAssessment:
             # Moderate damage (1-5 psi): 5%
             # Light damage (0.5-1 psi): 0.1%
             
-            fireball_pop = zones[0]['annular_population']
-            total_dest_pop = zones[1]['annular_population']
-            severe_pop = zones[2]['annular_population']
-            moderate_pop = zones[3]['annular_population']
-            light_pop = zones[4]['annular_population']
+            fireball_pop = cumulative[0]
+            total_dest_pop = cumulative[1] - cumulative[0]
+            severe_pop = cumulative[2] - cumulative[1]
+            moderate_pop = cumulative[3] - cumulative[2]
+            light_pop = cumulative[4] - cumulative[3]
             
             # Calculate deaths
             immediate_deaths = (
@@ -258,16 +634,10 @@ class DangerAssessment:
                 light_pop * 0.1            # 10% injured
             )
             
-            total_affected = pop_data['total_affected']
+            total_affected = cumulative[4]
             
             # Add thermal burns casualties (overlapping but additional)
-            thermal_radius = damage_zones["thermal_burns_km"]
-            thermal_pop_data = pop_service.get_population_in_zones(
-                latitude=lat,
-                longitude=lon,
-                zone_radii_km=[thermal_radius]
-            )
-            thermal_casualties = int(thermal_pop_data['total_affected'] * 0.1)  # 10% burn injuries
+            thermal_casualties = int(cumulative[5] * 0.1)  # 10% burn injuries
             
             casualties_dict = {
                 "immediate_deaths_estimate": int(immediate_deaths),
@@ -285,6 +655,12 @@ class DangerAssessment:
                 "note": "Using WorldPop 2020 real population data for accurate estimates"
             }
             
+            # Zones the expanding buffer stopped short of
+            if computed_zones < 5:
+                for zone in list(casualties_dict["zone_breakdown"])[computed_zones:]:
+                    casualties_dict["zone_breakdown"][zone]["computed"] = False
+                casualties_dict["note"] += "; outer zones not computed (negligible added fatalities), assumed zero"
+            
             # Add detailed location info (city, state, country name, etc.)
             if 'location_info' in pop_data:
                 casualties_dict['location_info'] = pop_data['location_info']
@@ -297,26 +673,15 @@ class DangerAssessment:
     
     def _estimate_casualties_fallback(self, damage_zones: Dict, lat: float, lon: float) -> Dict:
         """Fallback casualty estimate using average density"""
-        avg_density = 60  # Global average people per km²
-        
-        fireball_area = math.pi * (damage_zones["fireball_km"] ** 2)
-        total_dest_area = math.pi * (damage_zones["total_destruction_km"] ** 2) - fireball_area
-        severe_area = math.pi * (damage_zones["severe_damage_km"] ** 2) - total_dest_area - fireball_area
-        moderate_area = math.pi * (damage_zones["moderate_damage_km"] ** 2) - severe_area - total_dest_area - fireball_area
-        
-        immediate_deaths = (
-            fireball_area * avg_density * 1.0 +
-            total_dest_area * avg_density * 1.0 +
-            severe_area * avg_density * 0.5 +
-            moderate_area * avg_density * 0.05
-        )
-        
-        injured = (
-            severe_area * avg_density * 0.4 +
-            moderate_area * avg_density * 0.3
-        )
+        avg_density = 60.0  # Global average people per km²
         
-        total_affected = (fireball_area + total_dest_area + severe_area + moderate_area) * avg_density
+        radii = np.empty(5)
+        radii[0] = damage_zones["fireball_km"]
+        radii[1] = damage_zones["total_destruction_km"]
+        radii[2] = damage_zones["severe_damage_km"]
+        radii[3] = damage_zones["moderate_damage_km"]
+        radii[4] = damage_zones["light_damage_km"]
+        immediate_deaths, injured, total_affected = _casualties_from_radii(radii, avg_density)
         
         return {
             "immediate_deaths_estimate": int(immediate_deaths),
@@ -385,33 +750,35 @@ class DangerAssessment:
         tsunami_velocity_kmh = 3.6 * math.sqrt(g * water_depth_m)
         
         # Wave heights at various distances (using geometric spreading and energy dissipation)
-        distances_km = [10, 50, 100, 500, 1000, 5000]
-        wave_heights = {}
-        
-        for dist_km in distances_km:
-            dist_m = dist_km * 1000
-            # Simplified geometric spreading: H ~ H0 * sqrt(r0/r)
-            # Where r0 is source radius (crater diameter/2)
-            r0_m = crater_diameter_m / 2
-            if dist_m > r0_m:
-                height_m = h0 * math.sqrt(r0_m / dist_m) * math.exp(-dist_m / 1e6)  # Exponential decay
-                wave_heights[f"{dist_km}_km"] = max(0.1, height_m)
-            else:
-                wave_heights[f"{dist_km}_km"] = h0
+        # Simplified geometric spreading: H ~ H0 * sqrt(r0/r) with exponential
+        # decay, where r0 is source radius (crater diameter/2); inside the
+        # source the height is H0
+        distances_m = _TSUNAMI_DISTANCES_KM * 1000
+        r0_m = crater_diameter_m / 2
+        heights = np.where(
+            distances_m > r0_m,
+            np.maximum(0.1, h0 * np.sqrt(r0_m / distances_m) * np.exp(-distances_m / 1e6)),
+            h0
+        )
+        wave_heights = {
+            f"{int(dist_km)}_km": float(height_m)
+            for dist_km, height_m in zip(_TSUNAMI_DISTANCES_KM, heights)
+        }
         
         # Coastal inundation distance (rough estimate)
         # Runup = 2-4x wave height, inundation ~ 100m per meter of runup
         coastal_inundation_m = wave_heights.get("100_km", 1.0) * 3 * 100
         
+        arrival_hours = _TSUNAMI_ARRIVAL_KM / tsunami_velocity_kmh
+        
         return {
             "wave_height_at_source_m": round(h0, 1),
             "tsunami_velocity_kmh": round(tsunami_velocity_kmh, 1),
             "wave_heights_at_distance": {k: round(v, 2) for k, v in wave_heights.items()},
             "coastal_inundation_distance_m": round(coastal_inundation_m, 0),
             "arrival_time_hours": {
-                "100_km": round(100 / tsunami_velocity_kmh, 2),
-                "500_km": round(500 / tsunami_velocity_kmh, 2),
-                "1000_km": round(1000 / tsunami_velocity_kmh, 2),
+                f"{int(dist_km)}_km": round(float(hours), 2)
+                for dist_km, hours in zip(_TSUNAMI_ARRIVAL_KM, arrival_hours)
             },
             "warning": "Ocean impact - tsunami will affect all coastlines within 5000 km"
         }
@@ -421,37 +788,12 @@ class DangerAssessment:
         Calculate atmospheric dust, soot, and climate effects
         Based on Toon et al. (1997) - impact winter scaling
         """
-        # Dust injected into stratosphere (kg)
-        # Scales with crater volume and ejecta velocity
-        crater_volume_m3 = (math.pi / 3) * ((diameter_m * 10) ** 2) * (diameter_m * 10 * 0.1)
-        ejecta_mass_kg = crater_volume_m3 * 2500  # crustal density
-        
-        # Fraction that reaches stratosphere (> 20km altitude)
-        stratospheric_fraction = 0.001 if energy_mt < 100 else 0.01 if energy_mt < 10000 else 0.1
-        stratospheric_dust_kg = ejecta_mass_kg * stratospheric_fraction
-        
-        # Global dust loading (kg/m² of Earth surface)
-        earth_surface_m2 = 4 * math.pi * (self.EARTH_RADIUS_KM * 1000) ** 2
-        dust_loading = stratospheric_dust_kg / earth_surface_m2
-        
-        # Temperature drop (rough estimate)
-        # From impact winter studies: ~0.01°C per 1 mg/m² of stratospheric dust
-        temp_drop_c = dust_loading * 1000 * 0.01  # Convert kg to mg
+        stratospheric_dust_kg, dust_loading, temp_drop_c, soot_mass_kg = _atmo_kernel(
+            float(energy_mt), float(diameter_m), bool(is_ocean), self.EARTH_SURFACE_M2
+        )
         
         # Duration of effects
-        if temp_drop_c < 1:
-            duration = "days to weeks"
-        elif temp_drop_c < 10:
-            duration = "months to years"
-        else:
-            duration = "years to decades"
-        
-        # Soot from fires (land impacts)
-        soot_mass_kg = 0
-        if not is_ocean and energy_mt > 1:
-            # Wildfires ignited by thermal radiation
-            fire_area_km2 = math.pi * (1.2 * (energy_mt ** 0.4)) ** 2
-            soot_mass_kg = fire_area_km2 * 1e6 * 0.01  # ~0.01 kg/m² soot
+        duration = _DURATION_VALUES[bisect_right(_DURATION_BOUNDS, temp_drop_c)]
         
         return {
             "stratospheric_dust_kg": round(stratospheric_dust_kg, 0),
@@ -491,108 +833,130 @@ class DangerAssessment:
         """
         Determine if impact has global consequences
         """
-        is_global = energy_mt > 10000  # > 10,000 MT = global effects
-        
-        effects = {
-            "is_global_catastrophe": is_global,
-            "mass_extinction_risk": energy_mt > 100000,  # Chicxulub was ~100 million MT
-            "crop_failure_risk": atmospheric["temperature_drop_celsius"] > 2,
-            "global_famine_risk": atmospheric["temperature_drop_celsius"] > 5,
-            "civilization_threat": energy_mt > 50000,
-        }
-        
-        if is_global:
-            effects["description"] = "Global catastrophe - worldwide climate disruption and mass casualties"
-        elif energy_mt > 100:
-            effects["description"] = "Continental disaster - regional devastation with global economic impact"
-        else:
-            effects["description"] = "Regional disaster - localized destruction"
-        
-        return effects
+        effects = _global_effects_cached(
+            bisect_left(_GLOBAL_ENERGY_BOUNDS, energy_mt),
+            bisect_left(_GLOBAL_TEMP_BOUNDS, atmospheric["temperature_drop_celsius"])
+        )
+        return dict(zip(_GLOBAL_EFFECT_FIELDS, effects))
     
     def _get_comparison(self, energy_mt: float) -> str:
         """
         Human-understandable comparison
         """
-        if energy_mt < 0.001:
-            return "Large firework"
-        elif energy_mt < 0.015:
-            return "Small tactical nuclear weapon (Hiroshima was ~0.015 MT)"
-        elif energy_mt < 1:
-            return f"{int(energy_mt * 1000)} Kilotons - Large nuclear weapon"
-        elif energy_mt < 15:
-            return "Tunguska event (1908) - Leveled 2,000 km² of forest"
-        elif energy_mt < 100:
-            return f"~{int(energy_mt)} times Hiroshima - Major city destroyer"
-        elif energy_mt < 1000:
-            return "Tsar Bomba scale - Largest nuclear weapon ever tested (50 MT)"
-        elif energy_mt < 100000:
-            return "Continental devastation - Multi-state destruction"
-        else:
-            return "Chicxulub scale - Mass extinction event (killed the dinosaurs)"
+        comparison = _COMPARISONS[bisect_right(_COMPARISON_THRESHOLDS, energy_mt)]
+        return comparison(energy_mt) if callable(comparison) else comparison
+
+
+_REPORT_RULE = "=" * 70
+
+
+# Each section pulls its fields in one C-level call and binds them to locals
+_ZONE_FIELDS = itemgetter(
+    'fireball_km', 'total_destruction_km', 'severe_damage_km', 'moderate_damage_km', 'thermal_burns_km'
+)
+_CASUALTY_FIELDS = itemgetter('immediate_deaths_estimate', 'injured_estimate', 'affected_population')
+_TSUNAMI_FIELDS = itemgetter(
+    'wave_heights_at_distance', 'wave_height_at_source_m', 'tsunami_velocity_kmh',
+    'coastal_inundation_distance_m'
+)
+_ATMOSPHERE_FIELDS = itemgetter('temperature_drop_celsius', 'sunlight_reduction_percent', 'effect_duration')
+_GLOBAL_FIELDS = itemgetter('description', 'mass_extinction_risk')
+
+
+def _fmt_zones(assessment: Dict) -> str:
+    """Damage zone radii section"""
+    fireball_km, total_km, severe_km, moderate_km, thermal_km = _ZONE_FIELDS(assessment['damage_zones'])
+    return (
+        "DAMAGE ZONES:\n"
+        f"  Fireball (vaporization): {fireball_km:.1f} km radius\n"
+        f"  Total destruction: {total_km:.1f} km radius\n"
+        f"  Severe damage: {severe_km:.1f} km radius\n"
+        f"  Moderate damage: {moderate_km:.1f} km radius\n"
+        f"  Thermal burns: {thermal_km:.1f} km radius\n"
+    )
+
+
+def _fmt_casualties(assessment: Dict) -> str:
+    """Casualty estimates section"""
+    deaths, injured, affected = _CASUALTY_FIELDS(assessment['casualties'])
+    return (
+        "CASUALTY ESTIMATES:\n"
+        f"  Immediate deaths: ~{deaths:,}\n"
+        f"  Injured: ~{injured:,}\n"
+        f"  Affected population: ~{affected:,}\n"
+    )
+
+
+def _fmt_tsunami(assessment: Dict) -> str:
+    """Tsunami section; empty for land impacts"""
+    tsunami = assessment['tsunami']
+    if not tsunami:
+        return ""
+    heights_at_distance, source_height_m, velocity_kmh, inundation_m = _TSUNAMI_FIELDS(tsunami)
+    wave_heights = "".join(
+        f"    At {dist}: {height:.1f} meters\n"
+        for dist, height in heights_at_distance.items()
+    )
+    return (
+        "TSUNAMI EFFECTS:\n"
+        f"  Wave height at source: {source_height_m:.1f} meters\n"
+        f"  Tsunami velocity: {velocity_kmh:.0f} km/h\n"
+        f"  Coastal inundation: {inundation_m:.0f} meters inland\n"
+        "  Wave heights:\n"
+        f"{wave_heights}"
+    )
+
+
+def _fmt_atmosphere(assessment: Dict) -> str:
+    """Atmospheric effects section"""
+    temp_drop_c, sunlight_pct, duration = _ATMOSPHERE_FIELDS(assessment['atmospheric_effects'])
+    return (
+        "ATMOSPHERIC EFFECTS:\n"
+        f"  Temperature drop: {temp_drop_c:.1f}°C\n"
+        f"  Sunlight reduction: {sunlight_pct:.0f}%\n"
+        f"  Duration: {duration}\n"
+    )
+
+
+def _fmt_global(assessment: Dict) -> str:
+    """Global impact section, closed by the report rule"""
+    description, extinction_risk = _GLOBAL_FIELDS(assessment['global_effects'])
+    extinction = "  ⚠️  MASS EXTINCTION RISK\n" if extinction_risk else ""
+    return (
+        "GLOBAL IMPACT:\n"
+        f"  {description}\n"
+        f"{extinction}"
+        f"{_REPORT_RULE}"
+    )
+
+
+# Report sections in order; each returns its lines already joined (a
+# section ends with a blank line by ending in "\n")
+_REPORT_SECTIONS = (
+    _fmt_zones,
+    _fmt_casualties,
+    _fmt_tsunami,
+    _fmt_atmosphere,
+    _fmt_global,
+)
 
 
 def format_danger_report(assessment: Dict, energy_mt: float) -> str:
     """
     Format danger assessment into human-readable report
     """
-    report = []
-    report.append(f"=" * 70)
-    report.append(f"ASTEROID IMPACT DANGER ASSESSMENT")
-    report.append(f"=" * 70)
-    report.append(f"Severity: {assessment['severity'].upper()}")
-    report.append(f"Impact Type: {assessment['impact_type'].upper()}")
-    report.append(f"Energy: {energy_mt:.2f} Megatons TNT")
-    report.append(f"Comparable to: {assessment['comparable_to']}")
-    report.append("")
-    
-    # Damage zones
-    report.append("DAMAGE ZONES:")
-    zones = assessment['damage_zones']
-    report.append(f"  Fireball (vaporization): {zones['fireball_km']:.1f} km radius")
-    report.append(f"  Total destruction: {zones['total_destruction_km']:.1f} km radius")
-    report.append(f"  Severe damage: {zones['severe_damage_km']:.1f} km radius")
-    report.append(f"  Moderate damage: {zones['moderate_damage_km']:.1f} km radius")
-    report.append(f"  Thermal burns: {zones['thermal_burns_km']:.1f} km radius")
-    report.append("")
-    
-    # Casualties
-    cas = assessment['casualties']
-    report.append("CASUALTY ESTIMATES:")
-    report.append(f"  Immediate deaths: ~{cas['immediate_deaths_estimate']:,}")
-    report.append(f"  Injured: ~{cas['injured_estimate']:,}")
-    report.append(f"  Affected population: ~{cas['affected_population']:,}")
-    report.append("")
-    
-    # Tsunami
-    if assessment['tsunami']:
-        tsunami = assessment['tsunami']
-        report.append("TSUNAMI EFFECTS:")
-        report.append(f"  Wave height at source: {tsunami['wave_height_at_source_m']:.1f} meters")
-        report.append(f"  Tsunami velocity: {tsunami['tsunami_velocity_kmh']:.0f} km/h")
-        report.append(f"  Coastal inundation: {tsunami['coastal_inundation_distance_m']:.0f} meters inland")
-        report.append(f"  Wave heights:")
-        for dist, height in tsunami['wave_heights_at_distance'].items():
-            report.append(f"    At {dist}: {height:.1f} meters")
-        report.append("")
-    
-    # Atmospheric
-    atm = assessment['atmospheric_effects']
-    report.append("ATMOSPHERIC EFFECTS:")
-    report.append(f"  Temperature drop: {atm['temperature_drop_celsius']:.1f}°C")
-    report.append(f"  Sunlight reduction: {atm['sunlight_reduction_percent']:.0f}%")
-    report.append(f"  Duration: {atm['effect_duration']}")
-    report.append("")
-    
-    # Global effects
-    global_fx = assessment['global_effects']
-    report.append("GLOBAL IMPACT:")
-    report.append(f"  {global_fx['description']}")
-    if global_fx['mass_extinction_risk']:
-        report.append(f"  ⚠️  MASS EXTINCTION RISK")
-    report.append(f"=" * 70)
-    
-    return "\n".join(report)
+    header = (
+        f"{_REPORT_RULE}\n"
+        "ASTEROID IMPACT DANGER ASSESSMENT\n"
+        f"{_REPORT_RULE}\n"
+        f"Severity: {assessment['severity'].upper()}\n"
+        f"Impact Type: {assessment['impact_type'].upper()}\n"
+        f"Energy: {energy_mt:.2f} Megatons TNT\n"
+        f"Comparable to: {assessment['comparable_to']}\n"
+    )
+    parts = [header]
+    parts.extend(section for section in (fmt(assessment) for fmt in _REPORT_SECTIONS) if section)
+    return "\n".join(parts)
 
 
 if __name__ == "__main__":
@@ -3,9 +3,12 @@ Asteroid Deflection and Mitigation Strategies
 Models different approaches to preventing asteroid impacts
 """
 
+import inspect
 import math
+from functools import lru_cache
 import numpy as np
-from typing import Dict, List, Tuple
+from numba import njit, prange
+from typing import Dict, List, Optional, Tuple, Union
 import logging
 
 logger = logging.getLogger(__name__)
@@ -14,13 +17,357 @@ logger = logging.getLogger(__name__)
 AU_TO_KM = 149597870.7
 EARTH_MASS = 5.972e24  # kg
 G = 6.67430e-11  # Gravitational constant m^3 kg^-1 s^-2
+SECONDS_PER_YEAR = 365.25 * 86400.0  # Julian year, 31557600 s
+EARTH_RADIUS_KM = 6371.0  # deflection needed for a miss
+MT_TO_JOULES = 4.184e15  # 1 MT TNT
+ABLATION_ENERGY_J_PER_KG = 5e6  # ~5 MJ/kg to ablate rock
+ROCK_EXHAUST_V = 7000.0  # m/s, ablated rock exhaust velocity (~5-10 km/s)
+INV_4PI = 1.0 / (4.0 * math.pi)
+
+# Strategy comparisons kept per DeflectionStrategies instance
+COMPARISON_CACHE_SIZE = 4096
+
+# Strategies compared by compare_all_strategies, in strategy_id order, and
+# the reference mission each is evaluated with
+STRATEGY_NAMES = ("kinetic_impactor", "gravity_tractor", "nuclear_standoff", "ion_beam")
+REFERENCE_MISSIONS = {
+    "kinetic_impactor": dict(asteroid_velocity_km_s=30.0, impactor_mass_kg=500,
+                             impactor_velocity_km_s=6.0, impact_efficiency=3.0),
+    "gravity_tractor": dict(spacecraft_mass_kg=20000, standoff_distance_m=100.0),
+    "nuclear_standoff": dict(nuclear_yield_megatons=1.0, standoff_distance_m=100,
+                             ablation_efficiency=0.1),
+    "ion_beam": dict(ion_thrust_newtons=1.0),
+}
+
+# One row per (scenario, strategy) in compare_all_strategies_batch
+STRATEGY_DTYPE = np.dtype([
+    ('success', '?'),
+    ('deflection_km', 'f8'),
+    ('delta_v_cm_s', 'f8'),
+    ('strategy_id', 'u1'),
+])
+
+
+@njit(cache=True, fastmath=True)
+def _kinetic_impactor_core(asteroid_mass_kg, impactor_mass_kg, impactor_velocity_m_s,
+                           impact_efficiency, time_seconds):
+    """Δv (m/s), deflection (km) and momentum transfer (kg·m/s)"""
+    # Momentum transfer (with enhancement from ejecta)
+    momentum_change = impactor_mass_kg * impactor_velocity_m_s * impact_efficiency
+    
+    # Velocity change of asteroid (Δv)
+    delta_v = momentum_change / asteroid_mass_kg  # m/s
+    
+    # Distance deflection after given time
+    deflection_distance_km = (delta_v * time_seconds) / 1000
+    return delta_v, deflection_distance_km, momentum_change
+
+
+@njit(cache=True, fastmath=True)
+def _gravity_tractor_core(asteroid_mass_kg, asteroid_diameter_m, spacecraft_mass_kg,
+                          time_seconds, standoff_distance_m):
+    """Δv (m/s), deflection (km), force (N) and asteroid acceleration (m/s²)"""
+    # Gravitational force between spacecraft and asteroid
+    distance_m = asteroid_diameter_m / 2 + standoff_distance_m
+    force = G * asteroid_mass_kg * spacecraft_mass_kg / (distance_m ** 2)
+    
+    # Acceleration of asteroid
+    acceleration = force / asteroid_mass_kg  # m/s²
+    
+    # Velocity change (assuming constant acceleration)
+    delta_v = acceleration * time_seconds  # m/s
+    
+    # Distance deflection
+    deflection_distance_km = (delta_v * time_seconds) / (2 * 1000)  # km
+    return delta_v, deflection_distance_km, force, acceleration
+
+
+@njit(cache=True, error_model='numpy')
+def _nuclear_standoff_core(asteroid_mass_kg, asteroid_diameter_m, yield_joules,
+                           standoff_distance_m, ablation_efficiency, time_seconds):
+    """
+    Δv (m/s), deflection (km), absorbed energy (J) and ablated mass (kg)
+    
+    Δv is inf once the burst would ablate the whole asteroid (destroyed);
+    NumPy error model and no fastmath so that inf comes through.
+    """
+    # Energy absorbed by asteroid (inverse square law + efficiency)
+    asteroid_surface_area = math.pi * (asteroid_diameter_m / 2) ** 2
+    solid_angle_fraction = asteroid_surface_area * INV_4PI / standoff_distance_m ** 2
+    
+    absorbed_energy = yield_joules * solid_angle_fraction * ablation_efficiency
+    
+    # Estimate ablated mass
+    ablated_mass_kg = absorbed_energy / ABLATION_ENERGY_J_PER_KG
+    
+    # Rocket equation: Δv = v_exhaust * ln(m_initial / m_final), written as
+    # ln(1 + m_ablated / m_final) so small ablated fractions keep precision
+    remaining_mass_kg = np.maximum(asteroid_mass_kg - ablated_mass_kg, 0.0)
+    delta_v = ROCK_EXHAUST_V * np.log1p(ablated_mass_kg / remaining_mass_kg)  # m/s
+    
+    # Distance deflection
+    deflection_distance_km = (delta_v * time_seconds) / 1000
+    return delta_v, deflection_distance_km, absorbed_energy, ablated_mass_kg
+
+
+@njit(cache=True, fastmath=True)
+def _ion_beam_shepherd_core(asteroid_mass_kg, ion_thrust_newtons, time_seconds):
+    """Δv (m/s), deflection (km) and asteroid acceleration (m/s²)"""
+    # Acceleration
+    acceleration = ion_thrust_newtons / asteroid_mass_kg  # m/s²
+    
+    # Velocity change
+    delta_v = acceleration * time_seconds  # m/s
+    
+    # Distance deflection
+    deflection_distance_km = (delta_v * time_seconds) / (2 * 1000)
+    return delta_v, deflection_distance_km, acceleration
+
+
+# Compile (or load from the on-disk cache) at import, for the floats the
+# scalar methods pass and the flat float64 arrays the *_vec kernels pass
+_kinetic_impactor_core(1e9, 500.0, 6000.0, 3.0, 3.15e8)
+_gravity_tractor_core(1e9, 100.0, 20000.0, 3.15e8, 100.0)
+_nuclear_standoff_core(1e9, 100.0, 4.184e15, 100.0, 0.1, 3.15e8)
+_ion_beam_shepherd_core(1e9, 1.0, 3.15e8)
+_kinetic_impactor_core(*(np.ones(1),) * 5)
+_gravity_tractor_core(*(np.ones(1),) * 5)
+_nuclear_standoff_core(*(np.ones(1),) * 6)
+_ion_beam_shepherd_core(*(np.ones(1),) * 3)
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _kinetic_impactor_mc(asteroid_mass_kg, impactor_mass_kg, impactor_velocity_m_s,
+                         impact_efficiency, time_seconds):
+    """Deflection (km) per sample, parallel across samples"""
+    n = asteroid_mass_kg.shape[0]
+    deflection_km = np.empty(n)
+    for i in prange(n):
+        deflection_km[i] = _kinetic_impactor_core(
+            asteroid_mass_kg[i], impactor_mass_kg[i], impactor_velocity_m_s[i],
+            impact_efficiency[i], time_seconds[i]
+        )[1]
+    return deflection_km
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _gravity_tractor_mc(asteroid_mass_kg, asteroid_diameter_m, spacecraft_mass_kg,
+                        time_seconds, standoff_distance_m):
+    """Deflection (km) per sample, parallel across samples"""
+    n = asteroid_mass_kg.shape[0]
+    deflection_km = np.empty(n)
+    for i in prange(n):
+        deflection_km[i] = _gravity_tractor_core(
+            asteroid_mass_kg[i], asteroid_diameter_m[i], spacecraft_mass_kg[i],
+            time_seconds[i], standoff_distance_m[i]
+        )[1]
+    return deflection_km
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _nuclear_standoff_mc(asteroid_mass_kg, asteroid_diameter_m, yield_joules,
+                         standoff_distance_m, ablation_efficiency, time_seconds):
+    """Deflection (km) per sample, parallel across samples"""
+    n = asteroid_mass_kg.shape[0]
+    deflection_km = np.empty(n)
+    for i in prange(n):
+        deflection_km[i] = _nuclear_standoff_core(
+            asteroid_mass_kg[i], asteroid_diameter_m[i], yield_joules[i],
+            standoff_distance_m[i], ablation_efficiency[i], time_seconds[i]
+        )[1]
+    return deflection_km
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _ion_beam_shepherd_mc(asteroid_mass_kg, ion_thrust_newtons, time_seconds):
+    """Deflection (km) per sample, parallel across samples"""
+    n = asteroid_mass_kg.shape[0]
+    deflection_km = np.empty(n)
+    for i in prange(n):
+        deflection_km[i] = _ion_beam_shepherd_core(
+            asteroid_mass_kg[i], ion_thrust_newtons[i], time_seconds[i]
+        )[1]
+    return deflection_km
+
+
+_kinetic_impactor_mc(*(np.ones(1),) * 5)
+_gravity_tractor_mc(*(np.ones(1),) * 5)
+_nuclear_standoff_mc(*(np.ones(1),) * 6)
+_ion_beam_shepherd_mc(*(np.ones(1),) * 3)
+
+# Monte Carlo kernel per strategy in STRATEGY_NAMES, with the strategy method
+# whose arguments it samples, those arguments (in kernel order) and the factor
+# converting each to the SI input
+_MONTE_CARLO_KERNELS = {
+    "kinetic_impactor": (_kinetic_impactor_mc, "kinetic_impactor", (
+        ("asteroid_mass_kg", 1.0),
+        ("impactor_mass_kg", 1.0),
+        ("impactor_velocity_km_s", 1000.0),
+        ("impact_efficiency", 1.0),
+        ("years_before_impact", SECONDS_PER_YEAR),
+    )),
+    "gravity_tractor": (_gravity_tractor_mc, "gravity_tractor", (
+        ("asteroid_mass_kg", 1.0),
+        ("asteroid_diameter_m", 1.0),
+        ("spacecraft_mass_kg", 1.0),
+        ("operation_time_years", SECONDS_PER_YEAR),
+        ("standoff_distance_m", 1.0),
+    )),
+    "nuclear_standoff": (_nuclear_standoff_mc, "nuclear_standoff", (
+        ("asteroid_mass_kg", 1.0),
+        ("asteroid_diameter_m", 1.0),
+        ("nuclear_yield_megatons", MT_TO_JOULES),
+        ("standoff_distance_m", 1.0),
+        ("ablation_efficiency", 1.0),
+        ("years_before_impact", SECONDS_PER_YEAR),
+    )),
+    "ion_beam": (_ion_beam_shepherd_mc, "ion_beam_shepherd", (
+        ("asteroid_mass_kg", 1.0),
+        ("ion_thrust_newtons", 1.0),
+        ("operation_time_years", SECONDS_PER_YEAR),
+    )),
+}
+
+
+def _flat_broadcast(*args) -> Tuple[Tuple[int, ...], List[np.ndarray]]:
+    """Broadcast shape and the arguments as flat contiguous float64 arrays"""
+    arrays = np.broadcast_arrays(*(np.asarray(arg, dtype=np.float64) for arg in args))
+    return arrays[0].shape, [np.ascontiguousarray(array).ravel() for array in arrays]
+
+
+def kinetic_impactor_vec(asteroid_mass_kg,
+                         asteroid_velocity_km_s,
+                         impactor_mass_kg,
+                         impactor_velocity_km_s,
+                         impact_efficiency=1.0,
+                         years_before_impact=10.0) -> Dict[str, np.ndarray]:
+    """
+    Kinetic impactor deflection over broadcastable parameter arrays
+    
+    Same model and arguments as DeflectionStrategies.kinetic_impactor (the
+    asteroid velocity does not enter the momentum model); returns its
+    numeric fields as arrays of the broadcast shape.
+    """
+    shape, (mass, impactor_mass, impactor_velocity, efficiency, years) = _flat_broadcast(
+        asteroid_mass_kg, impactor_mass_kg, impactor_velocity_km_s,
+        impact_efficiency, years_before_impact
+    )
+    delta_v, deflection_distance_km, momentum_change = _kinetic_impactor_core(
+        mass, impactor_mass, impactor_velocity * 1000, efficiency, years * SECONDS_PER_YEAR
+    )
+    return _reshaped(shape, {
+        "delta_v_m_s": delta_v,
+        "delta_v_cm_s": delta_v * 100,
+        "momentum_transfer_kg_m_s": momentum_change,
+        "deflection_distance_km": deflection_distance_km,
+        **_success(deflection_distance_km),
+    })
+
+
+def gravity_tractor_vec(asteroid_mass_kg,
+                        asteroid_diameter_m,
+                        spacecraft_mass_kg,
+                        operation_time_years=10.0,
+                        standoff_distance_m=100.0) -> Dict[str, np.ndarray]:
+    """Gravity tractor deflection over broadcastable parameter arrays"""
+    shape, (mass, diameter, spacecraft_mass, years, standoff) = _flat_broadcast(
+        asteroid_mass_kg, asteroid_diameter_m, spacecraft_mass_kg,
+        operation_time_years, standoff_distance_m
+    )
+    delta_v, deflection_distance_km, force, acceleration = _gravity_tractor_core(
+        mass, diameter, spacecraft_mass, years * SECONDS_PER_YEAR, standoff
+    )
+    return _reshaped(shape, {
+        "delta_v_m_s": delta_v,
+        "delta_v_cm_s": delta_v * 100,
+        "gravitational_force_N": force,
+        "acceleration_m_s2": acceleration,
+        "deflection_distance_km": deflection_distance_km,
+        **_success(deflection_distance_km),
+    })
+
+
+def nuclear_standoff_vec(asteroid_mass_kg,
+                         asteroid_diameter_m,
+                         nuclear_yield_megatons=1.0,
+                         standoff_distance_m=100.0,
+                         ablation_efficiency=0.1,
+                         years_before_impact=10.0) -> Dict[str, np.ndarray]:
+    """
+    Nuclear standoff burst deflection over broadcastable parameter arrays
+    
+    Scenarios that would ablate the whole asteroid come out as inf.
+    """
+    shape, (mass, diameter, yield_mt, standoff, efficiency, years) = _flat_broadcast(
+        asteroid_mass_kg, asteroid_diameter_m, nuclear_yield_megatons,
+        standoff_distance_m, ablation_efficiency, years_before_impact
+    )
+    delta_v, deflection_distance_km, absorbed_energy, ablated_mass_kg = _nuclear_standoff_core(
+        mass, diameter, yield_mt * MT_TO_JOULES, standoff, efficiency, years * SECONDS_PER_YEAR
+    )
+    return _reshaped(shape, {
+        "delta_v_m_s": delta_v,
+        "delta_v_cm_s": delta_v * 100,
+        "absorbed_energy_joules": absorbed_energy,
+        "ablated_mass_kg": ablated_mass_kg,
+        "ablated_mass_fraction": ablated_mass_kg / mass,
+        "deflection_distance_km": deflection_distance_km,
+        **_success(deflection_distance_km),
+    })
+
+
+def ion_beam_shepherd_vec(asteroid_mass_kg,
+                          ion_thrust_newtons=1.0,
+                          operation_time_years=15.0) -> Dict[str, np.ndarray]:
+    """Ion beam shepherd deflection over broadcastable parameter arrays"""
+    shape, (mass, thrust, years) = _flat_broadcast(
+        asteroid_mass_kg, ion_thrust_newtons, operation_time_years
+    )
+    delta_v, deflection_distance_km, acceleration = _ion_beam_shepherd_core(
+        mass, thrust, years * SECONDS_PER_YEAR
+    )
+    return _reshaped(shape, {
+        "delta_v_m_s": delta_v,
+        "delta_v_cm_s": delta_v * 100,
+        "acceleration_m_s2": acceleration,
+        "deflection_distance_km": deflection_distance_km,
+        **_success(deflection_distance_km),
+    })
+
+
+def _success(deflection_distance_km):
+    """Success (deflection beyond one Earth radius) and its margin"""
+    return {
+        "success": deflection_distance_km > EARTH_RADIUS_KM,
+        "success_margin": deflection_distance_km / EARTH_RADIUS_KM,
+    }
+
+
+def _reshaped(shape: Tuple[int, ...], numbers: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """Flat *_vec results back in the broadcast shape"""
+    return {name: values.reshape(shape) for name, values in numbers.items()}
+
+
+def recommended_strategy_ids(success, deflection_km) -> np.ndarray:
+    """
+    Index of the best strategy along the last axis
+    
+    Successful strategies outrank failed ones, then the larger deflection
+    wins; ties go to the earlier strategy in STRATEGY_NAMES order.
+    """
+    success = np.asarray(success, dtype=bool)
+    deflection_km = np.asarray(deflection_km, dtype=float)
+    # Only successful strategies compete when there are any
+    competing = success | ~success.any(axis=-1, keepdims=True)
+    return np.argmax(np.where(competing, deflection_km, -np.inf), axis=-1)
 
 
 class DeflectionStrategies:
     """Model various asteroid deflection strategies"""
     
     def __init__(self):
-        pass
+        # Per instance, so the cache goes away with the instance
+        self._compare_cached = lru_cache(maxsize=COMPARISON_CACHE_SIZE)(self._compare_all_strategies)
     
     def kinetic_impactor(self,
                         asteroid_mass_kg: float,
@@ -43,26 +390,20 @@ class DeflectionStrategies:
         Returns:
             Dict with deflection results and success probability
         """
-        # Convert to m/s
-        v_asteroid = asteroid_velocity_km_s * 1000
-        v_impactor = impactor_velocity_km_s * 1000
-        
-        # Momentum transfer (with enhancement from ejecta)
-        momentum_change = impactor_mass_kg * v_impactor * impact_efficiency
-        
-        # Velocity change of asteroid (Δv)
-        delta_v = momentum_change / asteroid_mass_kg  # m/s
-        
-        # Distance deflection after given time
-        time_seconds = years_before_impact * 365.25 * 24 * 3600
-        deflection_distance_km = (delta_v * time_seconds) / 1000
-        
-        # Earth's radius for comparison
-        earth_radius_km = 6371
-        
-        # Success if deflection > Earth radius
-        success = deflection_distance_km > earth_radius_km
-        success_margin = deflection_distance_km / earth_radius_km
+        return self._kinetic_impactor(
+            asteroid_mass_kg, asteroid_velocity_km_s, impactor_mass_kg, impactor_velocity_km_s,
+            impact_efficiency, years_before_impact, years_before_impact * SECONDS_PER_YEAR
+        )
+    
+    def _kinetic_impactor(self, asteroid_mass_kg, asteroid_velocity_km_s, impactor_mass_kg,
+                          impactor_velocity_km_s, impact_efficiency, years_before_impact,
+                          time_seconds) -> Dict:
+        """kinetic_impactor with the warning time already in seconds"""
+        delta_v, deflection_distance_km, momentum_change = _kinetic_impactor_core(
+            float(asteroid_mass_kg), float(impactor_mass_kg), impactor_velocity_km_s * 1000.0,
+            float(impact_efficiency), time_seconds
+        )
+        success = deflection_distance_km > EARTH_RADIUS_KM
         
         return {
             "strategy": "Kinetic Impactor",
@@ -72,7 +413,7 @@ class DeflectionStrategies:
             "deflection_distance_km": deflection_distance_km,
             "years_before_impact": years_before_impact,
             "success": success,
-            "success_margin": success_margin,
+            "success_margin": deflection_distance_km / EARTH_RADIUS_KM,
             "impactor_mass_kg": impactor_mass_kg,
             "impact_efficiency": impact_efficiency,
             "description": f"Spacecraft impact delivering {momentum_change/1e6:.1f} MN·s of momentum",
@@ -101,26 +442,19 @@ class DeflectionStrategies:
         Returns:
             Dict with deflection results
         """
-        # Gravitational force between spacecraft and asteroid
-        distance_m = asteroid_diameter_m / 2 + standoff_distance_m
-        force = G * asteroid_mass_kg * spacecraft_mass_kg / (distance_m ** 2)
-        
-        # Acceleration of asteroid
-        acceleration = force / asteroid_mass_kg  # m/s²
-        
-        # Time in seconds
-        time_seconds = operation_time_years * 365.25 * 24 * 3600
-        
-        # Velocity change (assuming constant acceleration)
-        delta_v = acceleration * time_seconds  # m/s
-        
-        # Distance deflection
-        deflection_distance_km = (delta_v * time_seconds) / (2 * 1000)  # km
-        
-        # Success criteria
-        earth_radius_km = 6371
-        success = deflection_distance_km > earth_radius_km
-        success_margin = deflection_distance_km / earth_radius_km
+        return self._gravity_tractor(
+            asteroid_mass_kg, asteroid_diameter_m, spacecraft_mass_kg, operation_time_years,
+            standoff_distance_m, operation_time_years * SECONDS_PER_YEAR
+        )
+    
+    def _gravity_tractor(self, asteroid_mass_kg, asteroid_diameter_m, spacecraft_mass_kg,
+                         operation_time_years, standoff_distance_m, time_seconds) -> Dict:
+        """gravity_tractor with the operation time already in seconds"""
+        delta_v, deflection_distance_km, force, acceleration = _gravity_tractor_core(
+            float(asteroid_mass_kg), float(asteroid_diameter_m), float(spacecraft_mass_kg),
+            time_seconds, float(standoff_distance_m)
+        )
+        success = deflection_distance_km > EARTH_RADIUS_KM
         
         return {
             "strategy": "Gravity Tractor",
@@ -133,7 +467,7 @@ class DeflectionStrategies:
             "spacecraft_mass_kg": spacecraft_mass_kg,
             "standoff_distance_m": standoff_distance_m,
             "success": success,
-            "success_margin": success_margin,
+            "success_margin": deflection_distance_km / EARTH_RADIUS_KM,
             "description": f"Continuous {force*1e9:.2f} nN gravitational tug over {operation_time_years:.1f} years",
             "advantages": "Precise, no impact, works on any composition",
             "disadvantages": "Very slow, requires long warning time",
@@ -163,34 +497,24 @@ class DeflectionStrategies:
         Returns:
             Dict with deflection results
         """
-        # Convert yield to joules
-        yield_joules = nuclear_yield_megatons * 4.184e15  # 1 MT = 4.184e15 J
-        
-        # Energy absorbed by asteroid (inverse square law + efficiency)
-        asteroid_surface_area = math.pi * (asteroid_diameter_m / 2) ** 2
-        solid_angle_fraction = asteroid_surface_area / (4 * math.pi * standoff_distance_m ** 2)
-        
-        absorbed_energy = yield_joules * solid_angle_fraction * ablation_efficiency
-        
-        # Estimate ablated mass (assuming ~5 MJ/kg to ablate rock)
-        ablation_energy = 5e6  # J/kg
-        ablated_mass_kg = absorbed_energy / ablation_energy
-        
-        # Rocket equation: Δv = v_exhaust * ln(m_initial / m_final)
-        # Approximate exhaust velocity for ablated rock: ~5-10 km/s
-        v_exhaust = 7000  # m/s (middle estimate)
-        
-        mass_ratio = asteroid_mass_kg / (asteroid_mass_kg - ablated_mass_kg)
-        delta_v = v_exhaust * math.log(mass_ratio)  # m/s
-        
-        # Distance deflection
-        time_seconds = years_before_impact * 365.25 * 24 * 3600
-        deflection_distance_km = (delta_v * time_seconds) / 1000
-        
-        # Success criteria
-        earth_radius_km = 6371
-        success = deflection_distance_km > earth_radius_km
-        success_margin = deflection_distance_km / earth_radius_km
+        return self._nuclear_standoff(
+            asteroid_mass_kg, asteroid_diameter_m, nuclear_yield_megatons, standoff_distance_m,
+            ablation_efficiency, years_before_impact, years_before_impact * SECONDS_PER_YEAR
+        )
+    
+    def _nuclear_standoff(self, asteroid_mass_kg, asteroid_diameter_m, nuclear_yield_megatons,
+                          standoff_distance_m, ablation_efficiency, years_before_impact,
+                          time_seconds) -> Dict:
+        """nuclear_standoff with the warning time already in seconds"""
+        delta_v, deflection_distance_km, absorbed_energy, ablated_mass_kg = _nuclear_standoff_core(
+            float(asteroid_mass_kg), float(asteroid_diameter_m), nuclear_yield_megatons * MT_TO_JOULES,
+            float(standoff_distance_m), float(ablation_efficiency), time_seconds
+        )
+        if not ablated_mass_kg < asteroid_mass_kg:
+            raise ValueError(
+                f"Burst would ablate {ablated_mass_kg:.3g} kg, more than the whole asteroid"
+            )
+        success = deflection_distance_km > EARTH_RADIUS_KM
         
         return {
             "strategy": "Nuclear Standoff Burst",
@@ -203,7 +527,7 @@ class DeflectionStrategies:
             "deflection_distance_km": deflection_distance_km,
             "years_before_impact": years_before_impact,
             "success": success,
-            "success_margin": success_margin,
+            "success_margin": deflection_distance_km / EARTH_RADIUS_KM,
             "description": f"{nuclear_yield_megatons} MT standoff burst ablating {ablated_mass_kg:.0f} kg of surface material",
             "advantages": "Very powerful, works on large asteroids",
             "disadvantages": "Political/legal challenges, radioactive contamination risk",
@@ -228,22 +552,18 @@ class DeflectionStrategies:
         Returns:
             Dict with deflection results
         """
-        # Acceleration
-        acceleration = ion_thrust_newtons / asteroid_mass_kg  # m/s²
-        
-        # Time in seconds
-        time_seconds = operation_time_years * 365.25 * 24 * 3600
-        
-        # Velocity change
-        delta_v = acceleration * time_seconds  # m/s
-        
-        # Distance deflection
-        deflection_distance_km = (delta_v * time_seconds) / (2 * 1000)
-        
-        # Success criteria
-        earth_radius_km = 6371
-        success = deflection_distance_km > earth_radius_km
-        success_margin = deflection_distance_km / earth_radius_km
+        return self._ion_beam_shepherd(
+            asteroid_mass_kg, ion_thrust_newtons, operation_time_years,
+            operation_time_years * SECONDS_PER_YEAR
+        )
+    
+    def _ion_beam_shepherd(self, asteroid_mass_kg, ion_thrust_newtons, operation_time_years,
+                           time_seconds) -> Dict:
+        """ion_beam_shepherd with the operation time already in seconds"""
+        delta_v, deflection_distance_km, acceleration = _ion_beam_shepherd_core(
+            float(asteroid_mass_kg), float(ion_thrust_newtons), time_seconds
+        )
+        success = deflection_distance_km > EARTH_RADIUS_KM
         
         return {
             "strategy": "Ion Beam Shepherd",
@@ -254,13 +574,52 @@ class DeflectionStrategies:
             "deflection_distance_km": deflection_distance_km,
             "operation_time_years": operation_time_years,
             "success": success,
-            "success_margin": success_margin,
+            "success_margin": deflection_distance_km / EARTH_RADIUS_KM,
             "description": f"Continuous {ion_thrust_newtons} N ion thrust over {operation_time_years:.1f} years",
             "advantages": "Continuous thrust, very efficient propulsion",
             "disadvantages": "Requires spacecraft to maintain position",
             "feasibility": "MEDIUM" if success else "LOW"
         }
     
+    def monte_carlo(self,
+                    strategy: str,
+                    n_samples: int,
+                    param_ranges: Dict[str, Union[float, Tuple[float, float]]],
+                    seed: Optional[int] = None) -> np.ndarray:
+        """
+        Monte Carlo deflection distances for one strategy under uncertain inputs
+        
+        Args:
+            strategy: Strategy name from STRATEGY_NAMES ("kinetic_impactor",
+                "gravity_tractor", "nuclear_standoff" or "ion_beam")
+            n_samples: Number of samples
+            param_ranges: The strategy method's arguments (ion_beam_shepherd's
+                for "ion_beam"), each a fixed value or a (low, high) range
+                sampled uniformly; omitted arguments take the method's defaults
+            seed: Optional RNG seed
+        
+        Returns:
+            Deflection distance (km) per sample
+        """
+        if strategy not in _MONTE_CARLO_KERNELS:
+            raise ValueError(f"Unknown strategy: {strategy}")
+        kernel, method, params = _MONTE_CARLO_KERNELS[strategy]
+        defaults = inspect.signature(getattr(self, method)).parameters
+        
+        rng = np.random.default_rng(seed)
+        inputs = []
+        for name, scale in params:
+            value = param_ranges.get(name, defaults[name].default)
+            if value is inspect.Parameter.empty:
+                raise ValueError(f"{strategy} needs a value or range for {name}")
+            if isinstance(value, (tuple, list)):
+                samples = rng.uniform(value[0], value[1], n_samples)
+            else:
+                samples = np.full(n_samples, float(value))
+            inputs.append(samples * scale)
+        
+        return kernel(*inputs)
+    
     def compare_all_strategies(self,
                               asteroid_diameter_m: float,
                               asteroid_density_kg_m3: float,
@@ -268,6 +627,10 @@ class DeflectionStrategies:
         """
         Compare all deflection strategies for a given asteroid and warning time
         
+        Results are cached per (diameter, density, years), so repeated
+        what-if queries are lookups; the returned dict is shared between
+        calls and must not be modified.
+        
         Args:
             asteroid_diameter_m: Diameter of asteroid in meters
             asteroid_density_kg_m3: Density of asteroid
@@ -276,41 +639,50 @@ class DeflectionStrategies:
         Returns:
             Dict comparing all strategies
         """
+        return self._compare_cached(asteroid_diameter_m, asteroid_density_kg_m3, years_before_impact)
+    
+    def _compare_all_strategies(self,
+                                asteroid_diameter_m: float,
+                                asteroid_density_kg_m3: float,
+                                years_before_impact: float) -> Dict:
+        """compare_all_strategies without the cache"""
         # Calculate asteroid mass
         radius_m = asteroid_diameter_m / 2
         volume_m3 = (4/3) * math.pi * (radius_m ** 3)
         asteroid_mass_kg = volume_m3 * asteroid_density_kg_m3
         
-        # Calculate each strategy
+        # Calculate each strategy, converting the warning time once
+        time_seconds = years_before_impact * SECONDS_PER_YEAR
         strategies = {
-            "kinetic_impactor": self.kinetic_impactor(
-                asteroid_mass_kg, 30.0, 500, 6.0, 3.0, years_before_impact
+            "kinetic_impactor": self._kinetic_impactor(
+                asteroid_mass_kg, years_before_impact=years_before_impact,
+                time_seconds=time_seconds, **REFERENCE_MISSIONS["kinetic_impactor"]
             ),
-            "gravity_tractor": self.gravity_tractor(
-                asteroid_mass_kg, asteroid_diameter_m, 20000, years_before_impact
+            "gravity_tractor": self._gravity_tractor(
+                asteroid_mass_kg, asteroid_diameter_m, operation_time_years=years_before_impact,
+                time_seconds=time_seconds, **REFERENCE_MISSIONS["gravity_tractor"]
             ),
-            "nuclear_standoff": self.nuclear_standoff(
-                asteroid_mass_kg, asteroid_diameter_m, 1.0, 100, 0.1, years_before_impact
+            "nuclear_standoff": self._nuclear_standoff(
+                asteroid_mass_kg, asteroid_diameter_m, years_before_impact=years_before_impact,
+                time_seconds=time_seconds, **REFERENCE_MISSIONS["nuclear_standoff"]
             ),
-            "ion_beam": self.ion_beam_shepherd(
-                asteroid_mass_kg, 1.0, years_before_impact
+            "ion_beam": self._ion_beam_shepherd(
+                asteroid_mass_kg, operation_time_years=years_before_impact,
+                time_seconds=time_seconds, **REFERENCE_MISSIONS["ion_beam"]
             )
         }
         
-        # Sort by success and deflection distance
-        sorted_strategies = sorted(
-            strategies.items(),
-            key=lambda x: (x[1]['success'], x[1]['deflection_distance_km']),
-            reverse=True
-        )
+        # Recommend the strategy ranked first by success, then deflection distance
+        success = np.array([strategies[name]['success'] for name in STRATEGY_NAMES])
+        deflection_km = np.array([strategies[name]['deflection_distance_km'] for name in STRATEGY_NAMES])
         
         return {
             "asteroid_diameter_m": asteroid_diameter_m,
             "asteroid_mass_kg": asteroid_mass_kg,
             "years_before_impact": years_before_impact,
             "strategies": strategies,
-            "recommended": sorted_strategies[0][0] if sorted_strategies else None,
-            "all_successful": all(s['success'] for s in strategies.values()),
+            "recommended": STRATEGY_NAMES[recommended_strategy_ids(success, deflection_km)],
+            "all_successful": bool(success.all()),
             "comparison_summary": {
                 name: {
                     "success": data['success'],
@@ -322,6 +694,67 @@ class DeflectionStrategies:
             }
         }
 
+    
+    def compare_all_strategies_batch(self,
+                                     asteroid_diameter_m,
+                                     asteroid_density_kg_m3,
+                                     years_before_impact) -> np.recarray:
+        """
+        compare_all_strategies over broadcastable parameter arrays
+        
+        Evaluates the same reference missions for every scenario at once.
+        Scenarios where the nuclear burst would ablate the whole asteroid
+        get an inf nuclear deflection rather than an error.
+        
+        Args:
+            asteroid_diameter_m: Diameters of asteroids in meters
+            asteroid_density_kg_m3: Densities of asteroids
+            years_before_impact: Warning times in years
+        
+        Returns:
+            STRATEGY_DTYPE records shaped (*broadcast shape, 4), one per
+            strategy in STRATEGY_NAMES order along the last axis; pass
+            success and deflection_km to recommended_strategy_ids to pick
+            the recommended strategy per scenario
+        """
+        asteroid_diameter_m = np.asarray(asteroid_diameter_m, dtype=float)
+        years_before_impact = np.asarray(years_before_impact, dtype=float)
+        shape = np.broadcast_shapes(
+            asteroid_diameter_m.shape, np.shape(asteroid_density_kg_m3), years_before_impact.shape
+        )
+        
+        # Calculate asteroid masses
+        radius_m = asteroid_diameter_m / 2
+        volume_m3 = (4/3) * math.pi * (radius_m ** 3)
+        asteroid_mass_kg = volume_m3 * asteroid_density_kg_m3
+        
+        results = (
+            kinetic_impactor_vec(
+                asteroid_mass_kg, years_before_impact=years_before_impact,
+                **REFERENCE_MISSIONS["kinetic_impactor"]
+            ),
+            gravity_tractor_vec(
+                asteroid_mass_kg, asteroid_diameter_m, operation_time_years=years_before_impact,
+                **REFERENCE_MISSIONS["gravity_tractor"]
+            ),
+            nuclear_standoff_vec(
+                asteroid_mass_kg, asteroid_diameter_m, years_before_impact=years_before_impact,
+                **REFERENCE_MISSIONS["nuclear_standoff"]
+            ),
+            ion_beam_shepherd_vec(
+                asteroid_mass_kg, operation_time_years=years_before_impact,
+                **REFERENCE_MISSIONS["ion_beam"]
+            ),
+        )
+        
+        table = np.empty(shape + (len(STRATEGY_NAMES),), dtype=STRATEGY_DTYPE).view(np.recarray)
+        table.strategy_id = np.arange(len(STRATEGY_NAMES))
+        for strategy_id, numbers in enumerate(results):
+            table.success[..., strategy_id] = numbers["success"]
+            table.deflection_km[..., strategy_id] = numbers["deflection_distance_km"]
+            table.delta_v_cm_s[..., strategy_id] = numbers["delta_v_cm_s"]
+        return table
+
 
 # Test function
 def test_deflection_strategies():
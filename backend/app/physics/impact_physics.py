@@ -7,6 +7,7 @@ import math
 import logging
 from typing import List, Dict, Tuple
 import numpy as np
+from numba import njit, prange
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +22,122 @@ except ImportError:
     logger.warning("CUDA not available, using CPU fallback")
 
 
+# Column order of the impact kernel output
+IMPACT_RESULT_FIELDS = (
+    "crater_diameter",
+    "crater_depth",
+    "kinetic_energy_joules",
+    "energy_mt_tnt",
+    "thermal_radius_km",
+    "overpressure_radius_km",
+    "seismic_magnitude",
+    "seismic_energy_ergs",
+    "mass_kg",
+)
+
+
+# Batch input fields and the defaults used when a parameter dict omits one
+IMPACT_PARAM_FIELDS = (
+    ("diameter", 100.0),  # meters
+    ("velocity", 20.0),  # km/s
+    ("density", 2500.0),  # kg/m³
+    ("angle", 45.0),  # degrees
+)
+
+
+def _params_to_array(asteroid_params_list: List[Dict], dtype=np.float64) -> np.ndarray:
+    """
+    Pack parameter dicts into a (4, N) array, one contiguous row per field
+    
+    Rows follow IMPACT_PARAM_FIELDS. Field-major layout keeps each input a
+    contiguous lane for the batch kernels instead of a stride-4 column.
+    """
+    n = len(asteroid_params_list)
+    packed = np.empty((len(IMPACT_PARAM_FIELDS), n), dtype=dtype)
+    for row, (field, default) in zip(packed, IMPACT_PARAM_FIELDS):
+        row[:] = np.fromiter(
+            (params.get(field, default) for params in asteroid_params_list),
+            dtype=dtype,
+            count=n,
+        )
+    return packed
+
+
+@njit(cache=True, fastmath=True)
+def _impact_kernel(diameter: float, velocity: float, density: float, angle: float) -> Tuple:
+    """
+    Compiled impact effects for a single parameter set
+    
+    Returns a tuple in IMPACT_RESULT_FIELDS order.
+    """
+    velocity_ms = velocity * 1000.0  # m/s
+    angle_rad = math.radians(angle)
+    radius = diameter / 2.0
+    
+    # Mass and kinetic energy (spherical assumption)
+    mass = density * (4.0/3.0) * math.pi * radius ** 3
+    kinetic_energy = 0.5 * mass * velocity_ms ** 2
+    
+    # Holsapple & Housen (1987) gravity-regime crater scaling
+    pi_2 = (9.81 * radius * math.sin(angle_rad)) / velocity_ms ** 2
+    pi_R = 1.88 * pi_2 ** (-0.22)
+    crater_diameter = 2.0 * pi_R * radius * (density / 2500.0) ** (1.0/3.0)
+    crater_depth = crater_diameter * 0.1
+    
+    energy_mt_tnt = kinetic_energy / 4.184e15
+    energy_ergs = kinetic_energy * 1e7
+    
+    seismic_magnitude = 0.0
+    if energy_ergs > 0:
+        seismic_magnitude = (2.0/3.0) * math.log10(energy_ergs) - 10.7
+        seismic_magnitude = max(0.0, min(seismic_magnitude, 12.0))
+    
+    thermal_radius_km = 0.0
+    if kinetic_energy > 0:
+        thermal_radius_km = math.sqrt(0.3 * kinetic_energy / (4.0 * math.pi * 6300.0)) / 1000.0
+    
+    overpressure_radius_km = 0.0
+    if energy_mt_tnt > 0:
+        overpressure_radius_km = 2.15 * energy_mt_tnt ** (1.0/3.0)
+    
+    return (
+        crater_diameter,
+        crater_depth,
+        kinetic_energy,
+        energy_mt_tnt,
+        thermal_radius_km,
+        overpressure_radius_km,
+        seismic_magnitude,
+        energy_ergs,
+        mass,
+    )
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _batch_kernel(params: np.ndarray) -> np.ndarray:
+    """
+    Impact effects for a (4, N) parameter array, parallel across asteroids
+    
+    Returns an (N, 9) array with columns in IMPACT_RESULT_FIELDS order. Stays
+    in float64 like single requests: energies of large bodies overflow
+    float32, and batch rows match /impact exactly.
+    """
+    diameter, velocity, density, angle = params[0], params[1], params[2], params[3]
+    n = params.shape[1]
+    output = np.empty((n, 9))
+    for i in prange(n):
+        result = _impact_kernel(diameter[i], velocity[i], density[i], angle[i])
+        for j in range(9):
+            output[i, j] = result[j]
+    return output
+
+
+# Compile (or load from the on-disk cache) at import so the first request
+# does not pay the JIT cost
+_impact_kernel(100.0, 20.0, 2500.0, 45.0)
+_batch_kernel(np.array([[100.0], [20.0], [2500.0], [45.0]]))
+
+
 class EnhancedPhysicsEngine:
     """
     Enhanced physics engine for asteroid impact simulation
@@ -61,83 +178,13 @@ class EnhancedPhysicsEngine:
         Returns:
             Dictionary with impact results including crater size, energy, seismic effects
         """
-        # Extract parameters
-        diameter = asteroid_params.get('diameter', 100.0)  # meters
-        velocity = asteroid_params.get('velocity', 20.0)  # km/s
-        density = asteroid_params.get('density', 2500.0)  # kg/m³
-        angle = asteroid_params.get('angle', 45.0)  # degrees
-        
-        # Convert units
-        velocity_ms = velocity * 1000.0  # m/s
-        angle_rad = math.radians(angle)
-        radius = diameter / 2.0
-        
-        # Mass calculation (spherical assumption)
-        volume = (4.0/3.0) * math.pi * (radius ** 3)
-        mass = density * volume
-        
-        # Kinetic energy
-        kinetic_energy = 0.5 * mass * (velocity_ms ** 2)
-        
-        # Crater scaling using π-group dimensional analysis
-        # Based on Holsapple & Housen (1987) - NASA recommended approach
-        target_density = 2500.0  # Average crustal density kg/m³
-        gravity = 9.81  # m/s²
-        
-        # Scaling law constants for gravity regime
-        K = 1.88
-        alpha = 0.22
-        
-        # π-groups calculation
-        pi_2 = (gravity * radius * math.sin(angle_rad)) / (velocity_ms ** 2)
-        pi_R = K * (pi_2 ** (-alpha))
-        
-        # Crater radius and diameter
-        crater_radius = pi_R * radius * ((density / target_density) ** (1.0/3.0))
-        crater_diameter = 2.0 * crater_radius
-        crater_depth = crater_diameter * 0.1  # Empirical depth/diameter ratio
-        
-        # Energy conversion to TNT equivalent
-        # 1 megaton TNT = 4.184 × 10^15 joules
-        energy_mt_tnt = kinetic_energy / 4.184e15
-        
-        # Seismic magnitude calculation (USGS-based)
-        # Convert to ergs for seismic calculation
-        energy_ergs = kinetic_energy * 1e7
-        if energy_ergs > 0:
-            seismic_magnitude = (2.0/3.0) * math.log10(energy_ergs) - 10.7
-            seismic_magnitude = max(0.0, min(seismic_magnitude, 12.0))
-        else:
-            seismic_magnitude = 0.0
-        
-        # Environmental effects
-        # Thermal radiation radius (Glasstone & Dolan scaling)
-        thermal_energy = 0.3 * kinetic_energy  # ~30% goes to thermal radiation
-        thermal_flux_threshold = 6300.0  # J/m² for 1st degree burns
-        if thermal_energy > 0:
-            thermal_radius = math.sqrt(thermal_energy / (4.0 * math.pi * thermal_flux_threshold))
-            thermal_radius_km = thermal_radius / 1000.0
-        else:
-            thermal_radius_km = 0.0
-        
-        # Overpressure radius (Glasstone scaling for 1 psi)
-        if energy_mt_tnt > 0:
-            overpressure_radius_km = 2.15 * (energy_mt_tnt ** (1.0/3.0))
-        else:
-            overpressure_radius_km = 0.0
-        
-        return {
-            "crater_diameter": crater_diameter,
-            "crater_depth": crater_depth,
-            "kinetic_energy_joules": kinetic_energy,
-            "energy_mt_tnt": energy_mt_tnt,
-            "thermal_radius_km": thermal_radius_km,
-            "overpressure_radius_km": overpressure_radius_km,
-            "seismic_magnitude": seismic_magnitude,
-            "seismic_energy_ergs": energy_ergs,
-            "mass_kg": mass,
-            "calculation_method": "cpu_enhanced_physics" if not self.device_available else "gpu_enhanced_physics"
-        }
+        output = _impact_kernel(
+            float(asteroid_params.get('diameter', 100.0)),  # meters
+            float(asteroid_params.get('velocity', 20.0)),  # km/s
+            float(asteroid_params.get('density', 2500.0)),  # kg/m³
+            float(asteroid_params.get('angle', 45.0)),  # degrees
+        )
+        return self._format_result(output)
     
     def compute_batch_impacts(self, asteroid_params_list: List[Dict]) -> List[Dict]:
         """
@@ -151,10 +198,18 @@ class EnhancedPhysicsEngine:
     
     def _compute_batch_cpu(self, asteroid_params_list: List[Dict]) -> List[Dict]:
         """CPU implementation for batch processing"""
-        results = []
-        for params in asteroid_params_list:
-            results.append(self.compute_impact_effects(params))
-        return results
+        if not asteroid_params_list:
+            return []
+        output = _batch_kernel(_params_to_array(asteroid_params_list))
+        return [self._format_result(row) for row in output]
+    
+    def _format_result(self, row) -> Dict:
+        """Build the result dictionary from one row or tuple of kernel output"""
+        result = {key: float(value) for key, value in zip(IMPACT_RESULT_FIELDS, row)}
+        result["calculation_method"] = (
+            "cpu_enhanced_physics" if not self.device_available else "gpu_enhanced_physics"
+        )
+        return result
     
     def _compute_batch_gpu(self, asteroid_params_list: List[Dict]) -> List[Dict]:
         """GPU implementation for batch processing (if CUDA available)"""
@@ -163,17 +218,9 @@ class EnhancedPhysicsEngine:
             return self._compute_batch_cpu(asteroid_params_list)
         
         try:
-            # Prepare input arrays
+            # Prepare input arrays (one contiguous row per field)
             n = len(asteroid_params_list)
-            input_data = np.zeros((n, 4), dtype=np.float32)
-            
-            for i, params in enumerate(asteroid_params_list):
-                input_data[i] = [
-                    params.get('diameter', 100.0),
-                    params.get('velocity', 20.0),
-                    params.get('density', 2500.0),
-                    params.get('angle', 45.0)
-                ]
+            input_data = _params_to_array(asteroid_params_list, np.float32)
             
             # Transfer to GPU
             d_input = cp.asarray(input_data)
@@ -209,11 +256,11 @@ class EnhancedPhysicsEngine:
     
     def _gpu_compute_impacts(self, d_input, d_output):
         """GPU computation using CuPy vectorized operations"""
-        # Extract parameters
-        diameter = d_input[:, 0]
-        velocity = d_input[:, 1] * 1000.0  # km/s to m/s
-        density = d_input[:, 2]
-        angle = d_input[:, 3] * (np.pi / 180.0)  # degrees to radians
+        # Extract parameters (contiguous rows of the (4, N) input)
+        diameter = d_input[0]
+        velocity = d_input[1] * 1000.0  # km/s to m/s
+        density = d_input[2]
+        angle = d_input[3] * (np.pi / 180.0)  # degrees to radians
         
         # Constants
         PI = np.pi
@@ -6,6 +6,7 @@ Based on NASA JPL orbital mechanics standards
 
 import math
 import numpy as np
+from numba import njit, prange
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime, timedelta
 import logging
@@ -21,6 +22,192 @@ EARTH_MU = 3.986004418e14  # Earth's gravitational parameter m^3/s^2
 SUN_MU = 1.32712440018e20  # Sun's gravitational parameter m^3/s^2
 EARTH_ROTATION_RATE = 7.2921159e-5  # rad/s
 
+# Column order of OrbitalMechanics.generate_trajectory_array
+ORBITAL_TRAJECTORY_COLUMNS = (
+    "x",
+    "y",
+    "z",
+    "mean_anomaly_deg",
+    "distance_from_sun_au",
+    "is_collision_zone",
+)
+
+
+@njit(cache=True)
+def _orbit_positions_km(a: float, e: float, i: float, omega: float, w: float,
+                        mean_anomalies: np.ndarray) -> np.ndarray:
+    """
+    Heliocentric positions (km) along an orbit for an array of mean anomalies
+    
+    Same Kepler solve and rotation as OrbitalMechanics.keplerian_to_cartesian;
+    angles in radians.
+    """
+    cos_w, sin_w = math.cos(w), math.sin(w)
+    cos_i, sin_i = math.cos(i), math.sin(i)
+    cos_o, sin_o = math.cos(omega), math.sin(omega)
+    R11 = cos_o * cos_w - sin_o * sin_w * cos_i
+    R12 = -cos_o * sin_w - sin_o * cos_w * cos_i
+    R21 = sin_o * cos_w + cos_o * sin_w * cos_i
+    R22 = -sin_o * sin_w + cos_o * cos_w * cos_i
+    R31 = sin_w * sin_i
+    R32 = cos_w * sin_i
+    
+    positions = np.empty((mean_anomalies.shape[0], 3))
+    for k in range(mean_anomalies.shape[0]):
+        M = mean_anomalies[k]
+        
+        # Newton-Raphson on Kepler's equation
+        E = M
+        for _ in range(100):
+            E_new = E - (E - e * math.sin(E) - M) / (1 - e * math.cos(E))
+            if abs(E_new - E) < 1e-8:
+                E = E_new
+                break
+            E = E_new
+        
+        nu = 2 * math.atan2(
+            math.sqrt(1 + e) * math.sin(E / 2),
+            math.sqrt(1 - e) * math.cos(E / 2)
+        )
+        r = a * (1 - e * math.cos(E))
+        x_orb = r * math.cos(nu)
+        y_orb = r * math.sin(nu)
+        
+        positions[k, 0] = R11 * x_orb + R12 * y_orb
+        positions[k, 1] = R21 * x_orb + R22 * y_orb
+        positions[k, 2] = R31 * x_orb + R32 * y_orb
+    return positions
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def solve_kepler(mean_anomalies: np.ndarray, eccentricities: np.ndarray) -> np.ndarray:
+    """
+    Eccentric anomaly for every (eccentricity, mean anomaly) pair
+    
+    Same Newton-Raphson iteration as OrbitalMechanics._solve_keplers_equation,
+    parallel across eccentricities. Each row is a sweep with e fixed, so every
+    solve after the first starts from a first-order step off the previous
+    root (dE/dM = 1 / (1 - e cos E)), clamped to |E - M| <= e where the root
+    must lie; on a sorted sweep that roughly halves the Newton iterations.
+    Returns a (len(eccentricities), len(mean_anomalies)) array; angles in
+    radians.
+    """
+    n = eccentricities.shape[0]
+    k = mean_anomalies.shape[0]
+    E_out = np.empty((n, k))
+    for row in prange(n):
+        e = eccentricities[row]
+        E_prev = 0.0
+        M_prev = 0.0
+        for col in range(k):
+            M = mean_anomalies[col]
+            if col == 0:
+                E = M
+            else:
+                E = E_prev + (M - M_prev) / (1 - e * math.cos(E_prev))
+                E = min(max(E, M - e), M + e)
+            for _ in range(100):
+                E_new = E - (E - e * math.sin(E) - M) / (1 - e * math.cos(E))
+                if abs(E_new - E) < 1e-8:
+                    E = E_new
+                    break
+                E = E_new
+            E_out[row, col] = E
+            E_prev = E
+            M_prev = M
+    return E_out
+
+
+# Compile (or load from the on-disk cache) at import so the first Monte Carlo
+# request does not pay the JIT cost
+solve_kepler(np.zeros(1), np.zeros(1))
+
+
+# Mean-anomaly sweep used by find_earth_intercept (every 2 degrees, 0-360)
+_INTERCEPT_SWEEP_RAD = np.radians(np.arange(0, 361, 2))
+INTERCEPT_TOLERANCE_KM = 5000
+INTERCEPT_TIE_KM = 1e-6  # distances this close count as the same crossing
+EARTH_ORBITAL_SPEED_KM_S = 29.78
+
+
+def earth_intercept_locations(elements: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Batched OrbitalMechanics.find_earth_intercept returning only the location
+
+    Args:
+        elements: (N, 6) array of a [AU], e, i, node, peri, M [deg]
+                  (M is ignored, as in the scalar sweep)
+
+    Returns:
+        (latitude_deg, longitude_deg, valid) arrays of length N; rows without
+        an intercept within tolerance have valid == False
+    """
+    a = elements[:, 0:1] * AU_TO_KM
+    e = elements[:, 1:2]
+    target_radius = 1.0 * AU_TO_KM
+
+    E = solve_kepler(_INTERCEPT_SWEEP_RAD, np.ascontiguousarray(e[:, 0]))
+
+    # Distance from the Sun only depends on E, so pick the closest step first.
+    # r(M) == r(360 - M), so every sweep has mirrored ties (outbound vs
+    # inbound crossing); take the first step within round-off of the minimum
+    # so the choice does not hinge on solver noise.
+    diff = np.abs(a * (1 - e * np.cos(E)) - target_radius)
+    rows = np.arange(elements.shape[0])
+    min_diff = diff.min(axis=1)
+    closest = np.argmax(diff <= (min_diff + INTERCEPT_TIE_KM)[:, None], axis=1)
+    valid = min_diff <= INTERCEPT_TOLERANCE_KM
+
+    a = a[:, 0]
+    e = e[:, 0]
+    E = E[rows, closest]
+    i = np.radians(elements[:, 2])
+    omega = np.radians(elements[:, 3])
+    w = np.radians(elements[:, 4])
+
+    nu = 2 * np.arctan2(np.sqrt(1 + e) * np.sin(E / 2), np.sqrt(1 - e) * np.cos(E / 2))
+    r = a * (1 - e * np.cos(E))
+    x_orb = r * np.cos(nu)
+    y_orb = r * np.sin(nu)
+    h = np.sqrt(SUN_MU * a * 1000 * (1 - e**2))
+    vx_orb = -(h / (r * 1000)) * np.sin(nu) / 1000
+    vy_orb = (h / (r * 1000)) * (e + np.cos(nu)) / 1000
+
+    cos_w, sin_w = np.cos(w), np.sin(w)
+    cos_i, sin_i = np.cos(i), np.sin(i)
+    cos_o, sin_o = np.cos(omega), np.sin(omega)
+    R11 = cos_o * cos_w - sin_o * sin_w * cos_i
+    R12 = -cos_o * sin_w - sin_o * cos_w * cos_i
+    R21 = sin_o * cos_w + cos_o * sin_w * cos_i
+    R22 = -sin_o * sin_w + cos_o * cos_w * cos_i
+    R31 = sin_w * sin_i
+    R32 = cos_w * sin_i
+
+    position = np.stack([R11 * x_orb + R12 * y_orb, R21 * x_orb + R22 * y_orb, R31 * x_orb + R32 * y_orb], axis=1)
+    velocity = np.stack([R11 * vx_orb + R12 * vy_orb, R21 * vx_orb + R22 * vy_orb, R31 * vx_orb + R32 * vy_orb], axis=1)
+
+    distance = np.linalg.norm(position, axis=1)
+    valid &= distance != 0
+    safe_distance = np.where(distance == 0, 1.0, distance)
+
+    # Offset from Earth's orbit along the same heliocentric direction
+    relative_position = position * ((distance - target_radius) / safe_distance)[:, None]
+    rel_pos_norm = np.maximum(np.linalg.norm(relative_position, axis=1), 1.0)
+
+    # Earth's velocity taken perpendicular to the position in the ecliptic
+    earth_dir = np.stack([-position[:, 1], position[:, 0], np.zeros_like(distance)], axis=1)
+    earth_dir_norm = np.linalg.norm(earth_dir, axis=1)
+    earth_dir = np.where(
+        (earth_dir_norm == 0)[:, None],
+        np.array([0.0, 30.0, 0.0]),
+        earth_dir / np.where(earth_dir_norm == 0, 1.0, earth_dir_norm)[:, None] * EARTH_ORBITAL_SPEED_KM_S
+    )
+    valid &= np.linalg.norm(velocity - earth_dir, axis=1) >= 1e-6
+
+    latitude = np.degrees(np.arcsin(relative_position[:, 2] / rel_pos_norm))
+    longitude = np.degrees(np.arctan2(relative_position[:, 1], relative_position[:, 0]))
+    return latitude, longitude, valid
+
 
 class OrbitalMechanics:
     """
@@ -189,24 +376,25 @@ class OrbitalMechanics:
         target_radius = 1.0 * AU_TO_KM
         tolerance_km = 5000  # within 5,000 km of Earth's orbital radius
 
-        closest = None
-        closest_diff = float('inf')
-
         # Sweep mean anomaly 0-360 deg for intercept candidates
+        candidates = []
         for step in range(0, 361, 2):
             test_elements = orbital_elements.copy()
             test_elements['mean_anomaly_deg'] = step
             position, velocity = self.keplerian_to_cartesian(test_elements)
 
             distance = np.linalg.norm(position)
-            diff = abs(distance - target_radius)
-
-            if diff < closest_diff:
-                closest_diff = diff
-                closest = (step, position, velocity, distance)
+            candidates.append((abs(distance - target_radius), step, position, velocity, distance))
 
-        if closest is None or closest_diff > tolerance_km:
+        # r(M) == r(360 - M), so mirrored steps tie; take the first step within
+        # round-off of the minimum, as earth_intercept_locations does
+        closest_diff = min(candidate[0] for candidate in candidates)
+        if closest_diff > tolerance_km:
             return None
+        closest = next(
+            candidate[1:] for candidate in candidates
+            if candidate[0] <= closest_diff + INTERCEPT_TIE_KM
+        )
 
         mean_anomaly_deg, pos_vec, vel_vec, distance = closest
 
@@ -270,7 +458,8 @@ class OrbitalMechanics:
                                     asteroid_diameter_m: float,
                                     asteroid_density_kg_m3: float,
                                     entry_altitude_km: float = 100.0,
-                                    start_altitude_km: float = 10000.0) -> Dict:
+                                    start_altitude_km: float = 10000.0,
+                                    max_trajectory_points: Optional[int] = None) -> Dict:
         """
         Calculate complete trajectory from space to impact
         
@@ -281,6 +470,8 @@ class OrbitalMechanics:
             asteroid_density_kg_m3: Asteroid density
             entry_altitude_km: Atmospheric entry altitude (100 km)
             start_altitude_km: Starting altitude for visualization (default 10000 km)
+            max_trajectory_points: Keep only the first N trajectory points. The
+                integration still runs to impact so the summary values are unchanged.
         
         Returns:
             Dict with trajectory points from space to impact, including ablation and fragmentation
@@ -295,6 +486,8 @@ class OrbitalMechanics:
         cross_section = math.pi * radius**2
         
         trajectory = []
+        steps = 0
+        record_limit = max_trajectory_points if max_trajectory_points is not None else math.inf
         
         # PHASE 1: Orbital approach (start_altitude → entry_altitude)
         # No atmosphere, just gravity and initial velocity
@@ -305,14 +498,16 @@ class OrbitalMechanics:
         dt_space = 1.0  # 1 second timestep in space (less precision needed)
         
         while h > entry_altitude_km * 1000 and time < 600:  # Max 10 minutes
-            trajectory.append({
-                "time": time,
-                "altitude_km": h / 1000.0,
-                "velocity_km_s": v / 1000.0,
-                "horizontal_distance_km": x / 1000.0,
-                "dynamic_pressure_pa": 0.0,  # No atmosphere yet
-                "atmospheric_density": 0.0
-            })
+            if steps < record_limit:
+                trajectory.append({
+                    "time": time,
+                    "altitude_km": h / 1000.0,
+                    "velocity_km_s": v / 1000.0,
+                    "horizontal_distance_km": x / 1000.0,
+                    "dynamic_pressure_pa": 0.0,  # No atmosphere yet
+                    "atmospheric_density": 0.0
+                })
+            steps += 1
             
             # Simple ballistic motion (no drag in space)
             dx = v * math.cos(angle_rad) * dt_space
@@ -360,14 +555,16 @@ class OrbitalMechanics:
             q = 0.5 * rho * v**2
             
             # Store trajectory point
-            trajectory.append({
-                "time": time,
-                "altitude_km": h / 1000.0,
-                "velocity_km_s": v / 1000.0,
-                "horizontal_distance_km": x / 1000.0,
-                "dynamic_pressure_pa": q,
-                "atmospheric_density": rho
-            })
+            if steps < record_limit:
+                trajectory.append({
+                    "time": time,
+                    "altitude_km": h / 1000.0,
+                    "velocity_km_s": v / 1000.0,
+                    "horizontal_distance_km": x / 1000.0,
+                    "dynamic_pressure_pa": q,
+                    "atmospheric_density": rho
+                })
+            steps += 1
             
             time += dt
             
@@ -392,17 +589,17 @@ class OrbitalMechanics:
             "impact_velocity_km_s": impact_velocity_km_s,
             "impact_distance_km": impact_distance_km,
             "entry_angle_deg": entry_angle_deg,
-            "fragmented": len(trajectory) < 100 and h > 0,
+            "fragmented": steps < 100 and h > 0,
             "airburst_altitude_km": h / 1000.0 if h > 0 else 0.0
         }
     
-    def generate_trajectory_visualization(self,
-                                         orbital_elements: Dict,
-                                         num_points: int = 100,
-                                         check_collision: bool = True,
-                                         full_orbit: bool = True) -> List[Dict]:
+    def generate_trajectory_array(self,
+                                  orbital_elements: Dict,
+                                  num_points: int = 100,
+                                  check_collision: bool = True,
+                                  full_orbit: bool = True) -> Tuple[np.ndarray, Dict]:
         """
-        Generate trajectory points for 3D visualization
+        Generate trajectory points for 3D visualization as one array
         
         Args:
             orbital_elements: Keplerian elements
@@ -411,9 +608,21 @@ class OrbitalMechanics:
             full_orbit: Calculate full orbital period (overrides num_points)
         
         Returns:
-            List of position dicts with x, y, z in AU, collision status
+            (N, 6) array with columns in ORBITAL_TRAJECTORY_COLUMNS order, and
+            a metadata dict
+        
+        Raises:
+            ValueError: If the elements do not describe a closed orbit
+                (0 <= eccentricity < 1, semi_major_axis_au > 0)
         """
-        trajectory_points = []
+        # The orbit kernel has no error path; open or degenerate orbits would
+        # come back as NaN positions
+        eccentricity = orbital_elements.get('eccentricity', 0.1)
+        semi_major_axis_au = orbital_elements.get('semi_major_axis_au', 1.5)
+        if not 0 <= eccentricity < 1:
+            raise ValueError(f"eccentricity must be in [0, 1) for an elliptical orbit, got {eccentricity}")
+        if not semi_major_axis_au > 0:
+            raise ValueError(f"semi_major_axis_au must be positive, got {semi_major_axis_au}")
         
         # Calculate orbital period for full orbit visualization
         a = orbital_elements.get('semi_major_axis_au', 1.0)
@@ -426,73 +635,93 @@ class OrbitalMechanics:
         else:
             total_points = num_points
         
+        # Vary mean anomaly around orbit
+        mean_anomaly = (360.0 * np.arange(total_points) / total_points) % 360
+        positions = _orbit_positions_km(
+            semi_major_axis_au * AU_TO_KM,
+            eccentricity,
+            math.radians(orbital_elements.get('inclination_deg', 5.0)),
+            math.radians(orbital_elements.get('longitude_ascending_node_deg', 0.0)),
+            math.radians(orbital_elements.get('argument_periapsis_deg', 0.0)),
+            np.radians(mean_anomaly)
+        )
+        pos_au = positions / AU_TO_KM
+        distance_from_sun = np.linalg.norm(pos_au, axis=1)
+        
         # Earth position (simplified: assume circular orbit at 1 AU)
         # In reality, would need to calculate Earth's actual position
         earth_radius_au = EARTH_RADIUS / AU_TO_KM
         collision_threshold_au = earth_radius_au + (100.0 / AU_TO_KM)  # Earth radius + 100km buffer
         
+        # Simplified: check if asteroid crosses Earth's orbital zone
+        earth_orbit_radius = 1.0  # AU
+        collision_zone = np.abs(distance_from_sun - earth_orbit_radius) < collision_threshold_au
+        
         collision_detected = False
         collision_point = None
+        if check_collision:
+            # Potential collision - check 3D distance, assuming Earth is at
+            # (1, 0, 0) for this phase (simplified)
+            distance_to_earth_estimate = np.linalg.norm(
+                pos_au - np.array([earth_orbit_radius, 0.0, 0.0]), axis=1
+            )
+            hits = np.flatnonzero(collision_zone & (distance_to_earth_estimate < collision_threshold_au))
+            if hits.size:
+                # Stop the trajectory at the first collision
+                collision_detected = True
+                collision_point = int(hits[0])
+                logger.info(f"Collision detected at point {collision_point} "
+                            f"(mean anomaly: {mean_anomaly[collision_point]:.1f}°)")
+        else:
+            collision_zone[:] = False
         
-        for i in range(total_points):
-            # Vary mean anomaly around orbit
-            elements = orbital_elements.copy()
-            mean_anomaly = (360.0 * i / total_points) % 360
-            elements['mean_anomaly_deg'] = mean_anomaly
-            
-            position, velocity = self.keplerian_to_cartesian(elements)
-            
-            # Convert to AU
-            pos_au = position / AU_TO_KM
-            
-            # Check distance from Earth (at origin for heliocentric frame)
-            # For a more accurate check, calculate Earth's actual position
-            # For now, check distance from Sun-Earth L1 point approximation
-            # Simplified: check if asteroid crosses Earth's orbital zone
-            distance_from_sun = np.linalg.norm(pos_au)
-            
-            # Check if asteroid is in Earth's orbital vicinity (within ~0.01 AU)
-            # and at similar orbital phase
-            earth_orbit_radius = 1.0  # AU
-            radial_distance_from_earth_orbit = abs(distance_from_sun - earth_orbit_radius)
-            
-            # For collision detection, check if asteroid comes within collision threshold
-            # of Earth's orbit at the same orbital phase
-            if check_collision and radial_distance_from_earth_orbit < collision_threshold_au:
-                # Potential collision - check 3D distance
-                # Assume Earth is at (1, 0, 0) for this phase (simplified)
-                # In reality, would calculate Earth's actual position at this time
-                earth_pos_estimate = np.array([earth_orbit_radius, 0, 0])
-                distance_to_earth_estimate = np.linalg.norm(pos_au - earth_pos_estimate)
-                
-                if distance_to_earth_estimate < collision_threshold_au:
-                    collision_detected = True
-                    collision_point = i
-            
-            trajectory_points.append({
-                "x": float(pos_au[0]),
-                "y": float(pos_au[1]),
-                "z": float(pos_au[2]),
-                "index": i,
-                "mean_anomaly_deg": float(mean_anomaly),
-                "distance_from_sun_au": float(distance_from_sun),
-                "is_collision_zone": bool(radial_distance_from_earth_orbit < collision_threshold_au) if check_collision else False
-            })
-            
-            # If collision detected and we want to stop there
-            if collision_detected and check_collision:
-                logger.info(f"Collision detected at point {i} (mean anomaly: {mean_anomaly:.1f}°)")
-                break
+        n = total_points if collision_point is None else collision_point + 1
+        trajectory = np.empty((n, len(ORBITAL_TRAJECTORY_COLUMNS)), dtype=np.float64)
+        trajectory[:, 0:3] = pos_au[:n]
+        trajectory[:, 3] = mean_anomaly[:n]
+        trajectory[:, 4] = distance_from_sun[:n]
+        trajectory[:, 5] = collision_zone[:n]
         
-        # Add metadata
-        result_meta = {
+        metadata = {
             "collision_detected": bool(collision_detected),
-            "collision_point_index": int(collision_point) if collision_point is not None else None,
-            "total_points": int(len(trajectory_points)),
+            "collision_point_index": collision_point,
+            "total_points": int(n),
             "orbital_period_years": float(orbital_period_years),
             "full_orbit_calculated": bool(not collision_detected or not check_collision)
         }
         
+        return trajectory, metadata
+    
+    def generate_trajectory_visualization(self,
+                                         orbital_elements: Dict,
+                                         num_points: int = 100,
+                                         check_collision: bool = True,
+                                         full_orbit: bool = True) -> List[Dict]:
+        """
+        Generate trajectory points for 3D visualization
+        
+        List-of-dicts form of generate_trajectory_array.
+        
+        Returns:
+            List of position dicts with x, y, z in AU, collision status
+        """
+        trajectory, result_meta = self.generate_trajectory_array(
+            orbital_elements, num_points, check_collision, full_orbit
+        )
+        
+        trajectory_points = [
+            {
+                "x": x,
+                "y": y,
+                "z": z,
+                "index": index,
+                "mean_anomaly_deg": mean_anomaly,
+                "distance_from_sun_au": distance,
+                "is_collision_zone": bool(zone)
+            }
+            for index, (x, y, z, mean_anomaly, distance, zone) in enumerate(trajectory.tolist())
+        ]
+        
         # Attach metadata to first point for easy access
         if trajectory_points:
             trajectory_points[0]["trajectory_metadata"] = result_meta
@@ -564,7 +793,8 @@ class OrbitalMechanics:
 
 def calculate_impact_scenario(asteroid_params: Dict, 
                               orbital_elements: Optional[Dict] = None,
-                              target_location: Optional[Dict] = None) -> Dict:
+                              target_location: Optional[Dict] = None,
+                              max_trajectory_points: Optional[int] = None) -> Dict:
     """
     Calculate complete impact scenario with trajectory and location
     
@@ -572,6 +802,7 @@ def calculate_impact_scenario(asteroid_params: Dict,
         asteroid_params: Diameter, velocity, density, angle
         orbital_elements: Optional Keplerian elements
         target_location: Optional specific lat/lon
+        max_trajectory_points: Optional cap on atmospheric trajectory points
     
     Returns:
         Complete impact scenario with trajectory, location, atmospheric entry
@@ -631,7 +862,8 @@ def calculate_impact_scenario(asteroid_params: Dict,
         effective_angle,
         diameter_m,
         density,
-        entry_altitude_km=100.0
+        entry_altitude_km=100.0,
+        max_trajectory_points=max_trajectory_points
     )
 
     # Generate orbital trajectory if elements provided
@@ -652,6 +884,59 @@ def calculate_impact_scenario(asteroid_params: Dict,
     }
 
 
+def calculate_atmospheric_only(asteroid_params: Dict,
+                               target_location: Optional[Dict] = None,
+                               max_trajectory_points: Optional[int] = None) -> Dict:
+    """
+    Impact location and atmospheric entry when no orbital elements are known
+    
+    Equivalent to calculate_impact_scenario with orbital_elements=None, minus
+    the intercept search and orbit visualization.
+    
+    Args:
+        asteroid_params: Diameter, velocity, density, angle
+        target_location: Optional specific lat/lon
+        max_trajectory_points: Optional cap on atmospheric trajectory points
+    
+    Returns:
+        Dict with impact_location and atmospheric_entry
+    """
+    om = OrbitalMechanics()
+
+    velocity_km_s = asteroid_params.get('velocity', 20.0)
+    angle = asteroid_params.get('angle', 45.0)
+
+    impact_lat = impact_lon = None
+    if target_location:
+        impact_lat = target_location.get('latitude')
+        impact_lon = target_location.get('longitude')
+    if impact_lat is None or impact_lon is None:
+        import random
+        impact_lat = random.uniform(-60, 60)
+        impact_lon = random.uniform(-180, 180)
+
+    entry_data = om.calculate_atmospheric_entry(
+        velocity_km_s,
+        angle,
+        asteroid_params.get('diameter', 100.0),
+        asteroid_params.get('density', 2500.0),
+        entry_altitude_km=100.0,
+        max_trajectory_points=max_trajectory_points
+    )
+
+    return {
+        "impact_location": {
+            "latitude": impact_lat,
+            "longitude": impact_lon,
+            "impact_angle_deg": angle,
+            # Without an orbit the approach vector is taken along +x
+            "azimuth_deg": om._calculate_azimuth((velocity_km_s, 0.0)),
+            "impact_point": [impact_lon, impact_lat]
+        },
+        "atmospheric_entry": entry_data
+    }
+
+
 if __name__ == "__main__":
     # Test orbital mechanics
     print("Testing Orbital Mechanics...")
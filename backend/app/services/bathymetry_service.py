@@ -17,6 +17,11 @@ logger = logging.getLogger(__name__)
 BATHYMETRY_DATASET = None
 BATHYMETRY_CACHE = {}  # Cache recent queries
 
+# Land mask built from the TID grid by scripts/build_land_mask.py: packed
+# bits (1 = TID 0, land), rows from -90° latitude, columns from -180°
+# longitude, same number of cells per degree on both axes
+LAND_MASK_FILE = 'GEBCO_2025_TID_landmask.npy'
+
 
 class BathymetryService:
     """Service for querying ocean depth and land elevation from GEBCO data"""
@@ -32,6 +37,7 @@ class BathymetryService:
         self.lon_array = None
         self.elevation_data = None
         self.resolution = None
+        self.land_mask = self._load_land_mask()
         
         if not self.gebco_file.exists():
             logger.warning(f"GEBCO file not found: {self.gebco_file}")
@@ -39,6 +45,27 @@ class BathymetryService:
         else:
             self._load_dataset()
     
+    def _load_land_mask(self) -> Optional[np.ndarray]:
+        """Memory-map the precomputed land mask if it has been built"""
+        mask_file = Path(os.environ.get(
+            'GEBCO_LAND_MASK_PATH',
+            self.gebco_file.parent / LAND_MASK_FILE
+        )).resolve()
+        if not mask_file.exists():
+            return None
+        
+        land_mask = np.load(mask_file, mmap_mode='r')
+        logger.info(f"✓ Land mask loaded: {land_mask.shape[0]} rows ({land_mask.shape[0] // 180} cells/degree)")
+        return land_mask
+    
+    def _is_land_cell(self, latitude: float, longitude: float) -> bool:
+        """Land-mask bit for the cell containing a point"""
+        cells_per_deg = self.land_mask.shape[0] // 180
+        n_lon = self.land_mask.shape[1] * 8
+        row = min(max(int((latitude + 90.0) * cells_per_deg), 0), self.land_mask.shape[0] - 1)
+        col = int((longitude + 180.0) * cells_per_deg) % n_lon
+        return bool((self.land_mask[row, col >> 3] >> (7 - (col & 7))) & 1)
+    
     def _load_dataset(self):
         """Load GEBCO NetCDF dataset using h5py (HDF5 backend)"""
         global BATHYMETRY_DATASET
@@ -323,6 +350,11 @@ class BathymetryService:
         Returns:
             bool: True if ocean, False if land
         """
+        # The mask answers the TID part of get_depth (TID 0 is land, anything
+        # else defers to the depth heuristic) without an HDF5 read
+        if self.land_mask is not None:
+            return not self._is_land_cell(latitude, longitude) and self._get_fallback_depth(latitude, longitude) > 0
+        
         depth = self.get_depth(latitude, longitude)
         return depth > 0  # Positive depth = ocean
     
@@ -4,7 +4,11 @@ Integrates GEE datasets for terrain, population, land use, and other data overla
 NASA Space Apps Challenge 2025 - Meteor Madness
 """
 
+import asyncio
+import functools
 import logging
+import time
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple
 import numpy as np
 import math
@@ -19,24 +23,76 @@ except ImportError:
     logger.warning("Google Earth Engine not available. Install with: pip install earthengine-api")
     GEE_AVAILABLE = False
 
+# Region query cache: the UI tends to revisit the same few impact points
+GEE_CACHE_MAXSIZE = 1024
+GEE_CACHE_TTL_SECONDS = 600
+
+
+def _cached_region_query(func):
+    """
+    Cache a region query per dataset method, keyed on quantized location
+    
+    Coordinates are rounded to 3 decimals (~100m) and radius to 0.1km so
+    near-identical clicks share an entry. Mock/fallback results are not
+    cached so a transient GEE failure is not pinned for the whole TTL.
+    """
+    cache: "OrderedDict[Tuple[float, float, float], Tuple[Dict, float]]" = OrderedDict()
+    
+    @functools.wraps(func)
+    async def wrapper(self, latitude: float, longitude: float, radius_km: float = 5) -> Dict:
+        key = (round(latitude, 3), round(longitude, 3), round(radius_km, 1))
+        now = time.monotonic()
+        
+        hit = cache.get(key)
+        if hit is not None and hit[1] > now:
+            cache.move_to_end(key)
+            return hit[0]
+        
+        result = await func(self, latitude, longitude, radius_km)
+        
+        if not str(result.get('dataset', '')).startswith('MOCK_'):
+            cache[key] = (result, now + GEE_CACHE_TTL_SECONDS)
+            cache.move_to_end(key)
+            if len(cache) > GEE_CACHE_MAXSIZE:
+                cache.popitem(last=False)
+        
+        return result
+    
+    wrapper.cache_clear = cache.clear
+    return wrapper
+
 
 class GoogleEarthEngineService:
     """Service for fetching and processing Google Earth Engine datasets"""
     
     def __init__(self):
+        # Earth Engine is initialized separately (see initialize_async) so
+        # constructing the service never blocks on authentication
         self.initialized = False
-        if GEE_AVAILABLE:
-            try:
-                # Try to initialize Earth Engine
-                # For authentication, you'll need to run: earthengine authenticate
-                # Or use a service account key
-                ee.Initialize()
-                self.initialized = True
-                logger.info("Google Earth Engine initialized successfully")
-            except Exception as e:
-                logger.error(f"Failed to initialize Google Earth Engine: {e}")
-                logger.info("Using mock data for demonstration")
     
+    async def initialize_async(self) -> bool:
+        """
+        Initialize Earth Engine without blocking the event loop
+        
+        Returns:
+            True if Earth Engine is ready, False if mock data will be used
+        """
+        if not GEE_AVAILABLE or self.initialized:
+            return self.initialized
+        
+        try:
+            # For authentication, you'll need to run: earthengine authenticate
+            # Or use a service account key
+            await asyncio.to_thread(ee.Initialize)
+            self.initialized = True
+            logger.info("Google Earth Engine initialized successfully")
+        except Exception as e:
+            logger.error(f"Failed to initialize Google Earth Engine: {e}")
+            logger.info("Using mock data for demonstration")
+        
+        return self.initialized
+    
+    @_cached_region_query
     async def get_elevation_data(self, latitude: float, longitude: float, 
                                  radius_km: float = 5) -> Dict:
         """
@@ -102,6 +158,7 @@ class GoogleEarthEngineService:
             logger.error(f"Error fetching elevation data: {e}")
             return self._generate_mock_elevation_data(latitude, longitude, radius_km)
     
+    @_cached_region_query
     async def get_population_data(self, latitude: float, longitude: float,
                                   radius_km: float = 5) -> Dict:
         """
@@ -137,8 +194,9 @@ class GoogleEarthEngineService:
                 geometries=True
             )
             
-            # Convert to Python
-            features = sample.getInfo()['features']
+            # Convert to Python (blocking round-trip, run off the event loop
+            # so concurrent zone queries overlap)
+            features = (await asyncio.to_thread(sample.getInfo))['features']
             
             values = []
             coordinates = []
@@ -167,6 +225,7 @@ class GoogleEarthEngineService:
             logger.error(f"Error fetching population data: {e}")
             return self._generate_mock_population_data(latitude, longitude, radius_km)
     
+    @_cached_region_query
     async def get_landcover_data(self, latitude: float, longitude: float,
                                 radius_km: float = 5) -> Dict:
         """
@@ -224,6 +283,7 @@ class GoogleEarthEngineService:
             logger.error(f"Error fetching land cover data: {e}")
             return self._generate_mock_landcover_data(latitude, longitude, radius_km)
     
+    @_cached_region_query
     async def get_urban_data(self, latitude: float, longitude: float,
                             radius_km: float = 5) -> Dict:
         """
@@ -277,6 +337,7 @@ class GoogleEarthEngineService:
             logger.error(f"Error fetching urban data: {e}")
             return self._generate_mock_urban_data(latitude, longitude, radius_km)
     
+    @_cached_region_query
     async def get_water_data(self, latitude: float, longitude: float,
                             radius_km: float = 5) -> Dict:
         """
@@ -343,16 +404,29 @@ class GoogleEarthEngineService:
         Returns:
             Dictionary with affected population by zone
         """
+        totals = None
+        if self.initialized:
+            try:
+                totals = await self._sum_population_in_radii(latitude, longitude, damage_radii_km)
+            except Exception as e:
+                logger.error(f"Error reducing population over damage zones: {e}")
+        
+        if totals is None:
+            # Zones are independent queries, so fetch them concurrently
+            results = await asyncio.gather(*(
+                self.get_population_data(latitude, longitude, radius)
+                for radius in damage_radii_km
+            ))
+            totals = [pop_data['total_population'] for pop_data in results]
+        
         zones = []
         
-        for i, radius in enumerate(damage_radii_km):
-            pop_data = await self.get_population_data(latitude, longitude, radius)
-            
+        for i, (radius, total) in enumerate(zip(damage_radii_km, totals)):
             zone = {
                 'zone_number': i + 1,
                 'radius_km': radius,
-                'population': int(pop_data['total_population']),
-                'population_density': pop_data['population_density']
+                'population': int(total),
+                'population_density': total / (math.pi * radius * radius) if radius > 0 else 0
             }
             
             zones.append(zone)
@@ -365,6 +439,30 @@ class GoogleEarthEngineService:
             'total_affected_population': total_affected
         }
     
+    async def _sum_population_in_radii(self, latitude: float, longitude: float,
+                                       radii_km: List[float]) -> List[float]:
+        """
+        Sum WorldPop population inside each radius with one reduceRegions call
+        
+        All zones are reduced server-side in a single request, so there is one
+        getInfo() round-trip regardless of how many radii are requested.
+        """
+        point = ee.Geometry.Point([longitude, latitude])
+        zones = ee.FeatureCollection([
+            ee.Feature(point.buffer(radius * 1000)) for radius in radii_km
+        ])
+        
+        population = ee.ImageCollection('WorldPop/GP/100m/pop').mosaic()
+        
+        sums = population.reduceRegions(
+            collection=zones,
+            reducer=ee.Reducer.sum(),
+            scale=100
+        ).aggregate_array('sum')
+        
+        totals = await asyncio.to_thread(sums.getInfo)
+        return [total or 0 for total in totals]
+    
     # Helper methods for mock data generation
     
     def _generate_mock_elevation_data(self, lat: float, lon: float, radius: float) -> Dict:
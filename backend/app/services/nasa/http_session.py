@@ -0,0 +1,34 @@
+"""
+Shared aiohttp client session for NASA API calls
+Created lazily so connections and DNS lookups are reused across requests
+"""
+
+import logging
+from typing import Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+_session: Optional[aiohttp.ClientSession] = None
+
+
+async def get_nasa_session() -> aiohttp.ClientSession:
+    """Get or create the shared NASA API client session"""
+    global _session
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            ttl_dns_cache=300,
+            keepalive_timeout=60
+        )
+        _session = aiohttp.ClientSession(connector=connector)
+    return _session
+
+
+async def close_nasa_session() -> None:
+    """Close the shared NASA API client session (called on app shutdown)"""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
@@ -9,8 +9,9 @@ import logging
 import csv
 import math
 import os
+import numpy as np
 import requests
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 from collections import defaultdict
 
@@ -20,6 +21,9 @@ logger = logging.getLogger(__name__)
 REVERSE_GEOCODE_API = "https://api.bigdatacloud.net/data/reverse-geocode-client"
 GEOCODE_CACHE = {}  # Cache geocoding results to minimize API calls
 
+# Window cells per distance pass; bounds memory for continent-sized zones
+WINDOW_CHUNK_CELLS = 1 << 20
+
 # ISO code mappings (loaded from file)
 ISO2_TO_ISO3: Dict[str, str] = {}
 
@@ -246,42 +250,14 @@ class PopulationDataService:
                 result['location_info'] = location_info
             return result
         
-        grid = country_data['grid']
-        resolution = country_data['resolution_deg']
         sorted_radii = sorted(zone_radii_km)
-        max_radius = sorted_radii[-1]
-        
-        # Bounding box for largest radius
-        lat_range = max_radius / 111.0
-        lon_range = max_radius / (111.0 * math.cos(math.radians(latitude)))
-        
-        lat_min = latitude - lat_range
-        lat_max = latitude + lat_range
-        lon_min = longitude - lon_range
-        lon_max = longitude + lon_range
-        
-        # Accumulate populations
-        zone_populations = [0.0] * len(sorted_radii)
-        
-        lat = lat_min
-        while lat <= lat_max:
-            lon = lon_min
-            while lon <= lon_max:
-                dist_km = self._haversine_distance(latitude, longitude, lat, lon)
-                
-                # Check if this cell is within the largest radius
-                if dist_km <= max_radius:
-                    key = (round(lat, 2), round(lon, 2))
-                    pop = grid.get(key, 0)
-                    
-                    if pop > 0:
-                        # Add population to ALL zones that contain this cell
-                        for i, radius in enumerate(sorted_radii):
-                            if dist_km <= radius:
-                                zone_populations[i] += pop
-                
-                lon += resolution
-            lat += resolution
+        zone_populations = self._zone_populations(
+            country_data['grid'],
+            country_data['resolution_deg'],
+            latitude,
+            longitude,
+            sorted_radii
+        )
         
         # Build zone results
         zones = []
@@ -311,20 +287,75 @@ class PopulationDataService:
         
         return result
     
-    def _haversine_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-        """Calculate distance in km using Haversine formula"""
-        R = 6371.0
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        dlat = math.radians(lat2 - lat1)
-        dlon = math.radians(lon2 - lon1)
+    def _zone_populations(
+        self,
+        grid: Dict,
+        resolution: float,
+        latitude: float,
+        longitude: float,
+        sorted_radii: List[float]
+    ) -> List[float]:
+        """
+        Cumulative population within each radius (sorted ascending)
         
-        a = (math.sin(dlat / 2) ** 2 + 
-             math.cos(lat1_rad) * math.cos(lat2_rad) * 
-             math.sin(dlon / 2) ** 2)
-        c = 2 * math.asin(math.sqrt(a))
+        Walks the bounding box of the largest radius on the grid's
+        resolution, starting from its south-west corner. One pass covers all
+        zones: each smaller zone is a distance mask over the same cells. Rows
+        are processed WINDOW_CHUNK_CELLS at a time so memory stays flat for
+        large zones.
+        """
+        max_radius = sorted_radii[-1]
+        
+        # Bounding box for largest radius
+        lat_range = max_radius / 111.0
+        lon_range = max_radius / (111.0 * math.cos(math.radians(latitude)))
         
-        return R * c
+        lat_min = latitude - lat_range
+        lat_max = latitude + lat_range
+        lon_min = longitude - lon_range
+        lon_max = longitude + lon_range
+        
+        lats = self._window_steps(lat_min, lat_max, resolution)
+        lons = self._window_steps(lon_min, lon_max, resolution)
+        
+        # Grid keys are Python-rounded coordinates, so round per row/column
+        # and look up only the cells inside the radius
+        lat_keys = [round(lat, 2) for lat in lats.tolist()]
+        lon_keys = [round(lon, 2) for lon in lons.tolist()]
+        
+        # Haversine terms that only depend on the column or the row
+        lat1_rad = math.radians(latitude)
+        lon_term = np.sin(np.radians(lons - longitude)[None, :] / 2) ** 2
+        lat_sin = np.sin(np.radians(lats - latitude) / 2) ** 2
+        lat_cos = math.cos(lat1_rad) * np.cos(np.radians(lats))
+        
+        zone_populations = [0.0] * len(sorted_radii)
+        rows_per_chunk = max(1, WINDOW_CHUNK_CELLS // max(lons.size, 1))
+        for start in range(0, lats.size, rows_per_chunk):
+            chunk = slice(start, start + rows_per_chunk)
+            a = lat_sin[chunk, None] + lat_cos[chunk, None] * lon_term
+            distances = 6371.0 * 2 * np.arcsin(np.sqrt(a))
+            
+            rows, cols = np.nonzero(distances <= max_radius)
+            if rows.size == 0:
+                continue
+            rows += start
+            populations = np.fromiter(
+                (grid.get((lat_keys[i], lon_keys[j]), 0) for i, j in zip(rows.tolist(), cols.tolist())),
+                dtype=float,
+                count=rows.size
+            )
+            distances = distances[rows - start, cols]
+            for k, radius in enumerate(sorted_radii):
+                zone_populations[k] += float(populations[distances <= radius].sum())
+        return zone_populations
+    
+    @staticmethod
+    def _window_steps(start: float, stop: float, step: float) -> np.ndarray:
+        """start, start + step, ... up to stop, accumulated step by step"""
+        count = int((stop - start) / step) + 2
+        steps = np.add.accumulate(np.concatenate(([start], np.full(count - 1, step))))
+        return steps[steps <= stop]
     
     def _get_fallback_zones(self, lat: float, lon: float, radii: List[float]) -> Dict:
         """Fallback using global average density (~60/km²)"""
@@ -6,9 +6,11 @@ Provides fast access to historical earthquake data without API calls
 import json
 import csv
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 # Path to cached data (go up from backend/app/services/usgs/ to project root)
@@ -22,7 +24,10 @@ class EarthquakeCacheService:
         self.major_quakes_file = CACHE_DIR / "usgs_major_earthquakes_7plus.json"
         self.great_quakes_file = CACHE_DIR / "usgs_great_earthquakes_8plus.json"
         self._cache = {}
+        self._magnitudes: Dict[str, np.ndarray] = {}
         self._load_cache()
+        self._index_magnitudes()
+        self._famous: Tuple[Dict, ...] = tuple(self._find_famous_earthquakes())
     
     def _load_cache(self):
         """Load earthquake data into memory"""
@@ -45,6 +50,20 @@ class EarthquakeCacheService:
             logger.error(f"Error loading earthquake cache: {e}")
             self._cache = {'major': [], 'great': []}
     
+    def _index_magnitudes(self):
+        """Build contiguous magnitude arrays so range queries run vectorized"""
+        for key in ('major', 'great'):
+            self._magnitudes[key] = np.asarray(
+                [f['properties'].get('mag', 0) for f in self._cache.get(key, [])],
+                dtype=np.float64
+            )
+        # Range stats look at both catalogues together; keep them sorted with a
+        # prefix sum so any range is two binary searches and one subtraction
+        self._sorted_mags = np.sort(
+            np.concatenate((self._magnitudes['major'], self._magnitudes['great']))
+        )
+        self._mag_csum = np.concatenate(([0.0], np.cumsum(self._sorted_mags)))
+    
     def find_similar_magnitude(self, target_magnitude: float, tolerance: float = 0.5) -> List[Dict]:
         """
         Find earthquakes with similar magnitude to an asteroid impact
@@ -63,45 +82,55 @@ class EarthquakeCacheService:
         cache_key = 'great' if target_magnitude >= 8.0 else 'major'
         quakes = self._cache.get(cache_key, [])
         
+        mags = self._magnitudes.get(cache_key)
+        if mags is None or mags.size == 0:
+            return []
+        
+        # Select matches, then keep the top 10 by magnitude (descending, stable)
+        # so only those features need to be expanded into response dicts
+        idx = np.flatnonzero((mags >= min_mag) & (mags <= max_mag))
+        idx = idx[np.argsort(-mags[idx], kind='stable')][:10]
+        
         similar = []
-        for feature in quakes:
+        for i in idx:
+            feature = quakes[i]
             props = feature['properties']
             mag = props.get('mag', 0)
             
-            if min_mag <= mag <= max_mag:
-                # Extract key information
-                coords = feature.get('geometry', {}).get('coordinates', [0, 0, 0])
-                
-                earthquake = {
-                    "magnitude": mag,
-                    "magnitude_type": props.get('magType', 'unknown'),
-                    "location": props.get('place', 'Unknown'),
-                    "year": self._timestamp_to_year(props.get('time', 0)),
-                    "date": self._timestamp_to_date(props.get('time', 0)),
-                    "latitude": coords[1] if len(coords) > 1 else 0,
-                    "longitude": coords[0] if len(coords) > 0 else 0,
-                    "depth_km": coords[2] if len(coords) > 2 else 0,
-                    "url": props.get('url', ''),
-                    "tsunami": props.get('tsunami', 0) == 1,
-                    "felt_reports": props.get('felt', 0),
-                    "cdi": props.get('cdi'),  # Community Decimal Intensity
-                    "mmi": props.get('mmi'),  # Modified Mercalli Intensity
-                    "historical_context": self._get_historical_context(
-                        mag, 
-                        self._timestamp_to_year(props.get('time', 0)),
-                        props.get('place', '')
-                    )
-                }
-                
-                similar.append(earthquake)
-        
-        # Sort by magnitude (descending)
-        similar.sort(key=lambda x: x['magnitude'], reverse=True)
+            # Extract key information
+            coords = feature.get('geometry', {}).get('coordinates', [0, 0, 0])
+            
+            earthquake = {
+                "magnitude": mag,
+                "magnitude_type": props.get('magType', 'unknown'),
+                "location": props.get('place', 'Unknown'),
+                "year": self._timestamp_to_year(props.get('time', 0)),
+                "date": self._timestamp_to_date(props.get('time', 0)),
+                "latitude": coords[1] if len(coords) > 1 else 0,
+                "longitude": coords[0] if len(coords) > 0 else 0,
+                "depth_km": coords[2] if len(coords) > 2 else 0,
+                "url": props.get('url', ''),
+                "tsunami": props.get('tsunami', 0) == 1,
+                "felt_reports": props.get('felt', 0),
+                "cdi": props.get('cdi'),  # Community Decimal Intensity
+                "mmi": props.get('mmi'),  # Modified Mercalli Intensity
+                "historical_context": self._get_historical_context(
+                    mag, 
+                    self._timestamp_to_year(props.get('time', 0)),
+                    props.get('place', '')
+                )
+            }
+            
+            similar.append(earthquake)
         
-        return similar[:10]  # Return top 10 matches
+        return similar  # Top 10 matches
     
-    def get_famous_earthquakes(self) -> List[Dict]:
-        """Get list of famous historical earthquakes for context"""
+    def get_famous_earthquakes(self) -> Tuple[Dict, ...]:
+        """Get famous historical earthquakes for context (precomputed at load)"""
+        return self._famous
+    
+    def _find_famous_earthquakes(self) -> List[Dict]:
+        """Identify famous historical earthquakes in the great-quake catalogue"""
         famous = []
         
         for feature in self._cache.get('great', []):
@@ -136,15 +165,11 @@ class EarthquakeCacheService:
     
     def get_magnitude_range_stats(self, min_mag: float, max_mag: float) -> Dict:
         """Get statistics for earthquakes in a magnitude range"""
-        quakes = self._cache.get('major', []) + self._cache.get('great', [])
-        
-        in_range = [
-            f['properties']['mag'] 
-            for f in quakes 
-            if min_mag <= f['properties'].get('mag', 0) <= max_mag
-        ]
+        lo = int(np.searchsorted(self._sorted_mags, min_mag, side='left'))
+        hi = int(np.searchsorted(self._sorted_mags, max_mag, side='right'))
+        count = hi - lo
         
-        if not in_range:
+        if count <= 0:
             return {
                 "count": 0,
                 "min": 0,
@@ -153,10 +178,10 @@ class EarthquakeCacheService:
             }
         
         return {
-            "count": len(in_range),
-            "min": min(in_range),
-            "max": max(in_range),
-            "average": sum(in_range) / len(in_range),
+            "count": count,
+            "min": float(self._sorted_mags[lo]),
+            "max": float(self._sorted_mags[hi - 1]),
+            "average": float((self._mag_csum[hi] - self._mag_csum[lo]) / count),
             "magnitude_range": f"{min_mag}-{max_mag}"
         }
     
@@ -97,7 +97,8 @@ class USGSEarthquakeService:
             # Try cache
             return self._load_from_cache()
     
-    def impact_energy_to_seismic_magnitude(self, impact_energy_joules: float) -> Dict:
+    @staticmethod
+    def impact_energy_to_seismic_magnitude(impact_energy_joules: float) -> Dict:
         """
         Convert asteroid impact energy to equivalent earthquake magnitude
         using USGS seismic moment magnitude scale
@@ -154,7 +155,8 @@ class USGSEarthquakeService:
             logger.warning(f"Could not fetch similar earthquakes for magnitude {target_magnitude}: {e}")
             return []
     
-    def get_earthquake_damage_description(self, magnitude: float) -> Dict:
+    @staticmethod
+    def get_earthquake_damage_description(magnitude: float) -> Dict:
         """Get damage scale description based on USGS Modified Mercalli Intensity"""
         if magnitude < 2.0:
             intensity = "I"
@@ -25,5 +25,6 @@ if __name__ == "__main__":
         host=settings.api_host,
         port=settings.api_port,
         reload=settings.debug,
+        loop="auto",  # uvloop when installed (not available on Windows)
         log_level="info"
     )
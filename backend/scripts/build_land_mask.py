@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Build the packed land mask used by BathymetryService.is_ocean
+
+Samples the GEBCO TID grid at the centre of every mask cell (nearest TID
+cell, as get_depth does) and stores TID == 0 as one bit per cell, so
+ocean/land checks no longer read the 3.7 GB NetCDF file.
+
+Usage (from backend/):
+    python scripts/build_land_mask.py [--cells-per-degree 60] [--output PATH]
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add backend directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.bathymetry_service import LAND_MASK_FILE, BathymetryService
+
+
+def nearest_indices(array: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Vectorized BathymetryService._find_nearest_index"""
+    idx = np.clip(np.searchsorted(array, values), 1, len(array) - 1)
+    take_previous = np.abs(array[idx - 1] - values) < np.abs(array[idx] - values)
+    idx = np.where(take_previous, idx - 1, idx)
+    idx = np.where(values <= array[0], 0, idx)
+    return np.where(values > array[-1], len(array) - 1, idx)
+
+
+def build_land_mask(service: BathymetryService, cells_per_deg: int) -> np.ndarray:
+    """Packed (180 * cells_per_deg, 45 * cells_per_deg) uint8 land mask"""
+    centres_lat = -90.0 + (np.arange(180 * cells_per_deg) + 0.5) / cells_per_deg
+    centres_lon = -180.0 + (np.arange(360 * cells_per_deg) + 0.5) / cells_per_deg
+
+    # Wrap longitudes outside the grid by a turn, as get_depth does
+    lon_min, lon_max = service.lon_array[0], service.lon_array[-1]
+    centres_lon = np.where(centres_lon < lon_min, centres_lon + 360,
+                           np.where(centres_lon > lon_max, centres_lon - 360, centres_lon))
+
+    lat_idx = nearest_indices(service.lat_array, centres_lat)
+    lon_idx = nearest_indices(service.lon_array, centres_lon)
+
+    tid = service.dataset['tid']
+    mask = np.empty((centres_lat.size, centres_lon.size // 8), dtype=np.uint8)
+    for row, source_row in enumerate(lat_idx):
+        mask[row] = np.packbits(tid[source_row, :][lon_idx] == 0)
+        if row % 1000 == 0:
+            print(f"  {row:,} / {centres_lat.size:,} rows")
+    return mask
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cells-per-degree", type=int, default=60,
+                        help="Mask cells per degree (60 = 1 arc-minute, ~30 MB)")
+    parser.add_argument("--output", type=Path, default=None,
+                        help=f"Output .npy path (default: next to the GEBCO file as {LAND_MASK_FILE})")
+    args = parser.parse_args()
+
+    service = BathymetryService()
+    if service.dataset is None or 'tid' not in service.dataset:
+        print(f"❌ GEBCO TID grid not found at {service.gebco_file}")
+        sys.exit(1)
+
+    output = args.output or service.gebco_file.parent / LAND_MASK_FILE
+    print(f"Building {args.cells_per_degree} cells/degree land mask from {service.gebco_file}")
+    mask = build_land_mask(service, args.cells_per_degree)
+    np.save(output, mask)
+    print(f"✓ Wrote {output} ({mask.nbytes / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
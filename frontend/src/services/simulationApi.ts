@@ -301,7 +301,12 @@ export async function getOrbitalTrajectory(
     throw new Error(`Orbital trajectory calculation failed: ${response.statusText}`);
   }
 
-  return response.json();
+  // Points arrive as rows of [x, y, z, ...] (see trajectory_columns)
+  const data = await response.json();
+  return {
+    ...data,
+    trajectory: (data.trajectory as number[][]).map(([x, y, z], index) => ({ x, y, z, index })),
+  };
 }
 
 /**
@@ -11,7 +11,7 @@ import numpy as np
 
 sys.path.insert(0, str(Path(__file__).parent / "backend"))
 
-from app.physics.orbital_mechanics import calculate_impact_scenario, OrbitalMechanics
+from app.physics.orbital_mechanics import calculate_impact_scenario, OrbitalMechanics, earth_intercept_locations
 from app.physics.impact_physics import EnhancedPhysicsEngine
 
 print("=" * 80)
@@ -149,8 +149,39 @@ print(f"  Entry points: {len(apophis_scenario['atmospheric_entry']['trajectory']
 print(f"  Impact location: {apophis_scenario['impact_location']['latitude']:.2f}°, "
       f"{apophis_scenario['impact_location']['longitude']:.2f}°")
 
-# Test 5: Generate data for frontend visualization
-print("\n\n5️⃣  FRONTEND DATA EXPORT")
+# Test 5: Batched Earth intercept (Monte Carlo heatmap) matches the scalar one (/impact)
+print("\n\n5️⃣  EARTH INTERCEPT - Batched vs Scalar")
+print("-" * 80)
+
+rng = np.random.default_rng(42)
+n_samples = 100_000
+sampled_elements = np.column_stack((
+    rng.uniform(0.7, 2.5, n_samples),   # a [AU]
+    rng.uniform(0.05, 0.9, n_samples),  # e
+    rng.uniform(0, 40, n_samples),      # i [deg]
+    rng.uniform(0, 360, n_samples),     # node [deg]
+    rng.uniform(0, 360, n_samples),     # peri [deg]
+    rng.uniform(0, 360, n_samples),     # M [deg]
+))
+batch_lat, batch_lon, batch_valid = earth_intercept_locations(sampled_elements)
+checked = np.concatenate([np.flatnonzero(batch_valid)[:300], np.flatnonzero(~batch_valid)[:50]])
+
+element_keys = ('semi_major_axis_au', 'eccentricity', 'inclination_deg',
+                'longitude_ascending_node_deg', 'argument_periapsis_deg', 'mean_anomaly_deg')
+worst_deg = 0.0
+for k in checked:
+    intercept = om.find_earth_intercept(dict(zip(element_keys, sampled_elements[k].tolist())))
+    assert (intercept is not None) == batch_valid[k], f"sample {k}: intercept validity differs"
+    if intercept is not None:
+        lon_diff = (intercept['longitude'] - batch_lon[k] + 180) % 360 - 180
+        worst_deg = max(worst_deg, abs(intercept['latitude'] - batch_lat[k]), abs(lon_diff))
+
+assert worst_deg < 1e-5, f"batched intercept differs from scalar by {worst_deg:.3g}°"
+print(f"Checked {len(checked)} seeded samples ({int(batch_valid[checked].sum())} with an intercept)")
+print(f"Max lat/lon difference: {worst_deg:.2e}°")
+
+# Test 6: Generate data for frontend visualization
+print("\n\n6️⃣  FRONTEND DATA EXPORT")
 print("-" * 80)
 
 # Prepare data structure for frontend
@@ -230,7 +261,8 @@ print("  })")
 print("})")
 print(".then(res => res.json())")
 print(".then(data => {")
-print("  // data.trajectory = [{x, y, z}...] in AU")
+print("  // data.trajectory = rows of [x, y, z, ...] in AU (see data.trajectory_columns)")
+print("  const points = data.trajectory.map(([x, y, z]) => ({x, y, z}));")
 print("  // Use with Three.js for orbital visualization")
 print("});")
 